@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Benchmark erupt_dlang.py against registry fixtures and fail if a metric regresses beyond its budget.
+
+wall time and peak RSS are compared with a reference run of another revision of the generator, by default HEAD, on the
+same fixtures and the same machine, the runs of both alternate. The module sizes do not depend on the machine and are
+compared with the baseline of each fixture in baseline.json, which also stores its budgets and a fingerprint of the
+vulkan-docs scripts it was recorded with. The scripts change the generated modules, a baseline is only compared when
+the fingerprints match.
+
+fixtures are registry directories placed at benchmarks/fixtures/<name>/Vulkan-Headers/registry. The checked in fixtures
+are NOT snapshots of real registries. They are synthetic stand-ins written by synthetic_registry.py, with roughly the
+extension counts of the 1.1, 1.2 and 1.3 eras, but none of their real types, commands or dependencies:
+
+    synthetic_registry.py benchmarks/fixtures/synthetic-1.1/Vulkan-Headers/registry --features 70  --commands 4 --members 4
+    synthetic_registry.py benchmarks/fixtures/synthetic-1.2/Vulkan-Headers/registry --features 150 --commands 4 --members 4
+    synthetic_registry.py benchmarks/fixtures/synthetic-1.3/Vulkan-Headers/registry --features 250 --commands 4 --members 4
+
+fixtures of real registries are Vulkan-Headers checkouts, e.g. to pin version 1.3.280:
+
+    git clone --depth 1 --branch v1.3.280 https://github.com/KhronosGroup/Vulkan-Headers /tmp/Vulkan-Headers
+    mkdir -p benchmarks/fixtures/1.3.280/Vulkan-Headers
+    cp -r /tmp/Vulkan-Headers/registry benchmarks/fixtures/1.3.280/Vulkan-Headers/
+
+the generator requires video.xml, hence real snapshots older than 1.3.238 are not supported.
+fixtures without the vulkan-docs scripts (reg.py, generator.py, vkconventions.py) get them from the --scripts directory,
+which defaults to benchmarks/fixtures/scripts. Pin the scripts there to benchmark offline with fixed scripts, e.g.:
+
+    mkdir -p benchmarks/fixtures/scripts
+    cp /tmp/Vulkan-Headers/registry/{reg,generator,vkconventions}.py benchmarks/fixtures/scripts/
+
+the budgets of a fixture default to the budget options.
+to record the module sizes: benchmark.py --update
+to check against them and a reference run of the main branch: benchmark.py --reference main
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import tarfile
+import tempfile
+import subprocess
+from os import path
+
+
+benchmarks_dir  = path.dirname( path.realpath( __file__ ))
+generator       = path.join( path.dirname( benchmarks_dir ), 'erupt_dlang.py' )
+fixtures_dir    = path.join( benchmarks_dir, 'fixtures' )
+baseline_file   = path.join( benchmarks_dir, 'baseline.json' )
+scripts_dir     = path.join( fixtures_dir, 'scripts' )
+script_names    = ( 'reg.py', 'generator.py', 'vkconventions.py' )
+
+
+# run the generator once as child process for the vulkan headers or docs directory
+# returns wall time in seconds, peak RSS in bytes and a dict of module file name : bytes, the module manifest is skipped
+def runGenerator( vulkan_dir, args = (), generator_file = generator ):
+    output_dir = tempfile.mkdtemp( prefix = 'erupt_benchmark_' )
+    try:
+        start = time.perf_counter()
+        process = subprocess.Popen( [ sys.executable, generator_file, vulkan_dir, output_dir, *cacheArgs( generator_file ), *args ], stdout = subprocess.DEVNULL )
+
+        # wait4 reports the resource usage of this child only, ru_maxrss is reported in kilobytes on linux
+        _, status, usage = os.wait4( process.pid, 0 )
+        wall_time = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode( status )
+        if process.returncode:
+            raise RuntimeError( 'generator failed with exit code {0} for {1}'.format( process.returncode, vulkan_dir ))
+
+        modules = { file_name : path.getsize( path.join( output_dir, file_name )) for file_name in sorted( os.listdir( output_dir )) if file_name.endswith( '.d' ) }
+        return wall_time, usage.ru_maxrss * 1024, modules
+
+    finally:
+        shutil.rmtree( output_dir, ignore_errors = True )
+
+
+# every run parses the registry, reference revisions older than the registry cache have no --noCache option
+def cacheArgs( generator_file ):
+    with open( generator_file, encoding = 'utf-8' ) as source:
+        return [ '--noCache' ] if "'--noCache'" in source.read() else []
+
+
+# minimum wall time and maximum peak RSS of several runs are the metrics of the fixture
+def metrics( results ):
+    return {
+        'wall_time' : min( wall_time for wall_time, _, _ in results ),
+        'peak_rss'  : max( peak_rss for _, peak_rss, _ in results ),
+        'modules'   : results[ -1 ][ 2 ],
+    }
+
+
+# run the generator several times and return its metrics
+def measure( vulkan_dir, runs, args = (), generator_file = generator ):
+    return metrics( [ runGenerator( vulkan_dir, args, generator_file ) for _ in range( runs ) ] )
+
+
+# run the generator and the reference generator alternately, so that both see the same machine load
+# returns the metrics of the generator and of the reference generator
+def measureWithReference( vulkan_dir, runs, reference_file ):
+    results, reference_results = [], []
+    for _ in range( runs ):
+        reference_results.append( runGenerator( vulkan_dir, (), reference_file ))
+        results.append( runGenerator( vulkan_dir ))
+    return metrics( results ), metrics( reference_results )
+
+
+# extract the generator of a git revision into work_dir, returns the path of its erupt_dlang.py
+def extractRevision( revision, work_dir ):
+    archive = subprocess.run( [ 'git', 'archive', '--format=tar', revision, 'erupt_dlang.py', 'templates' ],
+        cwd = path.dirname( generator ), capture_output = True, check = True )
+    reference_dir = path.join( work_dir, 'reference' )
+    with tarfile.open( fileobj = io.BytesIO( archive.stdout )) as tar:
+        tar.extractall( reference_dir )
+    return path.join( reference_dir, 'erupt_dlang.py' )
+
+
+# fingerprint of the vulkan-docs scripts of a Vulkan-Headers directory, module sizes of different scripts are not comparable
+def scriptsFingerprint( vulkan_dir ):
+    fingerprint = hashlib.sha256()
+    for script_name in script_names:
+        with open( path.join( vulkan_dir, 'registry', script_name ), 'rb' ) as script:
+            fingerprint.update( script.read() )
+    return fingerprint.hexdigest()[ :16 ]
+
+
+# fixture name : Vulkan-Headers directory of all fixtures, fixtures without vulkan-docs scripts are listed as well
+def findFixtures():
+    fixtures = dict()
+    if path.isdir( fixtures_dir ):
+        for name in sorted( os.listdir( fixtures_dir )):
+            vulkan_dir = path.join( fixtures_dir, name, 'Vulkan-Headers' )
+            if path.isfile( path.join( vulkan_dir, 'registry', 'vk.xml' )):
+                fixtures[ name ] = vulkan_dir
+    return fixtures
+
+
+# Vulkan-Headers directory of a fixture with the vulkan-docs scripts, a copy of the fixture registry and the scripts
+# in work_dir if the fixture has none, None if it has none and no scripts directory is passed
+def fixtureWithScripts( name, vulkan_dir, scripts_dir, work_dir ):
+    registry_dir = path.join( vulkan_dir, 'registry' )
+    if path.isfile( path.join( registry_dir, 'reg.py' )):
+        return vulkan_dir
+    if not scripts_dir:
+        return None
+
+    copy_dir = path.join( work_dir, name, 'Vulkan-Headers', 'registry' )
+    shutil.copytree( scripts_dir, copy_dir, ignore = shutil.ignore_patterns( '*.xml', '__pycache__' ))
+    for file_name in os.listdir( registry_dir ):
+        if file_name.endswith( '.xml' ):
+            shutil.copy( path.join( registry_dir, file_name ), copy_dir )
+    return path.dirname( copy_dir )
+
+
+# compare the time and memory metrics of one fixture with its reference run and its module sizes with its baseline
+# returns a list of ( metric, reference or baseline, current, regressed ) rows
+def compare( baseline, reference, current, budgets ):
+    rows = [
+        ( 'wall_time', reference[ 'wall_time' ], current[ 'wall_time' ], budgets[ 'wall_time' ] ),
+        ( 'peak_rss' , reference[ 'peak_rss' ] , current[ 'peak_rss' ] , budgets[ 'peak_rss' ]  ),
+    ]
+    for file_name in sorted( set( baseline[ 'modules' ] ) | set( current[ 'modules' ] )):
+        rows.append( ( file_name, baseline[ 'modules' ].get( file_name, 0 ), current[ 'modules' ].get( file_name, 0 ), budgets[ 'module_bytes' ] ))
+
+    return [ ( metric, old, new, new > old * ( 1 + budget )) for metric, old, new, budget in rows ]
+
+
+def formatMetric( metric, value ):
+    if metric == 'wall_time':   return '{0:.3f} s'.format( value )
+    if metric == 'peak_rss':    return '{0:.1f} MiB'.format( value / ( 1024 * 1024 ))
+    return '{0} B'.format( value )
+
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser( description = 'Benchmark erupt_dlang.py against the registry fixtures in ' + fixtures_dir )
+    parser.add_argument( 'fixtures',        nargs = '*', help = 'Names of the fixtures to benchmark, default all' )
+    parser.add_argument( '--runs',          type = int,   default = 3,    help = 'Generator runs per fixture and revision, the fastest run is compared' )
+    parser.add_argument( '--scripts',       default = scripts_dir,        help = 'Directory with the vulkan-docs scripts reg.py, generator.py and vkconventions.py for fixtures without them' )
+    parser.add_argument( '--reference',     default = 'HEAD',             help = 'Git revision of the generator run as reference for wall time and peak RSS' )
+    parser.add_argument( '--timeBudget',    type = float, default = 0.15, help = 'Allowed relative wall time increase over the reference of fixtures without budgets' )
+    parser.add_argument( '--memoryBudget',  type = float, default = 0.10, help = 'Allowed relative peak RSS increase over the reference of fixtures without budgets' )
+    parser.add_argument( '--sizeBudget',    type = float, default = 0.02, help = 'Allowed relative size increase of each module of fixtures without budgets' )
+    parser.add_argument( '--baseline',      default = baseline_file,      help = 'Baseline module sizes file' )
+    parser.add_argument( '--update',        action = 'store_true',        help = 'Record the module sizes as new baseline instead of comparing' )
+    args = parser.parse_args()
+
+    fixtures = findFixtures()
+    if args.fixtures:
+        missing = [ name for name in args.fixtures if name not in fixtures ]
+        if missing:
+            sys.exit( 'Fixtures not found in {0}: {1}'.format( fixtures_dir, ', '.join( missing )))
+        fixtures = { name : fixtures[ name ] for name in args.fixtures }
+
+    if not fixtures:
+        sys.exit( 'No fixtures found in {0}, see {1} for how to add them'.format( fixtures_dir, path.basename( __file__ )))
+
+    baseline = dict()
+    if path.isfile( args.baseline ):
+        with open( args.baseline, encoding = 'utf-8' ) as baseline_json:
+            baseline = json.load( baseline_json )
+
+    default_budgets = { 'wall_time' : args.timeBudget, 'peak_rss' : args.memoryBudget, 'module_bytes' : args.sizeBudget }
+    regressions = []
+    work_dir = tempfile.mkdtemp( prefix = 'erupt_fixtures_' )
+    try:
+        scripts = args.scripts if path.isdir( args.scripts ) else None
+        fixtures = { name : fixtureWithScripts( name, vulkan_dir, scripts, work_dir ) for name, vulkan_dir in fixtures.items() }
+        missing = [ name for name, vulkan_dir in fixtures.items() if vulkan_dir is None ]
+        if missing:
+            sys.exit( 'Fixtures without vulkan-docs scripts, pin them in {0} or pass their directory with --scripts: {1}'.format( scripts_dir, ', '.join( missing )))
+        fingerprints = { name : scriptsFingerprint( vulkan_dir ) for name, vulkan_dir in fixtures.items() }
+
+        # the module sizes are recorded from one run, time and memory are only compared with the reference run
+        if args.update:
+            measured = { name : ( measure( vulkan_dir, 1 ), None ) for name, vulkan_dir in fixtures.items() }
+        else:
+            try:
+                reference_file = extractRevision( args.reference, work_dir )
+            except subprocess.CalledProcessError as error:
+                sys.exit( 'Could not extract the generator of revision {0}: {1}'.format( args.reference, error.stderr.decode( errors = 'replace' ).strip() ))
+            measured = { name : measureWithReference( vulkan_dir, args.runs, reference_file ) for name, vulkan_dir in fixtures.items() }
+    finally:
+        shutil.rmtree( work_dir, ignore_errors = True )
+
+    for name, ( current, reference ) in measured.items():
+        budgets = dict( default_budgets, **baseline.get( name, dict() ).get( 'budgets', dict() ))
+
+        if args.update:
+            baseline[ name ] = { 'budgets' : budgets, 'modules' : current[ 'modules' ], 'scripts' : fingerprints[ name ] }
+            print( '{0}: {1} modules, {2} B'.format( name, len( current[ 'modules' ] ), sum( current[ 'modules' ].values())))
+            continue
+
+        if name not in baseline:
+            print( '{0}: no baseline, record it with --update'.format( name ))
+            continue
+
+        if baseline[ name ].get( 'scripts' ) != fingerprints[ name ]:
+            print( '{0}: recorded with other vulkan-docs scripts, module sizes are not comparable'.format( name ))
+            regressions.append( '{0} scripts'.format( name ))
+            continue
+
+        print( '\n{0}, time and memory against {1}'.format( name, args.reference ))
+        for metric, old, new, regressed in compare( baseline[ name ], reference, current, budgets ):
+            change = ( new / old - 1 ) * 100 if old else 0.0
+            print( '  {0:<24}{1:>14}{2:>14}{3:>+9.1f}%{4}'.format( metric, formatMetric( metric, old ), formatMetric( metric, new ), change, '  REGRESSION' if regressed else '' ))
+            if regressed:
+                regressions.append( '{0} {1}'.format( name, metric ))
+
+    if args.update:
+        with open( args.baseline, 'w', encoding = 'utf-8' ) as baseline_json:
+            json.dump( baseline, baseline_json, indent = 4, sort_keys = True )
+            baseline_json.write( '\n' )
+
+    elif regressions:
+        sys.exit( '\n{0} metrics regressed beyond budget: {1}'.format( len( regressions ), ', '.join( regressions )))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark the generated loader functions and the dispatch overhead of the bindings against the generated mock icd.
+
+the bindings are generated with --mockIcd into a temporary directory, mock_icd.d is built as shared library and
+loader_benchmark.d, which loads the mock icd through vulkan_lib_loader, is built against the bindings and run.
+it reports the resolution time and proc address calls of each loader as well as the time per call of global
+function pointers, DispatchDevice members and DispatchDevice convenience functions, no vulkan device is required.
+
+to benchmark the bindings of a Vulkan-Headers or Vulkan-Docs checkout run: loader_benchmark.py path/to/Vulkan-Headers
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+from os import path
+
+
+benchmarks_dir  = path.dirname( path.realpath( __file__ ))
+generator       = path.join( path.dirname( benchmarks_dir ), 'erupt_dlang.py' )
+benchmark_src   = path.join( benchmarks_dir, 'loader_benchmark.d' )
+
+
+# shared library file name of the platform
+def sharedLibName( name ):
+    if sys.platform == 'win32':     return name + '.dll'
+    if sys.platform == 'darwin':    return 'lib' + name + '.dylib'
+    return 'lib' + name + '.so'
+
+
+# optimization and shared library flags of ldc2 and dmd
+def compilerFlags( compiler ):
+    ldc = 'ldc' in path.basename( compiler )
+    optimize = [ '-O3', '-release' ] if ldc else [ '-O', '-release', '-inline' ]
+    shared = [ '-shared' ] if ldc or sys.platform == 'win32' else [ '-shared', '-fPIC' ]
+    link = [ '-L-ldl' ] if sys.platform.startswith( 'linux' ) else []
+    return optimize, shared, link
+
+
+def run( command ):
+    print( ' '.join( command ))
+    subprocess.run( command, check = True )
+
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser( description = 'Benchmark the generated loaders and dispatch overhead against the generated mock icd' )
+    parser.add_argument( 'vulkan',          help = 'Vulkan-Headers or Vulkan-Docs directory to generate the bindings from' )
+    parser.add_argument( '--compiler',      default = shutil.which( 'ldc2' ) or shutil.which( 'dmd' ), help = 'D compiler, default ldc2 or dmd' )
+    parser.add_argument( '--runs',          type = int, default = 100,        help = 'Runs of each loader, the fastest run is reported' )
+    parser.add_argument( '--iterations',    type = int, default = 10000000,   help = 'Calls of each dispatch variant' )
+    parser.add_argument( '--keep',          action = 'store_true',            help = 'Keep and print the work directory with bindings, mock icd and benchmark' )
+    args = parser.parse_args()
+
+    if not args.compiler:
+        sys.exit( 'No D compiler found, pass one with --compiler' )
+
+    work_dir = tempfile.mkdtemp( prefix = 'erupt_loader_benchmark_' )
+    try:
+        # the package directory must be named as the package prefix to be importable
+        package_dir = path.join( work_dir, 'erupted' )
+        subprocess.run( [ sys.executable, generator, args.vulkan, package_dir, '--noCache', '--mockIcd' ], check = True, stdout = subprocess.DEVNULL )
+
+        optimize, shared, link = compilerFlags( args.compiler )
+        mock_lib = path.join( work_dir, sharedLibName( 'mock_icd' ))
+        run( [ args.compiler, *optimize, *shared, '-betterC', '-I' + work_dir, path.join( package_dir, 'mock_icd.d' ), '-of=' + mock_lib ] )
+
+        # the benchmark only imports the mock icd for its counter function type, the mock icd is loaded at run time
+        bindings = [ path.join( package_dir, file_name ) for file_name in sorted( os.listdir( package_dir )) if file_name.endswith( '.d' ) and file_name != 'mock_icd.d' ]
+        benchmark = path.join( work_dir, 'loader_benchmark' + ( '.exe' if sys.platform == 'win32' else '' ))
+        run( [ args.compiler, *optimize, *link, '-I' + work_dir, *bindings, benchmark_src, '-of=' + benchmark ] )
+
+        print()
+        subprocess.run( [ benchmark, mock_lib, str( args.runs ), str( args.iterations ) ], check = True )
+
+    finally:
+        if args.keep:
+            print( '\nwork directory: {0}'.format( work_dir ))
+        else:
+            shutil.rmtree( work_dir, ignore_errors = True )
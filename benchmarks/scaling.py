@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Measure how erupt_dlang.py scales with the registry size, using synthetic registries of growing feature count.
+
+the generator time and peak memory are fitted against the feature count on a log-log scale, a slope of 1 is linear,
+a slope of 2 quadratic growth. The run fails if the time slope exceeds --maxSlope.
+the vulkan-docs scripts (reg.py, generator.py, vkconventions.py) are copied from the passed directory,
+e.g. the registry directory of Vulkan-Headers or the scripts directory of Vulkan-Docs.
+
+to measure 100 to 1600 extensions run: scaling.py path/to/Vulkan-Headers/registry --features 100 200 400 800 1600
+"""
+
+import sys
+import math
+import shutil
+import tempfile
+from os import path
+
+from benchmark import measure
+from synthetic_registry import writeRegistry
+
+
+# least squares slope of log( y ) over log( x )
+def logLogSlope( xs, ys ):
+    log_xs = [ math.log( x ) for x in xs ]
+    log_ys = [ math.log( y ) for y in ys ]
+    mean_x = sum( log_xs ) / len( log_xs )
+    mean_y = sum( log_ys ) / len( log_ys )
+    variance = sum(( x - mean_x ) ** 2 for x in log_xs )
+    return sum(( x - mean_x ) * ( y - mean_y ) for x, y in zip( log_xs, log_ys )) / variance if variance else 0.0
+
+
+# bar chart of the values, one line per feature count, scaled to the largest value
+def printChart( title, features, values, unit, width = 50 ):
+    print( '\n{0}'.format( title ))
+    for count, value in zip( features, values ):
+        print( '  {0:>6}  {1:>10.3f} {2}  {3}'.format( count, value, unit, '#' * max( 1, round( width * value / max( values )))))
+
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser( description = 'Measure erupt_dlang.py time and memory scaling with synthetic registries' )
+    parser.add_argument( 'scripts',     help = 'Directory with the vulkan-docs scripts reg.py, generator.py and vkconventions.py' )
+    parser.add_argument( '--features',  type = int, nargs = '+', default = [ 100, 200, 400, 800 ], help = 'Extension counts of the synthetic registries' )
+    parser.add_argument( '--commands',  type = int, default = 8,    help = 'Commands per extension' )
+    parser.add_argument( '--members',   type = int, default = 8,    help = 'Additional struct members per extension' )
+    parser.add_argument( '--bits',      type = int, default = 16,   help = 'Values per bitmask group' )
+    parser.add_argument( '--values',    type = int, default = 8,    help = 'Values per enum group' )
+    parser.add_argument( '--runs',      type = int, default = 1,    help = 'Generator runs per registry, the fastest run is used' )
+    parser.add_argument( '--maxSlope',  type = float, default = 1.3, help = 'Maximum allowed log-log slope of time over feature count' )
+    parser.add_argument( '--csv',       help = 'Write features, seconds and peak RSS bytes to this csv file' )
+    args = parser.parse_args()
+
+    if len( args.features ) < 2:
+        sys.exit( 'At least two feature counts are required to fit a slope' )
+
+    features = sorted( args.features )
+    wall_times, peak_rss = [], []
+    work_dir = tempfile.mkdtemp( prefix = 'erupt_scaling_' )
+    try:
+        # the generator expects a Vulkan-Headers layout, xml files and scripts in its registry directory
+        registry_dir = path.join( work_dir, 'Vulkan-Headers', 'registry' )
+        shutil.copytree( args.scripts, registry_dir, ignore = shutil.ignore_patterns( '*.xml', '__pycache__' ))
+
+        for count in features:
+            writeRegistry( registry_dir, count, args.commands, args.members, args.bits, args.values )
+            metrics = measure( path.dirname( registry_dir ), args.runs )
+            wall_times.append( metrics[ 'wall_time' ] )
+            peak_rss.append( metrics[ 'peak_rss' ] )
+            print( '{0:>6} features: {1:.3f} s, {2:.1f} MiB'.format( count, metrics[ 'wall_time' ], metrics[ 'peak_rss' ] / ( 1024 * 1024 )))
+
+    finally:
+        shutil.rmtree( work_dir, ignore_errors = True )
+
+    printChart( 'wall time', features, wall_times, 's  ' )
+    printChart( 'peak RSS', features, [ rss / ( 1024 * 1024 ) for rss in peak_rss ], 'MiB' )
+
+    time_slope = logLogSlope( features, wall_times )
+    print( '\nlog-log slope, time: {0:.2f}, memory: {1:.2f}'.format( time_slope, logLogSlope( features, peak_rss )))
+
+    if args.csv:
+        with open( args.csv, 'w', encoding = 'utf-8' ) as csv:
+            csv.write( 'features,seconds,peak_rss_bytes\n' )
+            for count, wall_time, rss in zip( features, wall_times, peak_rss ):
+                csv.write( '{0},{1:.6f},{2}\n'.format( count, wall_time, rss ))
+
+    if time_slope > args.maxSlope:
+        sys.exit( 'Generator time grows faster than linear, slope {0:.2f} exceeds {1:.2f}'.format( time_slope, args.maxSlope ))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Check the feature and extension selection of erupt_dlang.py against a synthetic registry with the core versions 1.0 to 1.3.
+
+the registry has 8 extensions, extension n depends on version 1.( n % 4 ), see synthetic_registry.py. The generator is run
+with selection options and its selection report or argument error is compared with the expected one.
+the vulkan-docs scripts (reg.py, generator.py, vkconventions.py) are copied from the passed directory,
+e.g. the registry directory of Vulkan-Headers or the scripts directory of Vulkan-Docs.
+
+to run the checks: selection_check.py path/to/Vulkan-Headers/registry
+"""
+
+import sys
+import shutil
+import tempfile
+import subprocess
+from os import path
+
+from benchmark import generator
+from synthetic_registry import writeRegistry
+
+
+# selection options : expected start of the generator output, or of its last error line for an argument error
+CHECKS = [
+    ( [ '-feature', 'VK_VERSION_1_0' ], 'Selected 1 of 4 features and 2 of 8 extensions' ),
+    ( [ '-feature', 'VK_VERSION_1_2' ], 'Selected 3 of 4 features and 6 of 8 extensions' ),
+    ( [ '-feature', 'VK_VERSION_1_0', '-extension', 'VK_EXT_synthetic_3' ], 'Selected 4 of 4 features and 1 of 8 extensions' ),
+    ( [ '-feature', 'VK_VERSION_1_4' ], 'erupt_dlang.py: error: unknown or unsupported features or extensions: VK_VERSION_1_4' ),
+    ( [ '-extension', 'VK_EXT_unknown', '--jobs', '2' ], 'erupt_dlang.py: error: unknown or unsupported features or extensions: VK_EXT_unknown' ),
+]
+
+
+# run the generator with the selection options, returns exit code and the first output or the last error line
+def runSelection( vulkan_dir, output_dir, options ):
+    process = subprocess.run( [ sys.executable, generator, vulkan_dir, output_dir, '--noCache', *options ], capture_output = True, text = True )
+    lines = ( process.stdout if process.returncode == 0 else process.stderr ).strip().splitlines()
+    return process.returncode, ( lines[ 0 ] if process.returncode == 0 else lines[ -1 ] ) if lines else ''
+
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser( description = 'Check the feature and extension selection of erupt_dlang.py' )
+    parser.add_argument( 'scripts', help = 'Directory with the vulkan-docs scripts reg.py, generator.py and vkconventions.py' )
+    args = parser.parse_args()
+
+    failures = []
+    work_dir = tempfile.mkdtemp( prefix = 'erupt_selection_' )
+    try:
+        # the generator expects a Vulkan-Headers layout, xml files and scripts in its registry directory
+        registry_dir = path.join( work_dir, 'Vulkan-Headers', 'registry' )
+        shutil.copytree( args.scripts, registry_dir, ignore = shutil.ignore_patterns( '*.xml', '__pycache__' ))
+        writeRegistry( registry_dir, 8, commands = 2, members = 1, versions = 4 )
+
+        for options, expected in CHECKS:
+            returncode, line = runSelection( path.dirname( registry_dir ), path.join( work_dir, 'output' ), options )
+            failed = not line.startswith( expected ) or ( returncode != 0 ) != expected.startswith( 'erupt_dlang.py: error:' )
+            print( '{0:<6}{1}\n      {2}'.format( 'FAIL' if failed else 'ok', ' '.join( options ), line ))
+            if failed:
+                failures.append( ' '.join( options ))
+
+    finally:
+        shutil.rmtree( work_dir, ignore_errors = True )
+
+    if failures:
+        sys.exit( '\n{0} selection checks failed: {1}'.format( len( failures ), ', '.join( failures )))
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Write synthetic vk.xml and video.xml registries of configurable size, used to measure how erupt_dlang.py scales.
+
+the registry consists of a VK_VERSION_1_0 feature with the base types, handles and enums the generator relies on,
+followed by extensions, each with its own commands of all dispatch levels, a create info struct, an enum and a bitmask group.
+every 4th extension is protected by a platform, these are written to platform_extensions.d
+with more than one version the core versions 1.1 and up are added as features, extension n then depends on version n % versions
+
+to write a registry with 200 extensions run: synthetic_registry.py path/to/registry --features 200
+"""
+
+import os
+from os import path
+
+
+# vk.xml with the base types, handles and commands required by all features
+VK_XML_HEADER = '''\
+<?xml version="1.0" encoding="UTF-8"?>
+<registry>
+    <comment>synthetic registry with {FEATURES} extensions, written by benchmarks/synthetic_registry.py</comment>
+    <platforms>
+{PLATFORMS}
+    </platforms>
+    <tags>
+        <tag name="EXT" author="Synthetic" contact="none"/>
+    </tags>
+    <types>
+        <type name="vk_platform" category="include">#include "vk_platform.h"</type>
+        <type requires="vk_platform" name="void"/>
+        <type requires="vk_platform" name="char"/>
+        <type requires="vk_platform" name="float"/>
+        <type requires="vk_platform" name="uint32_t"/>
+        <type requires="vk_platform" name="uint64_t"/>
+        <type requires="vk_platform" name="int32_t"/>
+        <type requires="vk_platform" name="size_t"/>
+        <type category="define">#define <name>VK_MAKE_API_VERSION</name>(variant, major, minor, patch) \\
+    ((((uint32_t)(variant)) &lt;&lt; 29U) | (((uint32_t)(major)) &lt;&lt; 22U) | (((uint32_t)(minor)) &lt;&lt; 12U) | ((uint32_t)(patch)))</type>
+        <type category="define">// Vulkan 1.0 version number
+#define <name>VK_API_VERSION_1_0</name> <type>VK_MAKE_API_VERSION</type>(0, 1, 0, 0)// Patch version should always be set to 0</type>
+        <type category="define">// Version of this file
+#define <name>VK_HEADER_VERSION</name> 1</type>
+        <type category="define" requires="VK_HEADER_VERSION">// Complete version of this file
+#define <name>VK_HEADER_VERSION_COMPLETE</name> <type>VK_MAKE_API_VERSION</type>(0, 1, 0, VK_HEADER_VERSION)</type>
+        <type category="define">
+#define <name>VK_DEFINE_HANDLE</name>(object) typedef struct object##_T* object;</type>
+        <type category="basetype">typedef <type>uint32_t</type> <name>VkBool32</name>;</type>
+        <type category="basetype">typedef <type>uint32_t</type> <name>VkFlags</name>;</type>
+        <type category="basetype">typedef <type>uint64_t</type> <name>VkFlags64</name>;</type>
+        <type category="handle"><type>VK_DEFINE_HANDLE</type>(<name>VkInstance</name>)</type>
+        <type category="handle" parent="VkInstance"><type>VK_DEFINE_HANDLE</type>(<name>VkPhysicalDevice</name>)</type>
+        <type category="handle" parent="VkPhysicalDevice"><type>VK_DEFINE_HANDLE</type>(<name>VkDevice</name>)</type>
+        <type category="handle" parent="VkDevice"><type>VK_DEFINE_HANDLE</type>(<name>VkQueue</name>)</type>
+        <type category="handle" parent="VkDevice"><type>VK_DEFINE_HANDLE</type>(<name>VkCommandBuffer</name>)</type>
+        <type name="VkResult" category="enum"/>
+        <type name="VkStructureType" category="enum"/>
+        <type category="funcpointer">typedef void* (VKAPI_PTR *<name>PFN_vkAllocationFunction</name>)(
+    <type>void</type>*                                       pUserData,
+    <type>size_t</type>                                      size,
+    <type>size_t</type>                                      alignment);</type>
+        <type category="funcpointer">typedef void (VKAPI_PTR *<name>PFN_vkFreeFunction</name>)(
+    <type>void</type>*                                       pUserData,
+    <type>void</type>*                                       pMemory);</type>
+        <type category="struct" name="VkAllocationCallbacks">
+            <member optional="true"><type>void</type>*     <name>pUserData</name></member>
+            <member><type>PFN_vkAllocationFunction</type>   <name>pfnAllocation</name></member>
+            <member><type>PFN_vkFreeFunction</type>         <name>pfnFree</name></member>
+        </type>
+{TYPES}
+    </types>
+    <enums name="VkResult" type="enum">
+        <enum value="0"     name="VK_SUCCESS"/>
+        <enum value="-1"    name="VK_ERROR_OUT_OF_HOST_MEMORY"/>
+    </enums>
+    <enums name="VkStructureType" type="enum">
+        <enum value="0"     name="VK_STRUCTURE_TYPE_APPLICATION_INFO"/>
+    </enums>
+{ENUMS}
+    <commands>
+        <command>
+            <proto><type>PFN_vkVoidFunction</type> <name>vkGetInstanceProcAddr</name></proto>
+            <param optional="true"><type>VkInstance</type> <name>instance</name></param>
+            <param len="null-terminated">const <type>char</type>* <name>pName</name></param>
+        </command>
+        <command>
+            <proto><type>PFN_vkVoidFunction</type> <name>vkGetDeviceProcAddr</name></proto>
+            <param><type>VkDevice</type> <name>device</name></param>
+            <param len="null-terminated">const <type>char</type>* <name>pName</name></param>
+        </command>
+{COMMANDS}
+    </commands>
+    <feature api="vulkan" name="VK_VERSION_1_0" number="1.0">
+        <require>
+            <type name="vk_platform"/>
+            <type name="VK_API_VERSION_1_0"/>
+            <type name="VK_HEADER_VERSION"/>
+            <type name="VK_HEADER_VERSION_COMPLETE"/>
+            <type name="VkBool32"/>
+            <type name="VkResult"/>
+            <type name="VkStructureType"/>
+            <type name="VkAllocationCallbacks"/>
+            <type name="VkInstance"/>
+            <type name="VkPhysicalDevice"/>
+            <type name="VkDevice"/>
+            <type name="VkQueue"/>
+            <type name="VkCommandBuffer"/>
+            <command name="vkGetInstanceProcAddr"/>
+            <command name="vkGetDeviceProcAddr"/>
+        </require>
+    </feature>{VERSION_FEATURES}
+    <extensions>
+{EXTENSIONS}
+    </extensions>
+</registry>
+'''
+
+# core version features after 1.0, these only require their version number
+VERSION_FEATURE = '''
+    <feature api="vulkan" name="VK_VERSION_1_{V}" number="1.{V}">
+        <require>
+            <type name="VK_API_VERSION_1_{V}"/>
+        </require>
+    </feature>'''
+
+VERSION_DEFINE = '''\
+        <type category="define">// Vulkan 1.{V} version number
+#define <name>VK_API_VERSION_1_{V}</name> <type>VK_MAKE_API_VERSION</type>(0, 1, {V}, 0)// Patch version should always be set to 0</type>'''
+
+# PFN_vkVoidFunction is used by the proc addr commands
+VOID_FUNCTION = '''\
+        <type category="funcpointer">typedef void (VKAPI_PTR *<name>PFN_vkVoidFunction</name>)(void);</type>'''
+
+EXTENSION_TYPES = '''\
+        <type category="bitmask" name="VkSynthetic{N}FlagsEXT" {BITMASK_ATTR}="VkSynthetic{N}FlagBitsEXT">typedef <type>{FLAGS}</type> <name>VkSynthetic{N}FlagsEXT</name>;</type>
+        <type name="VkSynthetic{N}FlagBitsEXT" category="enum"/>
+        <type name="VkSynthetic{N}ModeEXT" category="enum"/>
+        <type category="struct" name="VkSynthetic{N}CreateInfoEXT">
+            <member values="VK_STRUCTURE_TYPE_SYNTHETIC_{N}_CREATE_INFO_EXT"><type>VkStructureType</type> <name>sType</name></member>
+            <member optional="true">const <type>void</type>*                      <name>pNext</name></member>
+            <member optional="true"><type>VkSynthetic{N}FlagsEXT</type>        <name>flags</name></member>
+            <member><type>VkSynthetic{N}ModeEXT</type>          <name>mode</name></member>
+{MEMBERS}
+        </type>'''
+
+EXTENSION_COMMAND = '''\
+        <command>
+            <proto><type>{RETURN_TYPE}</type> <name>vkSynthetic{N}Command{M}EXT</name></proto>
+            <param><type>{HANDLE}</type> <name>{HANDLE_NAME}</name></param>
+            <param>const <type>VkSynthetic{N}CreateInfoEXT</type>* <name>pCreateInfo</name></param>
+            <param optional="true">const <type>VkAllocationCallbacks</type>* <name>pAllocator</name></param>
+            <param><type>uint32_t</type> <name>count</name></param>
+            <param len="count"><type>uint64_t</type>* <name>pValues</name></param>
+        </command>'''
+
+EXTENSION = '''\
+        <extension name="VK_EXT_synthetic_{N}" number="{N}" type="device" author="EXT" contact="none" supported="vulkan"{DEPENDS}{PLATFORM}>
+            <require>
+                <enum value="1"                                         name="VK_EXT_SYNTHETIC_{N}_SPEC_VERSION"/>
+                <enum value="&quot;VK_EXT_synthetic_{N}&quot;"          name="VK_EXT_SYNTHETIC_{N}_EXTENSION_NAME"/>
+                <enum offset="0" extends="VkStructureType"              name="VK_STRUCTURE_TYPE_SYNTHETIC_{N}_CREATE_INFO_EXT"/>
+                <enum offset="0" extends="VkResult" dir="-"             name="VK_ERROR_SYNTHETIC_{N}_EXT"/>
+                <type name="VkSynthetic{N}CreateInfoEXT"/>
+{COMMANDS}
+            </require>
+        </extension>'''
+
+# first parameter of the commands of an extension, cycling through all dispatch levels
+HANDLES = [
+    ( 'VkDevice'        , 'device' ),
+    ( 'VkCommandBuffer' , 'commandBuffer' ),
+    ( 'VkQueue'         , 'queue' ),
+    ( 'VkPhysicalDevice', 'physicalDevice' ),
+    ( 'VkInstance'      , 'instance' ),
+]
+
+# video.xml is required by the generator, its size is fixed
+VIDEO_XML = '''\
+<?xml version="1.0" encoding="UTF-8"?>
+<registry>
+    <comment>synthetic video registry, written by benchmarks/synthetic_registry.py</comment>
+    <types>
+        <type name="vk_platform" category="include">#include "vk_platform.h"</type>
+        <type requires="vk_platform" name="uint8_t"/>
+        <type requires="vk_platform" name="uint32_t"/>
+        <type name="StdVideoSyntheticFormat" category="enum"/>
+        <type category="struct" name="StdVideoSyntheticFlags">
+            <member><type>uint32_t</type> <name>first_flag</name> : 1</member>
+            <member><type>uint32_t</type> <name>second_flag</name> : 1</member>
+        </type>
+        <type category="struct" name="StdVideoSyntheticInfo">
+            <member><type>uint8_t</type> <name>mask</name></member>
+            <member><type>StdVideoSyntheticFormat</type> <name>format</name></member>
+            <member><type>StdVideoSyntheticFlags</type> <name>flags</name></member>
+        </type>
+    </types>
+    <enums name="StdVideoSyntheticFormat" type="enum">
+        <enum name="STD_VIDEO_SYNTHETIC_FORMAT_FIRST" value="0"/>
+        <enum name="STD_VIDEO_SYNTHETIC_FORMAT_INVALID" value="0x7FFFFFFF"/>
+    </enums>
+    <extensions>
+        <extension name="vulkan_video_codec_synthetic" supported="vulkan">
+            <require>
+                <type name="vk_platform"/>
+                <type name="StdVideoSyntheticInfo"/>
+            </require>
+        </extension>
+    </extensions>
+</registry>
+'''
+
+
+# vk.xml content with features extensions, each with commands commands, members additional struct members,
+# bits bitmask values (64 bit flags above 31 bits), enum values values and versions core versions
+def syntheticVkXml( features, commands, members, bits, values, versions = 1 ):
+    flags = 'VkFlags64' if bits > 31 else 'VkFlags'
+    platforms, types, enums, command_elems, extensions = [], [ VOID_FUNCTION ], [], [], []
+    types += [ VERSION_DEFINE.format( V = v ) for v in range( 1, versions ) ]
+
+    for n in range( 1, features + 1 ):
+        types.append( EXTENSION_TYPES.format(
+            N               = n,
+            FLAGS           = flags,
+            BITMASK_ATTR    = 'bitvalues' if bits > 31 else 'requires',
+            MEMBERS         = '\n'.join( '            <member><type>uint32_t</type> <name>member{0}</name></member>'.format( k ) for k in range( members )),
+        ))
+
+        enums.append( '    <enums name="VkSynthetic{0}FlagBitsEXT" type="bitmask"{1}>\n{2}\n    </enums>'.format( n, ' bitwidth="64"' if bits > 31 else '',
+            '\n'.join( '        <enum bitpos="{0}" name="VK_SYNTHETIC_{1}_BIT_{0}_EXT"/>'.format( b, n ) for b in range( min( bits, 64 )))))
+        enums.append( '    <enums name="VkSynthetic{0}ModeEXT" type="enum">\n{1}\n    </enums>'.format( n,
+            '\n'.join( '        <enum value="{0}" name="VK_SYNTHETIC_{1}_MODE_{0}_EXT"/>'.format( v, n ) for v in range( values ))))
+
+        extension_commands = []
+        for m in range( commands ):
+            handle, handle_name = HANDLES[ m % len( HANDLES ) ]
+            command_elems.append( EXTENSION_COMMAND.format( N = n, M = m, HANDLE = handle, HANDLE_NAME = handle_name, RETURN_TYPE = 'VkResult' if m % 2 else 'void' ))
+            extension_commands.append( '                <command name="vkSynthetic{0}Command{1}EXT"/>'.format( n, m ))
+
+        platform = ''
+        if n % 4 == 0:
+            platforms.append( '        <platform name="synthetic{0}" protect="VK_USE_PLATFORM_SYNTHETIC_{0}_EXT"/>'.format( n ))
+            platform = ' platform="synthetic{0}"'.format( n )
+
+        depends = ' depends="VK_VERSION_1_{0}"'.format( n % versions ) if n % versions else ''
+        extensions.append( EXTENSION.format( N = n, DEPENDS = depends, PLATFORM = platform, COMMANDS = '\n'.join( extension_commands )))
+
+    return VK_XML_HEADER.format(
+        FEATURES    = features,
+        PLATFORMS   = '\n'.join( platforms ),
+        TYPES       = '\n'.join( types ),
+        ENUMS       = '\n'.join( enums ),
+        COMMANDS    = '\n'.join( command_elems ),
+        EXTENSIONS  = '\n'.join( extensions ),
+        VERSION_FEATURES = ''.join( VERSION_FEATURE.format( V = v ) for v in range( 1, versions )),
+    )
+
+
+# write vk.xml and video.xml into directory
+def writeRegistry( directory, features, commands = 8, members = 8, bits = 16, values = 8, versions = 1 ):
+    os.makedirs( directory, exist_ok = True )
+    with open( path.join( directory, 'vk.xml' ), 'w', encoding = 'utf-8' ) as vk_xml:
+        vk_xml.write( syntheticVkXml( features, commands, members, bits, values, versions ))
+    with open( path.join( directory, 'video.xml' ), 'w', encoding = 'utf-8' ) as video_xml:
+        video_xml.write( VIDEO_XML )
+
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser( description = 'Write synthetic vk.xml and video.xml registries' )
+    parser.add_argument( 'directory' )
+    parser.add_argument( '--features',  type = int, default = 100, help = 'Number of extensions' )
+    parser.add_argument( '--commands',  type = int, default = 8,   help = 'Commands per extension' )
+    parser.add_argument( '--members',   type = int, default = 8,   help = 'Additional struct members per extension create info' )
+    parser.add_argument( '--bits',      type = int, default = 16,  help = 'Values per bitmask group, more than 31 create 64 bit flags' )
+    parser.add_argument( '--values',    type = int, default = 8,   help = 'Values per enum group' )
+    parser.add_argument( '--versions',  type = int, default = 1,   help = 'Core versions 1.0 up to 1.( versions - 1 ), extensions depend on them in turn' )
+    args = parser.parse_args()
+
+    writeRegistry( args.directory, args.features, args.commands, args.members, args.bits, args.values, args.versions )
@@ -8,17 +8,39 @@ to generate bindings run: vkdgen.py path/to/vulcan-docs outputDir
 import sys
 import re
 import os
+import json
+import pickle
+import time
+import pstats
+import cProfile
+import hashlib
+import tempfile
 from os import path
-from copy import deepcopy
+from copy import copy, deepcopy
 from textwrap import dedent
 from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource     # peak memory of --time, not available on windows
+except ImportError:
+    resource = None
 
 from templates.dlang.types import *
 from templates.dlang.package import *
 from templates.dlang.vk_video import *
+from templates.dlang.split_modules import *
 from templates.dlang.functions import *
 from templates.dlang.dispatch_device import *
+from templates.dlang.dispatch_instance import *
 from templates.dlang.vulkan_lib_loader import *
+from templates.dlang.trace import *
+from templates.dlang.mock_icd import *
+from templates.dlang.enum_strings import *
+from templates.dlang.formats import *
+from templates.dlang.struct_chain import *
+from templates.dlang.enumerate import *
+from templates.dlang.deep_copy import *
 from templates.dlang.platform_extensions import *
 
 
@@ -126,28 +148,202 @@ def getFullType( elem, self = None ):
 
 
 
+# intermediate representation of registry commands, structs and enum groups
+# built once per registry in DGenerator.beginFile with all derived strings precomputed, consumed by the gen... methods
+
+# parameter and member names which are D keywords, mapped to their replacement
+D_KEYWORD_NAMES = { 'module' : 'Module', 'scope' : 'Scope', 'version' : 'Version', 'function' : 'Function' }
+
+# handle types which dispatch instance and device level functions, global functions have none of them as first param
+DISPATCH_HANDLES = ( 'VkInstance', 'VkPhysicalDevice', 'VkDevice', 'VkQueue', 'VkCommandBuffer' )
+
+
+# command parameter
+class Param:
+    __slots__ = ( 'type', 'name', 'keyword', 'len', 'optional' )
+
+    def __init__( self, elem ):
+        name            = elem.find( 'name' ).text
+        self.type       = getFullType( elem ).strip()           # D type, e.g. const( VkAllocationCallbacks )*
+        self.name       = D_KEYWORD_NAMES.get( name, name )     # keyword safe name
+        self.keyword    = name in D_KEYWORD_NAMES               # original name is a D keyword
+        self.len        = elem.get( 'len' )
+        self.optional   = elem.get( 'optional' )
+
+
+# struct or union member, bitfield members have a type of form uint32_t:24
+class Member( Param ):
+    __slots__ = ( 'values', 'bitfield', 'altlen' )
+
+    def __init__( self, elem ):
+        super().__init__( elem )
+        self.values     = elem.get( 'values' )                  # default value, e.g. the sType of a struct
+        self.altlen     = elem.get( 'altlen' )                  # C expression of a latexmath len, e.g. codeSize / 4
+        type_bitcount   = self.type.split( ':' )
+        self.bitfield   = tuple( type_bitcount ) if len( type_bitcount ) == 2 else None   # ( type, bitcount )
+
+
+class Command:
+    __slots__ = ( 'name', 'alias', 'return_type', 'params', 'dispatch_type', 'level', 'joined_params', 'conven_params', 'conven_args', 'enumerate_type' )
+
+    def __init__( self, elem ):
+        self.name           = elem.find( 'proto/name' ).text
+        self.alias          = elem.get( 'alias' )
+        self.return_type    = getFullType( elem.find( 'proto' )).strip()
+        self.params         = [ Param( param ) for param in elem.findall( 'param' ) ]
+        self.dispatch_type  = self.params[ 0 ].type
+
+        # vkGetInstanceProcAddr must be loaded from implementation lib and has no level
+        # vkGetDeviceProcAddr is an exception as it is an instance level function with dispatch_type == 'VkDevice'
+        if self.name == 'vkGetInstanceProcAddr':                self.level = None
+        elif self.dispatch_type not in DISPATCH_HANDLES:        self.level = 'global'
+        elif self.dispatch_type in ( 'VkPhysicalDevice', 'VkInstance' ) or self.name == 'vkGetDeviceProcAddr':
+                                                                self.level = 'instance'
+        else:                                                   self.level = 'device'
+
+        # a parameter consist of a type and a name, here we merge all parameters into a list
+        self.joined_params  = ', '.join( param.type + ' ' + param.name for param in self.params )
+
+        # for convenience functions we remove the first parameter (VkDevice or VkCommandBuffer)
+        # additionally we remove the const( VkAllocationCallbacks )* pAllocator parameter
+        # arguments are just the parameter names without their types, they will be used with the vk... member functions
+        # VkDevice and VkAllocationCallbacks are both supplied by the DispatchDevice
+        self.conven_params  = ', '.join( param.type + ' ' + param.name
+            for param in self.params[ 1: ] if not param.type.startswith( 'const( VkAllocationCallbacks )*' ))
+        self.conven_args    = ''.join( ', ' + param.name for param in self.params[ 1: ] )
+
+        # two call functions end with a uint32_t* count and an output array of that count, e.g. vkEnumeratePhysicalDevices
+        # the element type of the array is used for the enumerate helpers, None for other functions
+        self.enumerate_type = None
+        if len( self.params ) > 2:
+            count, array = self.params[ -2: ]
+            if count.type == 'uint32_t*' and array.len == count.name and array.type.endswith( '*' ) and not array.type.startswith( 'const' ) \
+                and array.type != 'void*' and all( param.len != count.name for param in self.params[ :-1 ] ) and self.return_type in ( 'VkResult', 'void' ):
+                self.enumerate_type = array.type[ :-1 ].strip()
+
+
+# struct or union
+class Struct:
+    __slots__ = ( 'name', 'category', 'members', 'keywords', 'extends', 'returned_only' )
+
+    def __init__( self, elem ):
+        self.name           = elem.get( 'name' )
+        self.category       = elem.get( 'category' )
+        self.members        = [ Member( member ) for member in elem.findall( 'member' ) ]
+        self.keywords       = { member.name for member in self.members if member.keyword }  # replaced keyword member names
+        self.extends        = elem.get( 'structextends', '' ).split( ',' ) if elem.get( 'structextends' ) else []
+        self.returned_only  = elem.get( 'returnedonly' ) == 'true'
+
+
+# enum or bitmask group, value conversion, duplicate and requirement checks are delegated to the generator
+class EnumGroup:
+    __slots__ = ( 'name', 'is_bitmask', 'bitwidth', 'name_prefix', 'name_suffix', 'enums' )
+
+    def __init__( self, gen, elem ):
+        self.name       = elem.get( 'name' )
+        self.is_bitmask = elem.get( 'type' ) == 'bitmask'
+        self.bitwidth   = elem.get( 'bitwidth' )
+
+        snake_name = re.sub( r'([0-9a-z_])([A-Z0-9][^A-Z0-9]?)', r'\1_\2', self.name ).upper()
+        self.name_prefix = snake_name
+        self.name_suffix = ''
+        expand_suffix_match = re.search( r'[A-Z][A-Z]+$', self.name )
+        if expand_suffix_match:
+            self.name_suffix = '_' + expand_suffix_match.group()
+            # Strip off the suffix from the prefix
+            self.name_prefix = snake_name.rsplit( self.name_suffix, 1 )[ 0 ]
+
+        # ( name, numeric value or None for aliases, value string ) of each required enum, duplicates removed
+        # enums of extensions which are not generated are not required
+        self.enums = [ ( enum.get( 'name' ), *gen.enumToValue( enum, True ))
+            for enum in gen.checkDuplicateEnums( elem.findall( 'enum' )) if gen.isEnumRequired( enum ) ]
+
+
+
+# temp files are created with mode 0600, modules written through them get the permissions of a plain open instead
+file_mode_mask = os.umask( 0 )
+os.umask( file_mode_mask )
+
+
+
+# generator options which affect the registry traversal and so the cached registry state, the remaining options
+# e.g. the output directory or the optional modules are only read by endFile and are applied to a restored state
+REGISTRY_OPTIONS = (
+    'apiname', 'versions', 'emitversions', 'defaultExtensions', 'addExtensions', 'removeExtensions', 'emitExtensions',
+    'featureNames', 'extensionNames', 'removeExtensionNames', 'emitExtensionNames', 'indentString', 'current_xml',
+)
+
+# hash the input of a generator run, a registry state cached under this key is valid as long as
+# the xml file, this generator, the vulkan-docs scripts and the registry options stay the same
+def registryCacheKey( xml_file, options ):
+    key = hashlib.sha256()
+    with open( xml_file, 'rb' ) as xml:
+        key.update( xml.read() )
+
+    # generator version and vulkan-docs scripts
+    for module_name in ( __name__, 'reg', 'generator', 'vkconventions' ):
+        module_file = getattr( sys.modules.get( module_name ), '__file__', None )
+        if module_file:
+            with open( module_file, 'rb' ) as module:
+                key.update( module.read() )
+
+    for name in REGISTRY_OPTIONS:
+        key.update( '{0}={1};'.format( name, getattr( options, name, None )).encode( 'utf-8' ))
+
+    return key.hexdigest()
+
+
+
 class DGenerator( OutputGenerator ):
 
+    # generator data collected while traversing the registry, everything endFile requires to write the d modules
+    CACHED_STATE = (
+        'max_func_name_len', 'max_g_func_name_len', 'max_i_func_name_len', 'max_d_func_name_len', 'max_di_func_name_len', 'max_q_func_name_len',
+        'feature_order', 'feature_content', 'command_requirers', 'instance_extensions',
+        'platform_extension_order', 'platform_protection_order', 'platform_extension_protection', 'platform_name_protection',
+        'selection_report', 'formats',
+    )
+
     def __init__( self, errFile = sys.stderr, warnFile = sys.stderr, diagFile = sys.stderr ):
         super().__init__( errFile, warnFile, diagFile )
 
+        self.registry = None
+        self.cache_file = None      # if set, endFile stores the collected registry data in this file
+        self.written_modules = []   # ( module file name, content changed ) of each module written by endFile
+        self.timings = dict()       # phase name : accumulated seconds, reported with --time
+        self.module_timings = []    # ( module file name, render seconds, write seconds, bytes ) of each module written by endFile
+        self.module_start = 0.0     # start of rendering the next module
+        self.callback_active = False
+        self.selection_report = None    # features and extensions selected by selectFeatures, None if all are generated
+
         self.indent = 4 * ' '
 
         self.max_func_name_len = 0
         self.max_g_func_name_len = 0
         self.max_i_func_name_len = 0
         self.max_d_func_name_len = 0
+        self.max_di_func_name_len = 0
+        self.max_q_func_name_len = 0
 
         self.feature_order = []
         self.feature_content = dict()
+        self.command_requirers = dict()     # command name : ( feature or extension, required command or alias name ) of its requirers
+        self.instance_extensions = set()    # names of the instance extensions, the other extensions are device extensions
 
         self.platform_extension_order = []
         self.platform_protection_order = []
         self.platform_extension_protection = dict()
         self.platform_name_protection = dict()
 
+        self.formats = []       # properties of the required formats of the formats section, see beginFile
+
         self.bitmask_flag_bits_flags = dict()   # record occurrence of VkSomeFlags or VkSomeFlagBits for pairing
 
+        # intermediate representation of the registry, built in beginFile
+        self.commands = dict()
+        self.structs = dict()
+        self.enum_groups = dict()
+
 
     # start processing
     def beginFile( self, genOpts ):
@@ -168,14 +364,269 @@ class DGenerator( OutputGenerator ):
         # since v1.1.70 we only get platform names per feature, but not their protect string
         # these are stored in vk.xml in platform tags, we extract them and map
         # platform name to platform protection
-        for platform in self.registry.tree.findall( 'platforms/platform' ):
-            self.platform_name_protection[ platform.get( 'name' ) ] = platform.get( 'protect' )
+        # the registry is not set if the generator state was restored from the registry cache
+        if self.registry is not None:
+            for platform in self.registry.tree.findall( 'platforms/platform' ):
+                self.platform_name_protection[ platform.get( 'name' ) ] = platform.get( 'protect' )
+
+            # build the intermediate representation of commands, structs and enum groups, requirements are marked already
+            self.commands = { name : Command( info.elem ) for name, info in self.registry.cmddict.items() if info.elem.find( 'proto' ) is not None }
+            self.structs = { name : Struct( info.elem ) for name, info in self.registry.typedict.items()
+                if info.elem.get( 'category' ) in ( 'struct', 'union' ) and not info.elem.get( 'alias' ) }
+            self.enum_groups = { name : EnumGroup( self, info.elem ) for name, info in self.registry.groupdict.items()
+                if info.elem.get( 'type' ) in ( 'enum', 'bitmask' ) }
+
+            # features and extensions requiring each command, the requirers of command aliases are added to the aliased command
+            # as the alias shares its function pointer, used to load only the commands of the enabled features of a device
+            # the required name is kept, an extension providing a command promoted to core provides it only with its alias name
+            for feature in self.registry.tree.findall( 'feature' ) + self.registry.tree.findall( 'extensions/extension' ):
+                for command in feature.iterfind( 'require/command' ):
+                    required_name = command.get( 'name' )
+                    info = self.registry.cmddict.get( required_name )
+                    name = info.elem.get( 'alias' ) or required_name if info is not None else required_name
+                    requirers = self.command_requirers.setdefault( name, [] )
+                    if feature.get( 'name' ) not in ( requirer for requirer, _ in requirers ):
+                        requirers.append( ( feature.get( 'name' ), required_name ))
+
+            self.instance_extensions = { extension.get( 'name' ) for extension in self.registry.tree.findall( 'extensions/extension' ) if extension.get( 'type' ) == 'instance' }
+
+            # ( name, value, class, block size, texels per block, block extent, packed bits, compression, chroma, components, planes )
+            # of the formats whose VkFormat value is required, components are ( name, bits, numeric format, plane index ) with bits 0
+            # for compressed formats and planes are ( width divisor, height divisor, compatible format ) ordered by plane index
+            format_values = { name : value for name, value, _ in self.enum_groups[ 'VkFormat' ].enums if value is not None } if 'VkFormat' in self.enum_groups else dict()
+            self.formats = [ (
+                    format.get( 'name' ), format_values[ format.get( 'name' ) ], format.get( 'class' ),
+                    int( format.get( 'blockSize' )), int( format.get( 'texelsPerBlock' )),
+                    tuple( int( extent ) for extent in format.get( 'blockExtent', '1,1,1' ).split( ',' )),
+                    int( format.get( 'packed', '0' )), format.get( 'compressed' ), format.get( 'chroma' ),
+                    [ ( component.get( 'name' ), int( component.get( 'bits' )) if component.get( 'bits' ).isdigit() else 0,
+                        component.get( 'numericFormat' ), int( component.get( 'planeIndex', '0' ))) for component in format.findall( 'component' ) ],
+                    [ ( int( plane.get( 'widthDivisor' )), int( plane.get( 'heightDivisor' )), plane.get( 'compatible' ))
+                        for plane in sorted( format.findall( 'plane' ), key = lambda plane : int( plane.get( 'index' ))) ],
+                ) for format in self.registry.tree.findall( 'formats/format' ) if format.get( 'name' ) in format_values ]
+
+
+
+    # accumulate the time since start under the phase name, returns the current time to start the next phase
+    def addTime( self, phase, start ):
+        now = time.perf_counter()
+        self.timings[ phase ] = self.timings.get( phase, 0.0 ) + now - start
+        return now
+
+
+    # wrap the registry callbacks to accumulate their time per callback and type category or group type, used with --time
+    # nested callbacks, e.g. genStruct called from genType, are accounted to the outermost one
+    def timeCallbacks( self ):
+        def timed( method, category_attr ):
+            def call( *args ):
+                if self.callback_active:
+                    return method( *args )
+                phase = method.__name__
+                if category_attr and args[ 0 ].elem.get( category_attr ):
+                    phase += ' ' + args[ 0 ].elem.get( category_attr )
+                self.callback_active = True
+                start = time.perf_counter()
+                try:
+                    return method( *args )
+                finally:
+                    self.addTime( phase, start )
+                    self.callback_active = False
+            return call
+
+        for callback, category_attr in (
+            ( 'beginFile', None ), ( 'genType', 'category' ), ( 'genStruct', 'category' ), ( 'genGroup', 'type' ),
+            ( 'genEnum', None ), ( 'genCmd', None ), ( 'endFile', None )):
+            setattr( self, callback, timed( getattr( self, callback ), category_attr ))
+
+
+    # store the data collected from the registry, a later run with the same input can
+    # restore it with loadState and skip xml parsing, registry indexing and dependency resolution
+    def saveState( self, file_name ):
+        state = { attr : getattr( self, attr ) for attr in self.CACHED_STATE }
+        os.makedirs( path.dirname( file_name ), exist_ok = True )
+
+        # write to a temporary file and rename it, concurrent runs must never see a partial cache file
+        fd, temp_name = tempfile.mkstemp( dir = path.dirname( file_name ), suffix = '.tmp' )
+        try:
+            with os.fdopen( fd, 'wb' ) as cache:
+                pickle.dump( state, cache, protocol = pickle.HIGHEST_PROTOCOL )
+            os.replace( temp_name, file_name )
+        except OSError:
+            if path.exists( temp_name ):
+                os.remove( temp_name )
+            return
+
+        # keep only the newest cache file of each xml file, entries of older inputs or other options are never used again
+        prefix = path.basename( file_name ).rsplit( '-', 1 )[ 0 ] + '-'
+        for entry in os.listdir( path.dirname( file_name )):
+            if entry.startswith( prefix ) and entry.endswith( '.pickle' ) and entry != path.basename( file_name ):
+                try:
+                    os.remove( path.join( path.dirname( file_name ), entry ))
+                except OSError:
+                    pass
+
+
+    # restore the data collected from the registry with saveState, returns False if the cache is missing or unusable
+    def loadState( self, file_name ):
+        try:
+            with open( file_name, 'rb' ) as cache:
+                state = pickle.load( cache )
+        except ( OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError ):
+            return False
+
+        if not isinstance( state, dict ) or set( state ) != set( self.CACHED_STATE ):
+            return False
 
+        for attr, value in state.items():
+            setattr( self, attr, value )
+        return True
+
+
+
+    # write a d module only if its content differs from the existing file, unchanged modules keep their
+    # mtime and are not recompiled by build tools, changed modules are replaced atomically via temp file and rename
+    def writeModule( self, file_name, file_content ):
+        render_end = time.perf_counter()
+        file_path = path.join( self.genOpts.directory, file_name )
+        content = ( file_content + '\n' ).replace( '\n', os.linesep ).encode( 'utf-8' )    # same bytes as text mode write
+
+        try:
+            with open( file_path, 'rb' ) as d_module:
+                changed = hashlib.sha256( d_module.read() ).digest() != hashlib.sha256( content ).digest()
+        except OSError:
+            changed = True
+
+        if changed:
+            os.makedirs( path.dirname( file_path ), exist_ok = True )
+            fd, temp_name = tempfile.mkstemp( dir = path.dirname( file_path ), prefix = '.' + path.basename( file_name ), suffix = '.tmp' )
+            try:
+                with os.fdopen( fd, 'wb' ) as d_module:
+                    d_module.write( content )
+                os.chmod( temp_name, 0o666 & ~file_mode_mask )
+                os.replace( temp_name, file_path )
+            except BaseException:
+                os.remove( temp_name )
+                raise
+
+        self.written_modules.append( ( file_name, changed ))
+        write_end = time.perf_counter()
+        self.module_timings.append( ( file_name, render_end - self.module_start, write_end - render_end, len( content )))
+        self.module_start = write_end
+
+
+
+    # definitions of a d module and identifiers used in it, to compute the imports of split feature modules
+    # definitions are the names declared at the begin of a line with alias, enum, struct or union,
+    # handles declared with VK_DEFINE_HANDLE mixins, pure version functions and function pointer declarations
+    DEFINITION_PATTERN = re.compile( r'^(?:(?:alias|enum|struct|union)\s+(?:const\( char \)\*\s+)?(\w+)|mixin\( \w+!q\{(\w+)\} \);|\s+uint (\w+)\(|\s+PFN_\w+\s+(\w+);|\s+alias\s+(\w+))', re.M )
+    IDENTIFIER_PATTERN = re.compile( r'\b[A-Za-z_]\w*' )
+
+
+    # write the types and functions of each non platform feature into modules types/vk_feature.d and functions/vk_feature.d
+    # feature modules publicly import the modules of the features defining the identifiers they use and the types base module
+    # returns the public imports of the function modules for the functions package module
+    def writeFeatureModules( self, sectionLines ):
+        package = self.genOpts.packagePrefix
+
+        types_text = { feature : '\n'.join( self.feature_content[ feature ][ 'Type_Definitions' ] ) for feature in self.feature_order }
+        funcs_text = dict()
+        for feature in self.feature_order:
+            type_aliases = sectionLines( feature, 'Func_Type_Aliases' )
+            declarations = sectionLines( feature, 'Func_Declarations' ) + sectionLines( feature, 'Func_Aliases' )
+            if type_aliases or declarations:
+                funcs_text[ feature ] = ( type_aliases, declarations )
+
+        # map each defined identifier to the module defining it first
+        defining_module = dict()
+        for feature, text in types_text.items():
+            for definition in self.DEFINITION_PATTERN.findall( text ):
+                defining_module.setdefault( ''.join( definition ), 'types.' + feature.lower() )
+        for feature, ( type_aliases, declarations ) in funcs_text.items():
+            for definition in self.DEFINITION_PATTERN.findall( '\n'.join( self.indent + line for line in type_aliases + declarations )):
+                defining_module.setdefault( ''.join( definition ), 'functions.' + feature.lower() )
+
+        def imports( module, text ):
+            dependencies = { defining_module[ name ] for name in set( self.IDENTIFIER_PATTERN.findall( text )) if name in defining_module } - { module }
+            result = [ 'public import {0}.types.base;'.format( package ) ]
+            result += [ 'public import {0}.{1};'.format( package, dependency ) for dependency in sorted( dependencies ) ]
+            if 'StdVideo' in text or 'STD_VIDEO' in text:
+                result.append( 'import {0}.vk_video;'.format( package ))
+            if 'bitfields!' in text:
+                result.append( 'import std.bitmanip : bitfields;' )
+            return '\n'.join( result )
+
+        for feature, text in types_text.items():
+            self.writeModule( path.join( 'types', feature.lower() + '.d' ), TYPES_FEATURE.format(
+                PACKAGE_PREFIX      = package,
+                FEATURE             = feature,
+                MODULE              = feature.lower(),
+                IMPORTS             = imports( 'types.' + feature.lower(), text ),
+                TYPE_DEFINITIONS    = text,
+            ))
+
+        for feature, ( type_aliases, declarations ) in funcs_text.items():
+            joiner = '\n' + self.indent
+            self.writeModule( path.join( 'functions', feature.lower() + '.d' ), FUNCS_FEATURE.format(
+                PACKAGE_PREFIX      = package,
+                FEATURE             = feature,
+                MODULE              = feature.lower(),
+                IMPORTS             = imports( 'functions.' + feature.lower(), '\n'.join( type_aliases + declarations )),
+                FUNC_TYPE_ALIASES   = self.indent + joiner.join( type_aliases ) if type_aliases else '',
+                FUNC_DECLARATIONS   = self.indent + joiner.join( declarations ) if declarations else '',
+            ))
+
+        # package module types, the functions package imports are returned
+        self.writeModule( path.join( 'types', 'package.d' ), TYPES_PACKAGE.format(
+            PACKAGE_PREFIX      = package,
+            FEATURE_IMPORTS     = ''.join( 'public import {0}.types.{1};\n'.format( package, feature.lower() ) for feature in self.feature_order ),
+        ))
+        return ''.join( '\npublic import {0}.functions.{1};'.format( package, feature.lower() ) for feature in funcs_text )
+
+
+    # remove the d modules written by the previous run but not by this one, e.g. modules of deselected features, of options
+    # not passed anymore or of the other split modules mode, types.d clashes with types/package.d. The modules of a run are
+    # recorded in the manifest file of the output directory, files which are not recorded there are never removed
+    MANIFEST_FILE = '.erupted_modules'
+
+    def removeStaleModules( self ):
+        manifest_path = path.join( self.genOpts.directory, self.MANIFEST_FILE )
+        written = [ path.normpath( file_name ) for file_name, _ in self.written_modules ]
+        try:
+            with open( manifest_path, encoding = 'utf-8' ) as manifest:
+                previous = [ path.normpath( line.strip() ) for line in manifest if line.strip() ]
+        except OSError:
+            previous = []
+
+        # manifest entries outside the output directory are ignored
+        for file_name in previous:
+            if file_name in written or path.isabs( file_name ) or file_name.split( os.sep )[ 0 ] == os.pardir:
+                continue
+            file_path = path.join( self.genOpts.directory, file_name )
+            if path.isfile( file_path ):
+                os.remove( file_path )
+                print( 'Removed stale module {0}'.format( file_name ))
+
+        for package in ( 'types', 'functions' ):
+            package_dir = path.join( self.genOpts.directory, package )
+            if path.isdir( package_dir ) and not os.listdir( package_dir ):
+                os.rmdir( package_dir )
+
+        with open( manifest_path, 'w', encoding = 'utf-8' ) as manifest:
+            manifest.write( ''.join( file_name.replace( os.sep, '/' ) + '\n' for file_name in sorted( written )))
 
 
     # end processing, store data to files
     def endFile( self ):
 
+        # store the collected registry data for subsequent runs
+        if self.cache_file:
+            start = time.perf_counter()
+            self.saveState( self.cache_file )
+            self.addTime( 'cache save', start )
+
+        # rendering time of each module is measured from here or from the end of writing the previous module
+        self.module_start = time.perf_counter()
+
         if self.genOpts.current_xml == 'vk':
             types_file_name = 'types.d'
             TYPES_OR_VIDEO = TYPES
@@ -188,26 +639,33 @@ class DGenerator( OutputGenerator ):
         # --------------------------------- #
 
         # helper function to join function sections into format substitutions
+        # the sections are collected in a list and joined once, repeated string concatenation is quadratic in the worst case
         def typesSection():
-            result = ''
+            result = []
 
             # some of the sections need formatting before being merged into one code block
             # in these cases the  substitute parameter will contain the corresponding term
             for feature in self.feature_order:
                 feature_section = self.feature_content[ feature ][ 'Type_Definitions' ]
                 if feature_section:
-                    result += '\n// - {0} -\n{1}\n'.format( feature, '\n'.join( feature_section ))
+                    result.append( '\n// - {0} -\n{1}\n'.format( feature, '\n'.join( feature_section )))
+
+            return ''.join( result )[:-1]
 
-            return result[:-1]
+        # with split modules types.d becomes the package types, its base module holds the platform types and handle templates
+        # and the types of each feature are written into their own module with writeFeatureModules
+        split_modules = self.genOpts.current_xml == 'vk' and self.genOpts.splitModules
+        if split_modules:
+            types_file_name = path.join( 'types', 'base.d' )
 
         # types file format string, substitute format tokens with accumulated section data
         file_content = TYPES_OR_VIDEO.format(
             PACKAGE_PREFIX      = self.genOpts.packagePrefix,
-            TYPE_DEFINITIONS    = typesSection(),
+            TYPES_MODULE        = 'types.base' if split_modules else 'types',
+            TYPE_DEFINITIONS    = '' if split_modules else typesSection(),
         )
 
-        with open( path.join( self.genOpts.directory, types_file_name ), 'w', encoding = 'utf-8' ) as d_module:
-            write( file_content, file = d_module )
+        self.writeModule( types_file_name, file_content )
 
 
         # vulkan-docs-v1.3.238 introduced a second xml file (video.xml)
@@ -223,59 +681,101 @@ class DGenerator( OutputGenerator ):
         # write package.d file #
         # -------------------- #
 
-        with open( path.join( self.genOpts.directory, 'package.d' ), 'w', encoding = 'utf-8' ) as d_module:
-            write( PACKAGE_HEADER.format( PACKAGE_PREFIX = self.genOpts.packagePrefix ), file = d_module )
+        self.writeModule( 'package.d', PACKAGE_HEADER.format( PACKAGE_PREFIX = self.genOpts.packagePrefix ))
+
+
+        # --------------- #
+        # align functions #
+        # --------------- #
+
+        # function items are stored as tuples of ( func name length, fragments ), the fragments are joined with the padding
+        # which aligns the function name of each item to the longest function name of its category, the categories are:
+        # function type aliases:  alias PFN_vkFuncName = return_type function( params );
+        # function declarations:  PFN_vkFuncName vkFuncName;
+        # function aliases:       alias vkFuncNameKHR = vkFuncName;     ( additional padding of 6, the length of 'alias ' )
+        # loader functions:       vkFuncName = cast( PFN_vkFuncName ) vkGetInstanceProcAddr( instance, "vkFuncName" );
+        # dispatch declarations:  PFN_vkFuncName vkFuncName;
+        # dispatch aliases:       alias FuncNameKHR = FuncName;
+        aligned_sections = {
+            'Func_Type_Aliases' : ( self.max_func_name_len  , 0 ),
+            'Func_Declarations' : ( self.max_func_name_len  , 0 ),
+            'Func_Aliases'      : ( self.max_func_name_len  , 6 ),
+            'Load_G_Funcs'      : ( self.max_g_func_name_len, 0 ),
+            'Load_I_Funcs'      : ( self.max_i_func_name_len, 0 ),
+            'Load_D_Funcs'      : ( self.max_d_func_name_len, 0 ),
+            'Disp_Declarations' : ( self.max_d_func_name_len, 0 ),
+            'Conven_Aliases'    : ( self.max_d_func_name_len, 6 ),
+            'Disp_Aliases'      : ( self.max_d_func_name_len, 6 ),
+            'Inst_Declarations' : ( self.max_di_func_name_len, 0 ),
+            'Inst_Conven_Aliases' : ( self.max_di_func_name_len, 6 ),
+            'Inst_Aliases'      : ( self.max_di_func_name_len, 6 ),
+            'Queue_Load_Funcs'  : ( self.max_q_func_name_len, 0 ),
+            'Queue_Declarations': ( self.max_q_func_name_len, 0 ),
+            'Queue_Conven_Aliases' : ( self.max_q_func_name_len, 6 ),
+            'Queue_Aliases'     : ( self.max_q_func_name_len, 6 ),
+        }
 
+        # loader functions retrieve their function pointer with vkGet( INSTANCE_OR_DEVICE )ProcAddr( instance_or_device, ... )
+        # device level functions can be loaded from either of instance or device, depending on Instance_or_Device
+        loader_sections = {
+            'Load_G_Funcs' : ( 'Instance', 'null' ),
+            'Load_I_Funcs' : ( 'Instance', 'instance' ),
+            'Load_D_Funcs' : None,
+            'Queue_Load_Funcs' : ( 'Device', 'device' ),
+        }
 
-        # ----------------- #
-        # justify functions #
-        # ----------------- #
+        # with lazy loading the loader functions of functions.d install lazyResolve stubs instead of querying each function pointer
+        # each stub stores the instance or device of its load function call and resolves the function pointer with it on first call
+        lazy_resolvers = {
+            ( 'Load_G_Funcs', ''         ) : ( 'lazyGlobalProcAddr',   'null' ),
+            ( 'Load_I_Funcs', ''         ) : ( 'lazyInstanceProcAddr', 'instance' ),
+            ( 'Load_D_Funcs', 'Instance' ) : ( 'lazyInstanceProcAddr', 'instance' ),
+            ( 'Load_D_Funcs', 'Device'   ) : ( 'lazyDeviceProcAddr',   'device' ),
+        }
 
-        # loop through all functions of all features and align their names
-        # in the outer loop are three categories, each category has a different per feature count of function items
-        # we store the function name length in only one function item, it can be reused with the other items in the same category
-        # the items which store the name length are tuples of ( func item string, func name length )
-        # the others are simply func item strings
-        for value in self.feature_content.values():
+        # the enumerate convenience functions are rendered with the convenience functions of their dispatch struct
+        # the merged lists are kept apart from feature_content, which is left as collected and cached
+        enumerate_helpers = self.genOpts.enumerateHelpers
+        enumerate_import = '\nimport {0}.enumerate;'.format( self.genOpts.packagePrefix ) if enumerate_helpers else ''
+        merged_sections = dict()
+        if enumerate_helpers:
+            for feature in self.feature_order:
+                content = self.feature_content[ feature ]
+                for section in ( 'Conven_Funcs', 'Inst_Conven_Funcs', 'Queue_Conven_Funcs' ):
+                    merged_sections[ feature, section ] = content[ section ] + content[ 'Enum_' + section ]
 
-            # function type aliases: alias PFN_vkFuncName = return_type function( params );
-            # function declarations: PFN_vkFuncName = vkFuncName
-            for i in range( len( value[ 'Func_Type_Aliases' ] )):
-                lj = self.max_func_name_len       - value[ 'Func_Type_Aliases' ][ i ][ 1 ]
-                value[ 'Func_Type_Aliases' ][ i ] = value[ 'Func_Type_Aliases' ][ i ][ 0 ].format( LJUST_NAME = lj * ' ' )
-                value[ 'Func_Declarations' ][ i ] = value[ 'Func_Declarations' ][ i ].format( LJUST_NAME = lj * ' ' )
+        # helper function to get the items of one feature section, merged with its enumerate convenience functions
+        def sectionItems( feature, section ):
+            return merged_sections.get(( feature, section ), self.feature_content[ feature ][ section ] )
 
-            # global function aliases for extensions merged into vulkan 1.1: alias vkFuncNameKHR = vkFuncName;
-            for i in range( len( value[ 'Func_Aliases' ] )):
-                lj = self.max_func_name_len  - value[ 'Func_Aliases' ][ i ][ 1 ] + 6 # length of alias_
-                value[ 'Func_Aliases' ][ i ] = value[ 'Func_Aliases' ][ i ][ 0 ].format( LJUST_NAME = lj * ' ' )
+        # helper function to render the items of one feature section into code lines
+        # the convenience functions forward to the function pointers qualified with dispatch_table
+        # traced declarations declare the function pointer members of dispatch structs as Traced!( PFN_vkFuncName, "vkFuncName" ),
+        # traced loaders of global function pointers install their trace stubs after loading them
+        def sectionLines( feature, section, Instance_or_Device = '', lazy_loading = False, dispatch_table = '', traced = False ):
+            items = sectionItems( feature, section )
+            if section in ( 'Conven_Funcs', 'Inst_Conven_Funcs', 'Queue_Conven_Funcs' ):
+                return [ dispatch_table.join( fragments ) for fragments in items ]
+            if section not in aligned_sections:
+                return items
 
-            # global level functions: vkFuncName = cast( PFN_vkFuncName ) vkGetInstanceProcAddr( instance, "vkFuncName" );
-            for i in range( len( value[ 'Load_G_Funcs' ] )):
-                lj = self.max_g_func_name_len - value[ 'Load_G_Funcs' ][ i ][ 1 ]
-                value[ 'Load_G_Funcs' ][ i ]  = value[ 'Load_G_Funcs' ][ i ][ 0 ].format( LJUST_NAME = lj * ' ' )
+            max_name_len, extra_len = aligned_sections[ section ]
+            lines = [ (( max_name_len - name_len + extra_len ) * ' ' ).join( fragments ) for name_len, fragments in items ]
 
-            # instance level functions: vkFuncName = cast( PFN_vkFuncName ) vkGetInstanceProcAddr( instance, "vkFuncName" );
-            for i in range( len( value[ 'Load_I_Funcs' ] )):
-                lj = self.max_i_func_name_len  - value[ 'Load_I_Funcs' ][ i ][ 1 ]
-                value[ 'Load_I_Funcs' ][ i ] = value[ 'Load_I_Funcs' ][ i ][ 0 ].format( LJUST_NAME = lj * ' ' )
+            if traced and section not in loader_sections:
+                lines = [ 'Traced!( {0}, "{1}" ){2}{3}'.format( fragments[ 0 ], fragments[ 0 ][ 4: ], 2 * ( max_name_len - name_len ) * ' ', fragments[ 1 ] ) for name_len, fragments in items ]
 
-            # device level functions: vkFuncName = cast( PFN_vkFuncName ) vkGetDeviceProcAddr( device, "vkFuncName" );
-            # dispatch declarations:  return_type FuncName( params ) { return vkFuncName( device, params ); }
-            for i in range( len( value[ 'Load_D_Funcs' ] )):
-                lj = self.max_d_func_name_len     - value[ 'Load_D_Funcs' ][ i ][ 1 ]
-                value[ 'Load_D_Funcs'      ][ i ] = value[ 'Load_D_Funcs' ][ i ][ 0 ].format( LJUST_NAME = lj * ' ' )
-                value[ 'Disp_Declarations' ][ i ] = value[ 'Disp_Declarations' ][ i ].format( LJUST_NAME = lj * ' ' )
+            if lazy_loading and ( section, Instance_or_Device ) in lazy_resolvers:
+                resolver, handle = lazy_resolvers[ section, Instance_or_Device ]
+                lines = [ 'lazyInstall!( {0},{1} {2} )( {3} );'.format( fragments[ 0 ], ( max_name_len - name_len ) * ' ', resolver, handle ) for name_len, fragments in items ]
 
-            # dispatch device convenience function aliases for extensions merged into vulkan 1.1: alias FuncNameKHR = FuncName;
-            for i in range( len( value[ 'Conven_Aliases' ] )):
-                lj = self.max_d_func_name_len  - value[ 'Conven_Aliases' ][ i ][ 1 ] + 6 # length of alias_
-                value[ 'Conven_Aliases' ][ i ] = value[ 'Conven_Aliases' ][ i ][ 0 ].format( LJUST_NAME = lj * ' ' )
+            elif section in loader_sections:
+                proc_addr, handle = loader_sections[ section ] or ( Instance_or_Device, Instance_or_Device.lower())
+                lines = [ '{0}vkGet{1}ProcAddr( {2}, "{3}" );'.format( line, proc_addr, handle, fragments[ 0 ] ) for line, ( _, fragments ) in zip( lines, items ) ]
+                if traced:
+                    lines += [ 'version( EruptedTrace ) traceFunction!{0}();'.format( fragments[ 0 ] ) for _, fragments in items ]
 
-            # dispatch device function aliases for extensions merged into vulkan 1.1: alias vkFuncNameKHR = vkFuncName;
-            for i in range( len( value[ 'Disp_Aliases' ] )):
-                lj = self.max_d_func_name_len - value[ 'Disp_Aliases' ][ i ][ 1 ] + 6 # length of alias_
-                value[ 'Disp_Aliases' ][ i ]  = value[ 'Disp_Aliases' ][ i ][ 0 ].format( LJUST_NAME = lj * ' ' )
+            return lines
 
 
 
@@ -283,46 +783,409 @@ class DGenerator( OutputGenerator ):
         # write functions.d file #
         # ---------------------- #
 
-        # helper function to join function sections into format substitutions
-        def functionSection( section, indent, Instance_or_Device = '' ):
-            result = ''
-            joiner = '\n' + indent
+        # with a call profile the function pointer declarations and the loader tables are ordered hot-first, without one
+        # they follow the feature order. Calls of aliases are counted for the aliased function, which is the one declared
+        call_profile = dict()
+        for name, count in self.genOpts.callProfile.items():
+            if count > 0:
+                call_profile[ name ] = call_profile.get( name, 0 ) + count
+        for feature in self.feature_order:
+            for _, ( alias_name, aliased ) in self.feature_content[ feature ][ 'Func_Aliases' ]:
+                if alias_name[ 6: ] in call_profile:
+                    aliased_name = aliased[ 3:-1 ]
+                    call_profile[ aliased_name ] = call_profile.get( aliased_name, 0 ) + call_profile.pop( alias_name[ 6: ] )
+        profiled_sections = { 'Func_Declarations', 'Disp_Declarations', 'Inst_Declarations', 'Queue_Declarations' }
+
+        # with call tracing functions.d installs trace stubs into the function pointers after loading them in version( EruptedTrace )
+        # the function pointer members of the dispatch structs are declared Traced, which records their calls in version( EruptedTrace ),
+        # the convenience functions forward to these members and are traced with them
+        trace_calls = self.genOpts.traceCalls
+        traced_sections = { 'Disp_Declarations', 'Inst_Declarations', 'Queue_Declarations' }
+        trace_import = '\nimport {0}.trace;'.format( self.genOpts.packagePrefix ) if trace_calls else ''
+
+        # stable sort by descending call count, functions with equal count keep their feature order
+        def hotFirst( names ):
+            return sorted( names, key = lambda name: -call_profile.get( name, 0 ))
 
-            # some of the sections need formatting before being merged into one code block
-            # in these cases the substitute parameter will contain the corresponding term
-            for feature in self.feature_order:
-                feature_section = self.feature_content[ feature ][ section ]
-                if feature_section:
-                    result += '\n{0}// {1}\n{0}{2}\n'.format( indent, feature, joiner.join( feature_section ))
-
-            # some of the sections need formatting before being merged into one code block
-            # in these cases the  substitute parameter will contain the corresponding term
-            if Instance_or_Device:
-                result = result.format( INSTANCE_OR_DEVICE = Instance_or_Device, instance_or_device = Instance_or_Device.lower())
-
-            return result[:-1]
+        # helper function to join function sections into format substitutions
+        # several modules share the same section renderings, each distinct rendering is cached and produced only once
+        section_cache = dict()
+        def functionSection( section, indent, Instance_or_Device = '', lazy_loading = False, dispatch_table = '' ):
+            key = ( section, indent, Instance_or_Device, lazy_loading, dispatch_table )
+            if key not in section_cache:
+                result = []
+                joiner = '\n' + indent
+                traced = trace_calls and section in traced_sections
+
+                # the profiled function pointers are declared in one leading block, hottest first, and omitted in their features
+                hot_lines = dict()
+                if call_profile and section in profiled_sections:
+                    for feature in self.feature_order:
+                        for ( _, fragments ), line in zip( sectionItems( feature, section ), sectionLines( feature, section, traced = traced )):
+                            if fragments[ 0 ][ 4: ] in call_profile:
+                                hot_lines[ fragments[ 0 ][ 4: ]] = line
+                    if hot_lines:
+                        result.append( '\n{0}// hot functions ordered by call count, declared next to each other\n{0}{1}\n'.format(
+                            indent, joiner.join( hot_lines[ name ] for name in hotFirst( hot_lines ))))
+
+                for feature in self.feature_order:
+                    feature_section = sectionLines( feature, section, Instance_or_Device, lazy_loading, dispatch_table, traced )
+                    if hot_lines:
+                        feature_section = [ line for ( _, fragments ), line in zip( sectionItems( feature, section ), feature_section ) if fragments[ 0 ][ 4: ] not in hot_lines ]
+                    if feature_section:
+                        result.append( '\n{0}// {1}\n{0}{2}\n'.format( indent, feature, joiner.join( feature_section )))
+                section_cache[ key ] = ''.join( result )[:-1]
+
+            return section_cache[ key ]
+
+
+        # table loaders store the function names of a loader section in one string and the name offset and pointer address of
+        # each function in arrays, the loader functions loop over these tables instead of loading each function in its own statement
+        # the device level table is also used to load the member function pointers of DispatchDevice, addressed by their offsets
+        table_loaders = self.genOpts.tableLoaders
+        table_levels = { 'Load_G_Funcs' : 'global', 'Load_I_Funcs' : 'instance', 'Load_D_Funcs' : 'device' }
+
+        def tableNames( section ):
+            names = [ fragments[ 0 ] for feature in self.feature_order for _, fragments in self.feature_content[ feature ][ section ]]
+            return hotFirst( names ) if call_profile else names
+
+        def tableRows( items, per_row ):
+            return '\n'.join( self.indent + ' '.join( items[ i : i + per_row ] ) for i in range( 0, len( items ), per_row ))
+
+        def loaderTable( section ):
+            names, offsets = tableNames( section ), [ 0 ]
+            for name in names[ :-1 ]:
+                offsets.append( offsets[ -1 ] + len( name ) + 1 )
+            return FUNCS_LOADER_TABLE.format(
+                PACKAGE_PREFIX  = self.genOpts.packagePrefix,
+                LEVEL           = table_levels[ section ],
+                COUNT           = len( names ),
+                NAMES           = self.indent + ( '\n' + self.indent + '~ ' ).join( '"{0}\\0"'.format( name ) for name in names ) if names else self.indent + '""',
+                OFFSETS         = tableRows( [ '{0},'.format( offset ) for offset in offsets[ :len( names ) ]], 16 ),
+                TARGETS         = tableRows( [ 'cast( void** )&{0},'.format( name ) for name in names ], 1 ),
+            )
 
+        def loaderLoop( section, Instance_or_Device = 'Instance', handle = 'instance' ):
+            return FUNCS_LOADER_LOOP.format( IND = self.indent, LEVEL = table_levels[ section ], INSTANCE_OR_DEVICE = Instance_or_Device, HANDLE = handle )
 
         # functions file format string, substitute format tokens with accumulated section data
+        # the dispatch device sections are not part of this template, they are rendered for dispatch_device.d only
+        # with split modules this is the package functions, function pointer types and declarations are in the feature modules
+        # with lazy loading the loader functions install lazyResolve stubs bound to their instance or device,
+        # DispatchDevice and the platform extensions still load their function pointers eagerly
+        lazy_loading = self.genOpts.lazyLoading
         file_content = FUNCS.format(
             IND = self.indent,
             PACKAGE_PREFIX              = self.genOpts.packagePrefix,
-            FUNC_TYPE_ALIASES           = functionSection( 'Func_Type_Aliases', self.indent ),
-            FUNC_DECLARATIONS           = functionSection( 'Func_Declarations', self.indent ) + '\n' \
+            FEATURE_IMPORTS             = self.writeFeatureModules( sectionLines ) if split_modules else '',
+            FUNC_TYPE_ALIASES           = '' if split_modules else functionSection( 'Func_Type_Aliases', self.indent ),
+            FUNC_DECLARATIONS           = '' if split_modules else functionSection( 'Func_Declarations', self.indent ) + '\n' \
                                         + functionSection( 'Func_Aliases'     , self.indent ),
-            GLOBAL_LEVEL_FUNCS          = functionSection( 'Load_G_Funcs'     , self.indent ),
-            INSTANCE_LEVEL_FUNCS        = functionSection( 'Load_I_Funcs'     , self.indent ),
-            DEVICE_I_LEVEL_FUNCS        = functionSection( 'Load_D_Funcs'     , self.indent,     'Instance' ),
-            DEVICE_D_LEVEL_FUNCS        = functionSection( 'Load_D_Funcs'     , self.indent,     'Device'   ),
-            DISPATCH_MEMBER_FUNCS       = functionSection( 'Load_D_Funcs'     , self.indent * 2, 'Device'   ),
-            DISPATCH_CONVENIENCE_FUNCS  = functionSection( 'Conven_Funcs'     , self.indent ),
-            DISPATCH_FUNC_DECLARATIONS  = functionSection( 'Disp_Declarations', self.indent ),
+            LAZY_RESOLVERS              = FUNCS_LAZY_RESOLVERS.format( IND = self.indent ) if lazy_loading else '',
+            LOADER_TABLES               = ''.join( loaderTable( section ) for section in table_levels ) if table_loaders else '',
+            GLOBAL_LEVEL_FUNCS          = loaderLoop( 'Load_G_Funcs', 'Instance', 'null' ) if table_loaders else functionSection( 'Load_G_Funcs', self.indent, '', lazy_loading ),
+            INSTANCE_LEVEL_FUNCS        = loaderLoop( 'Load_I_Funcs' ) if table_loaders else functionSection( 'Load_I_Funcs', self.indent, '', lazy_loading ),
+            DEVICE_I_LEVEL_FUNCS        = loaderLoop( 'Load_D_Funcs' ) if table_loaders else functionSection( 'Load_D_Funcs', self.indent, 'Instance', lazy_loading ),
+            DEVICE_D_LEVEL_FUNCS        = loaderLoop( 'Load_D_Funcs', 'Device', 'device' ) if table_loaders else functionSection( 'Load_D_Funcs', self.indent, 'Device', lazy_loading ),
+            TRACE_IMPORT                = trace_import,
+            TRACE_GLOBAL                = '\n{0}version( EruptedTrace ) traceGlobalLevelFunctions();'.format( self.indent ) if trace_calls else '',
+            TRACE_INSTANCE              = '\n{0}version( EruptedTrace ) traceInstanceLevelFunctions();'.format( self.indent ) if trace_calls else '',
+            TRACE_DEVICE                = '\n{0}version( EruptedTrace ) traceDeviceLevelFunctions();'.format( self.indent ) if trace_calls else '',
         )
 
 
-        # open, write and close functions.d file
-        with open( path.join( self.genOpts.directory, 'functions.d' ), 'w', encoding = 'utf-8' ) as d_module:
-            write( file_content, file = d_module )
+        # write functions.d file, skipped if its content did not change
+        self.writeModule( path.join( 'functions', 'package.d' ) if split_modules else 'functions.d', file_content )
+
+
+
+        # ------------------ #
+        # write trace.d file #
+        # ------------------ #
+
+        # the traced functions are all loaded functions, their trace stubs are installed per loader level
+        # the functions of platform extensions are traced as well, their stubs are installed by the loaders of platform_extensions.d
+        if trace_calls:
+            def traceInstalls( section ):
+                return '\n'.join( '{0}traceFunction!{1}();'.format( self.indent, name ) for name in tableNames( section ))
+
+            trace_functions = []
+            for feature in self.feature_order + self.platform_extension_order:
+                names = [ fragments[ 0 ] for section in table_levels for _, fragments in self.feature_content[ feature ][ section ]]
+                if names:
+                    trace_functions.append( '\n{0}// {1}\n{0}{2}\n'.format( self.indent, feature, ( ',\n' + self.indent ).join( names ) + ',' ))
+
+            file_content = TRACE.format(
+                IND = self.indent,
+                PACKAGE_PREFIX          = self.genOpts.packagePrefix,
+                TRACE_FUNCTIONS         = ''.join( trace_functions )[ 1:-1 ],
+                GLOBAL_LEVEL_FUNCS      = traceInstalls( 'Load_G_Funcs' ),
+                INSTANCE_LEVEL_FUNCS    = traceInstalls( 'Load_I_Funcs' ),
+                DEVICE_LEVEL_FUNCS      = traceInstalls( 'Load_D_Funcs' ),
+            )
+
+            self.writeModule( 'trace.d', file_content )
+
+
+
+        # --------------------- #
+        # write mock_icd.d file #
+        # --------------------- #
+
+        # each loaded function resolves to the counting no-op function of its type, except the proc address functions
+        # the entries are sorted by name, python sorts ascii names as strcmp does in the binary search of the mock icd
+        if self.genOpts.mockIcd:
+            mock_functions = { 'vkGetInstanceProcAddr' : 'mockGetInstanceProcAddr', 'vkGetDeviceProcAddr' : 'mockGetDeviceProcAddr', 'mockIcdCounters' : 'mockIcdCounters' }
+            for section in table_levels:
+                for name in tableNames( section ):
+                    mock_functions.setdefault( name, 'mockFunction!PFN_{0}'.format( name ))
+
+            file_content = MOCK_ICD.format(
+                IND = self.indent,
+                PACKAGE_PREFIX  = self.genOpts.packagePrefix,
+                COUNT           = len( mock_functions ),
+                MOCK_ENTRIES    = tableRows( [ 'MockEntry( "{0}", cast( PFN_vkVoidFunction )&{1} ),'.format( name, mock_functions[ name ] ) for name in sorted( mock_functions )], 1 ),
+            )
+
+            self.writeModule( 'mock_icd.d', file_content )
+
+
+
+        # ------------------------- #
+        # write enum_strings.d file #
+        # ------------------------- #
+
+        # value to name switch and name to value perfect hash tables of the enum and bitmask groups of the non platform features
+        # values with several names switch to the first one, parse accepts all names and aliases
+        if self.genOpts.enumStrings:
+            enum_functions = []
+            for feature in self.feature_order:
+                for group_name, enums in self.feature_content[ feature ][ 'Enum_Groups' ]:
+                    switched, cases = set(), []
+                    for name, enum_val in enums:
+                        if enum_val is not None and enum_val not in switched:
+                            switched.add( enum_val )
+                            cases.append( name )
+
+                    # a group of only aliases, e.g. of values of extensions which are not generated, has nothing to convert
+                    if not cases:
+                        continue
+
+                    max_case_len = max( len( name ) for name in cases ) + len( group_name ) + 7    # len( 'case .:' ) = 7
+                    enum_functions.append( ENUM_TO_STRING.format(
+                        IND = self.indent,
+                        GROUP   = group_name,
+                        CASES   = '\n'.join( '{0}{0}{1} return "{2}";'.format( self.indent, 'case {0}.{1}:'.format( group_name, name ).ljust( max_case_len ), name ) for name in cases ),
+                    ))
+
+                    displacements, slot_names = perfectHash( [ name for name, _ in enums ] )
+                    enum_functions.append( ENUM_PARSE.format(
+                        IND = self.indent,
+                        GROUP           = group_name,
+                        BUCKETS         = len( displacements ),
+                        SLOTS           = len( slot_names ),
+                        DISPLACEMENTS   = '\n'.join( 2 * self.indent + ' '.join( '{0},'.format( d ) for d in displacements[ i : i + 16 ] ) for i in range( 0, len( displacements ), 16 )),
+                        NAMES           = '\n'.join( 2 * self.indent + ( '"{0}",'.format( name ) if name else 'null,' ) for name in slot_names ),
+                        VALUES          = '\n'.join( 2 * self.indent + ( '{0}.{1},'.format( group_name, name ) if name else '{0}.init,'.format( group_name )) for name in slot_names ),
+                    ))
+
+            file_content = ENUM_STRINGS.format(
+                IND = self.indent,
+                PACKAGE_PREFIX  = self.genOpts.packagePrefix,
+                ENUM_FUNCTIONS  = ''.join( enum_functions )[ 1: ],
+            )
+
+            self.writeModule( 'enum_strings.d', file_content )
+
+
+
+        # -------------------- #
+        # write formats.d file #
+        # -------------------- #
+
+        # core formats are stored in a dense table indexed by their value, extension formats with values of 1000000000 and above
+        # in a sparse table sorted by value, classes, components and planes in shared tables referenced by index and count
+        if self.genOpts.formatTables:
+            def enumMember( name ):
+                return re.sub( r'\W', '_', name )
+
+            compressions, numeric_formats, classes = [ 'NONE' ], [], []
+            for format in self.formats:
+                for values, value in [ ( compressions, format[ 7 ] and enumMember( format[ 7 ] )), ( classes, format[ 2 ] ) ] + [ ( numeric_formats, component[ 2 ] ) for component in format[ 9 ]]:
+                    if value and value not in values:
+                        values.append( value )
+            chromas = [ 'NONE' ] + sorted( { 'CHROMA_' + format[ 8 ] for format in self.formats if format[ 8 ] } )
+
+            components, planes, infos = [], [], dict()
+            for name, value, format_class, block_size, texels_per_block, block_extent, packed, compressed, chroma, format_components, format_planes in self.formats:
+                infos[ value ] = 'FormatInfo( {0}, {1}, [ {2} ], {3}, FormatCompression.{4}, FormatChroma.{5}, {6}, {7}, {8}, {9}, {10} ),   // {11}'.format(
+                    block_size, texels_per_block, ', '.join( str( extent ) for extent in block_extent ), packed,
+                    enumMember( compressed ) if compressed else 'NONE', 'CHROMA_' + chroma if chroma else 'NONE',
+                    len( format_components ), len( format_planes ), classes.index( format_class ), len( components ), len( planes ), name )
+                components.append( ' '.join( "FormatComponent( '{0}', {1}, NumericFormat.{2}, {3} ),".format( *component ) for component in format_components ) + '   // ' + name )
+                if format_planes:
+                    planes.append( ' '.join( 'FormatPlane( {0}, {1}, VkFormat.{2} ),'.format( *plane ) for plane in format_planes ) + '   // ' + name )
+
+            dense_count = max(( value + 1 for value in infos if value < 1000000000 ), default = 0 )
+            sparse_values = sorted( value for value in infos if value >= 1000000000 )
+            format_names = { format[ 1 ] : format[ 0 ] for format in self.formats }
+
+            file_content = FORMATS.format(
+                IND = self.indent,
+                PACKAGE_PREFIX      = self.genOpts.packagePrefix,
+                COMPRESSIONS        = ',\n'.join( self.indent + member for member in compressions ),
+                CHROMAS             = ',\n'.join( self.indent + member for member in chromas ),
+                NUMERIC_FORMATS     = ',\n'.join( self.indent + member for member in numeric_formats ),
+                DENSE_COUNT         = dense_count,
+                DENSE_FORMAT_INFOS  = '\n'.join( self.indent + infos.get( value, 'FormatInfo.init,' ) for value in range( dense_count )),
+                SPARSE_COUNT        = len( sparse_values ),
+                SPARSE_FORMATS      = '\n'.join( '{0}VkFormat.{1},'.format( self.indent, format_names[ value ] ) for value in sparse_values ),
+                SPARSE_FORMAT_INFOS = '\n'.join( self.indent + infos[ value ] for value in sparse_values ),
+                CLASS_COUNT         = len( classes ),
+                FORMAT_CLASSES      = '\n'.join( '{0}"{1}",'.format( self.indent, format_class ) for format_class in classes ),
+                COMPONENT_COUNT     = sum( len( format[ 9 ] ) for format in self.formats ),
+                FORMAT_COMPONENTS   = '\n'.join( self.indent + line for line in components ),
+                PLANE_COUNT         = sum( len( format[ 10 ] ) for format in self.formats ),
+                FORMAT_PLANES       = '\n'.join( self.indent + line for line in planes ),
+            )
+
+            self.writeModule( 'formats.d', file_content )
+
+
+
+        # ------------------------- #
+        # write struct_chain.d file #
+        # ------------------------- #
+
+        # sType to struct name switch and the structextends relation of the structs with a fixed sType of the non platform features
+        # extended structs of platform extensions or of deselected features are not part of the relation
+        if self.genOpts.structChains:
+            chain_structs = [ chain_struct for feature in self.feature_order for chain_struct in self.feature_content[ feature ][ 'Chain_Structs' ]]
+            struct_s_types = { name : s_type for name, s_type, _ in chain_structs }
+
+            max_case_len = max(( len( s_type ) for _, s_type, _ in chain_structs ), default = 0 ) + len( 'case VkStructureType.:' )
+            def case( s_type ):
+                return '{0}{0}{1} '.format( self.indent, 'case VkStructureType.{0}:'.format( s_type ).ljust( max_case_len ))
+
+            struct_extends = []
+            for name, s_type, extends in chain_structs:
+                bases = [ 'base == VkStructureType.' + struct_s_types[ base ] for base in extends if base in struct_s_types ]
+                if bases:
+                    struct_extends.append( case( s_type ) + 'return {0};'.format( ' || '.join( bases )))
+
+            file_content = STRUCT_CHAIN.format(
+                IND = self.indent,
+                PACKAGE_PREFIX  = self.genOpts.packagePrefix,
+                STRUCT_NAMES    = '\n'.join( case( s_type ) + 'return "{0}";'.format( name ) for name, s_type, _ in chain_structs ),
+                STRUCT_EXTENDS  = '\n'.join( struct_extends ),
+            )
+
+            self.writeModule( 'struct_chain.d', file_content )
+
+
+
+        # ---------------------- #
+        # write enumerate.d file #
+        # ---------------------- #
+
+        # buffer and allocator variants of the two call functions, as the convenience functions of the dispatch structs
+        if enumerate_helpers:
+            file_content = ENUMERATE.format(
+                IND = self.indent,
+                PACKAGE_PREFIX  = self.genOpts.packagePrefix,
+                ENUMERATE_FUNCS = functionSection( 'Enum_Funcs', '' ),
+            )
+
+            self.writeModule( 'enumerate.d', file_content )
+
+
+
+        # ---------------------- #
+        # write deep_copy.d file #
+        # ---------------------- #
+
+        # size and copy functions of the structs of the non platform features, which reference other memory through their members
+        # a member is copied deep as of its type and len, pointers are followed, nested structs are copied with their own functions
+        if self.genOpts.deepCopy:
+            copy_structs = [ copy_struct for feature in self.feature_order for copy_struct in self.feature_content[ feature ][ 'Copy_Structs' ]]
+            chain_structs = [ chain_struct for feature in self.feature_order for chain_struct in self.feature_content[ feature ][ 'Chain_Structs' ]]
+            deep_structs = set()
+
+            # element count of a len or altlen, the identifiers are members of the struct, None if the len is no expression of them
+            def countExpression( member_len, member_names ):
+                count = member_len.split( ',' )[ 0 ]
+                if 'latexmath' in count or '->' in count:
+                    return None
+                identifiers = re.findall( r'[A-Za-z_]\w*', count )
+                if any( D_KEYWORD_NAMES.get( identifier, identifier ) not in member_names for identifier in identifiers if not identifier.startswith( 'VK_' )):
+                    return None
+                return re.sub( r'[A-Za-z_]\w*', lambda match: match.group() if match.group().startswith( 'VK_' ) else 'source.' + D_KEYWORD_NAMES.get( match.group(), match.group() ), count )
+
+            # ( size statement, copy statement ) of a member, None for members which are copied shallow with their struct
+            def memberCopy( member_type, member_name, member_len, member_names ):
+                if member_name == 'pNext':
+                    cast = '' if member_type in ( 'void*', 'const( void )*' ) else 'cast( typeof( target.pNext ))'
+                    return ( 'used = sizeNext( source.pNext, used );', 'target.pNext = {0}copyNext( arena, source.pNext );'.format( cast ))
+
+                if member_type in deep_structs:
+                    return ( 'used = deepCopySize( source.{0}, used );'.format( member_name ), 'deepCopyInto( arena, target.{0}, source.{0} );'.format( member_name ))
+
+                pointer = re.fullmatch( r'(?:const\( )?(\w+)(\*?)(?: \))?\*', member_type )    # ( pointed to type, pointer to pointers )
+                if not pointer:
+                    return None
+                base_type, inner_pointer = pointer.groups()
+                count = countExpression( member_len, member_names ) if member_len else '1'
+
+                if inner_pointer:
+                    if count is None or not member_len or member_len.count( ',' ) != 1: return None
+                    elif base_type == 'char' and member_len.endswith( ',null-terminated' ): copy = 'Strings'
+                    elif member_len.endswith( ',1' ): copy = 'Pointers'
+                    else: return None
+                    size_args, copy_args = 'source.{0}, {1}, used'.format( member_name, count ), 'arena, source.{0}, {1}'.format( member_name, count )
+                elif base_type == 'char' and member_len == 'null-terminated':
+                    copy, size_args, copy_args = 'String', 'source.{0}, used'.format( member_name ), 'arena, source.{0}'.format( member_name )
+                elif member_len == 'null-terminated' or count is None or ( base_type == 'void' and not member_len ):
+                    return None
+                else:
+                    copy = 'Bytes' if base_type == 'void' else 'Array'
+                    size_args, copy_args = 'source.{0}, {1}, used'.format( member_name, count ), 'arena, source.{0}, {1}'.format( member_name, count )
+
+                return ( 'used = size{0}( {1} );'.format( copy, size_args ), 'target.{0} = copy{1}( {2} );'.format( member_name, copy, copy_args ))
+
+            # structs with deep members, nested structs with deep members are deep members as well, iterate until no struct is added
+            member_copies = dict()
+            while True:
+                for name, category, members in copy_structs:
+                    if category != 'struct' or name in member_copies:
+                        continue
+                    member_names = { member_name for _, member_name, _ in members }
+                    copies = [ member_copy for member_copy in ( memberCopy( *member, member_names ) for member in members ) if member_copy ]
+                    if copies:
+                        member_copies[ name ] = copies
+                if len( member_copies ) == len( deep_structs ):
+                    break
+                deep_structs = set( member_copies )
+                member_copies = dict()
+
+            max_case_len = max(( len( s_type ) for name, s_type, _ in chain_structs if name in deep_structs ), default = 0 ) + len( 'case VkStructureType.:' )
+            def nextCases( statement ):
+                return '\n'.join( '{0}{0}{0}{1} {2}'.format( self.indent, 'case VkStructureType.{0}:'.format( s_type ).ljust( max_case_len ), statement.format( name ))
+                    for name, s_type, _ in chain_structs if name in deep_structs )
+
+            file_content = DEEP_COPY.format(
+                IND = self.indent,
+                PACKAGE_PREFIX  = self.genOpts.packagePrefix,
+                SIZE_NEXT_CASES = nextCases( 'return sizeArray( cast( const( {0} )* )next, 1, used );' ),
+                COPY_NEXT_CASES = nextCases( 'return copyArray( arena, cast( const( {0} )* )next, 1 );' ),
+                DEEP_COPY_FUNCS = ''.join( DEEP_COPY_STRUCT.format(
+                    IND = self.indent,
+                    STRUCT          = name,
+                    SIZE_MEMBERS    = '\n'.join( self.indent + size for size, _ in member_copies[ name ] ),
+                    COPY_MEMBERS    = '\n'.join( self.indent + copy for _, copy in member_copies[ name ] ),
+                ) for name, _, _ in copy_structs if name in member_copies ),
+            )
+
+            self.writeModule( 'deep_copy.d', file_content )
 
 
 
@@ -330,21 +1193,126 @@ class DGenerator( OutputGenerator ):
         # write dispatch_device.d file #
         # ---------------------------- #
 
+        # device loader of the enabled features, the device level functions are loaded if any feature or extension requiring them
+        # is enabled, core versions are enabled up to the passed api version, extensions if they are in the passed device or
+        # instance extension list. A function is loaded with its own name if a requirer of that name is enabled, else with the
+        # alias name of an enabled extension providing it, e.g. vkBindBufferMemory2KHR of VK_KHR_bind_memory2 on a 1.0 device
+        # consecutive functions of a feature with the same requirers of each name are grouped into one if else chain
+        # each extension of the conditions is looked up once in the enabled extension lists at the top of the loader
+        def enabledFeaturesLoader( indent ):
+            emitted_features = set( self.feature_order )
+            max_name_len = aligned_sections[ 'Load_D_Funcs' ][ 0 ]
+            extensions = dict()     # extension : enabled extension list, in the order of their first condition
+            def condition( requirer ):
+                if requirer.startswith( 'VK_VERSION_' ):
+                    return 'apiVersion >= VK_API_VERSION_' + requirer[ 11: ]
+                extensions[ requirer ] = 'enabledInstanceExtensions' if requirer in self.instance_extensions else 'enabledExtensions'
+                return requirer + '_enabled'
+
+            def loaderLine( name_len, fragments, proc_name ):
+                return '{0}vkGetDeviceProcAddr( device, "{1}" );'.format((( max_name_len - name_len ) * ' ' ).join( fragments ), proc_name )
+
+            result = []
+            joiner = '\n' + indent + self.indent
+            for feature in self.feature_order:
+                items = self.feature_content[ feature ][ 'Load_D_Funcs' ]
+                if not items:
+                    continue
+
+                blocks = []    # ( requirers of each name, lines of each name ), the function name first
+                for name_len, fragments in items:
+                    name = fragments[ 0 ]
+                    name_requirers = dict()
+                    for requirer, required_name in self.command_requirers.get( name, [ ( feature, name ) ] ):
+                        if requirer in emitted_features:
+                            name_requirers.setdefault( required_name, [] ).append( requirer )
+                    names = sorted( name_requirers.items() or [ ( name, [ feature ] ) ], key = lambda name_requirer: name_requirer[ 0 ] != name )
+
+                    requirers = [ group for _, group in names ]
+                    if blocks and blocks[ -1 ][ 0 ] == requirers:
+                        for lines, ( proc_name, _ ) in zip( blocks[ -1 ][ 1 ], names ):
+                            lines.append( loaderLine( name_len, fragments, proc_name ))
+                    else:
+                        blocks.append( ( requirers, [ [ loaderLine( name_len, fragments, proc_name ) ] for proc_name, _ in names ] ))
+
+                result.append( '\n{0}// {1}'.format( indent, feature ))
+                for requirers, name_lines in blocks:
+                    if 'VK_VERSION_1_0' in requirers[ 0 ]:
+                        result.append( indent + ( '\n' + indent ).join( name_lines[ 0 ] ))
+                    else:
+                        result.append( indent + ' else '.join( 'if( {0} ) {{{1}{2}\n{3}}}'.format( ' || '.join( condition( requirer ) for requirer in group ), joiner, joiner.join( lines ), indent )
+                            for group, lines in zip( requirers, name_lines )))
+
+            if extensions:
+                max_extension_len = max( len( extension ) for extension in extensions )
+                result.insert( 0, indent + '// extensions enabled for the device, each is looked up once\n' + indent + ( '\n' + indent ).join( 'const bool {0}_enabled{1} = isExtensionEnabled( "{0}", {2} );'.format( extension, ( max_extension_len - len( extension )) * ' ', extension_list )
+                    for extension, extension_list in extensions.items()))
+            return '\n'.join( result )
+
+        # with a shared dispatch table the function pointers are members of DispatchDeviceTable, which is loaded once per device
+        # and referenced by the DispatchDevice handle, its convenience functions forward to the function pointers of the table
+        shared_table = self.genOpts.sharedDispatchTable
+        dispatch_struct = 'DispatchDeviceTable' if shared_table else 'DispatchDevice'
+
+        # with enabled loaders the dispatch device loaders of only the enabled features are added to the loaders of all functions
+        enabled_loaders = self.genOpts.enabledLoaders
+        def enabledLoader( template ):
+            return template.format( IND = self.indent, DISPATCH_ENABLED_FUNCS = enabled_functions ) if enabled_loaders else ''
+        enabled_functions = enabledFeaturesLoader( self.indent * 2 ) if enabled_loaders else ''
+
         # functions file format string, substitute format tokens with accumulated section data
-        file_content = DISPATCH_DEVICE.format(
+        file_content = ( DISPATCH_DEVICE_TABLE if shared_table else DISPATCH_DEVICE ).format(
             IND = self.indent,
             PACKAGE_PREFIX              = self.genOpts.packagePrefix,
-            DISPATCH_MEMBER_FUNCS       = functionSection( 'Load_D_Funcs'     , self.indent * 2, 'Device'   ),
-            DISPATCH_CONVENIENCE_FUNCS  = functionSection( 'Conven_Funcs'     , self.indent ) + '\n' \
+            TRACE_IMPORT                = trace_import,
+            ENUMERATE_IMPORT            = enumerate_import,
+            DISPATCH_MEMBER_FUNCS       = DISPATCH_LOADER_LOOP.format( IND = self.indent ) if table_loaders else functionSection( 'Load_D_Funcs', self.indent * 2, 'Device' ),
+            IS_EXTENSION_ENABLED        = enabledLoader( IS_EXTENSION_ENABLED ),
+            DISPATCH_ENABLED_LOADER     = enabledLoader( DISPATCH_ENABLED_LOADER ),
+            TABLE_ENABLED_CREATE        = enabledLoader( TABLE_ENABLED_CREATE ),
+            TABLE_ENABLED_LOADER        = enabledLoader( TABLE_ENABLED_LOADER ),
+            HANDLE_ENABLED_CREATE       = enabledLoader( HANDLE_ENABLED_CREATE ),
+            HANDLE_ENABLED_LOADER       = enabledLoader( HANDLE_ENABLED_LOADER ),
+            DISPATCH_LOADER_TABLE       = DISPATCH_LOADER_TABLE.format( COUNT = len( tableNames( 'Load_D_Funcs' )),
+                                            OFFSETS = tableRows( [ '{0}.{1}.offsetof,'.format( dispatch_struct, name ) for name in tableNames( 'Load_D_Funcs' )], 1 )) if table_loaders else '',
+            DISPATCH_CONVENIENCE_FUNCS  = functionSection( 'Conven_Funcs'     , self.indent, dispatch_table = 'table.' if shared_table else '' ) + '\n' \
                                         + functionSection( 'Conven_Aliases'   , self.indent ),
             DISPATCH_FUNC_DECLARATIONS  = functionSection( 'Disp_Declarations', self.indent ) + '\n' \
                                         + functionSection( 'Disp_Aliases'     , self.indent ),
+            DISPATCH_QUEUE              = DISPATCH_QUEUE.format(
+                IND = self.indent,
+                QUEUE_MEMBER_FUNCS      = functionSection( 'Queue_Load_Funcs'    , self.indent * 2 ),
+                QUEUE_CONVENIENCE_FUNCS = functionSection( 'Queue_Conven_Funcs'  , self.indent ) + '\n' \
+                                        + functionSection( 'Queue_Conven_Aliases', self.indent ),
+                QUEUE_FUNC_DECLARATIONS = functionSection( 'Queue_Declarations'  , self.indent ) + '\n' \
+                                        + functionSection( 'Queue_Aliases'       , self.indent ),
+            ),
         )
 
 
-        # open, write and close functions.d file
-        with open( path.join( self.genOpts.directory, 'dispatch_device.d' ), 'w', encoding = 'utf-8' ) as d_module:
-            write( file_content, file = d_module )
+        # write dispatch_device.d file, skipped if its content did not change
+        self.writeModule( 'dispatch_device.d', file_content )
+
+
+
+        # ------------------------------ #
+        # write dispatch_instance.d file #
+        # ------------------------------ #
+
+        # instance level functions of one instance as members of DispatchInstance, instance level function are loaded as for functions.d
+        file_content = DISPATCH_INSTANCE.format(
+            IND = self.indent,
+            PACKAGE_PREFIX              = self.genOpts.packagePrefix,
+            TRACE_IMPORT                = trace_import,
+            ENUMERATE_IMPORT            = enumerate_import,
+            INSTANCE_MEMBER_FUNCS       = functionSection( 'Load_I_Funcs'       , self.indent * 2 ),
+            INSTANCE_CONVENIENCE_FUNCS  = functionSection( 'Inst_Conven_Funcs'  , self.indent ) + '\n' \
+                                        + functionSection( 'Inst_Conven_Aliases', self.indent ),
+            INSTANCE_FUNC_DECLARATIONS  = functionSection( 'Inst_Declarations'  , self.indent ) + '\n' \
+                                        + functionSection( 'Inst_Aliases'       , self.indent ),
+        )
+
+        self.writeModule( 'dispatch_instance.d', file_content )
 
 
 
@@ -354,28 +1322,17 @@ class DGenerator( OutputGenerator ):
 
         # helper function to construct AliasSequences of extension enums
         def platformProtectionAlias():
-            if self.platform_protection_order:
-                max_protect_len = len( max( self.platform_protection_order, key = lambda p: len( p )))
-                result = ''
-                for protection in self.platform_protection_order:
-                    result += 'alias {0} = AliasSeq!( {1} );\n'.format( protection[3:].ljust( max_protect_len - 3 ), self.platform_extension_protection[ protection ] )
-                return result
+            if not self.platform_protection_order:
+                return ''   # no platform extensions selected
+            max_protect_len = len( max( self.platform_protection_order, key = lambda p: len( p )))
+            return ''.join( 'alias {0} = AliasSeq!( {1} );\n'.format( protection[3:].ljust( max_protect_len - 3 ), self.platform_extension_protection[ protection ] )
+                for protection in self.platform_protection_order )
 
 
         # helper function to populate a (else) static if block with corresponding code
-        def platformExtensionSection( sections, indent = '', comment = '', Instance_or_Device = '' ):
-            result = ''
+        def platformExtensionSection( sections, indent = '', comment = '', Instance_or_Device = '', traced = False ):
+            result = []
             else_prefix  = ''
-            open_format  = ''
-            close_format = ''
-
-            # some sections include additional format strings which we must escape with these
-            if Instance_or_Device:
-                open_format  = '{'
-                close_format = '}'
-
-            # We want to merge Type_Definitions and Func_Type_Aliases
-            # hence we wrap each section parameter into a list
 
             joiner = '\n' + indent + self.indent
             for extension in self.platform_extension_order:
@@ -383,54 +1340,60 @@ class DGenerator( OutputGenerator ):
                 # hence we pass each section type as a list so we can combine several of them first
                 extension_section = []
                 for section in sections:
-                    extension_section += self.feature_content[ extension ][ section ]
+                    extension_section += sectionLines( extension, section, Instance_or_Device, traced = traced )
 
                 if extension_section:
-                    result += STATIC_IF_EXTENSION.format(
+                    result.append( STATIC_IF_EXTENSION.format(
                         IND             = indent,
                         EXTENSION       = extension[3:],
                         COMMENT         = comment,
-                        OPEN_FORMAT     = open_format,
                         ELSE_PREFIX     = else_prefix,
                         SECTIONS        = indent + self.indent + joiner.join( extension_section ),
-                        CLOSE_FORMAT    = close_format,
-                    )
+                    ))
                     else_prefix = 'else '
 
-            # some of the sections need formatting before being merged into one code block
-            # in these cases the substitute parameter will contain the corresponding term
-            if Instance_or_Device:
-                result = result.format( INSTANCE_OR_DEVICE = Instance_or_Device, instance_or_device = Instance_or_Device.lower())
-
-            return result[:-1]  # omit the final line break
+            return ''.join( result )[:-1]  # omit the final line break
 
 
         # platform_extensions file format string, substitute format tokens with accumulated section data
         file_content = PLATFORM_EXTENSIONS.format(
             IND = self.indent,
             PACKAGE_PREFIX              = self.genOpts.packagePrefix,
-            PLATFORM_EXTENSIONS         = 'enum {0};'.format( ';\nenum '.join( [ extension[3:] for extension in self.platform_extension_order ] )),
+            TRACE_IMPORT                = '\n{0}import {1}.trace;'.format( self.indent, self.genOpts.packagePrefix ) if trace_calls else '',
+            PLATFORM_EXTENSIONS         = ''.join( 'enum {0};\n'.format( extension[3:] ) for extension in self.platform_extension_order )[:-1],
             PLATFORM_PROTECTIONS        = platformProtectionAlias(),
+            DISPATCH_DEVICE_CONSTRUCTOR = ( DISPATCH_DEVICE_EXT_CREATE if shared_table else DISPATCH_DEVICE_EXT_CONSTRUCTOR ).format(
+                                            IND = self.indent, ENABLED_CREATE = enabledLoader( DISPATCH_DEVICE_EXT_ENABLED_CREATE )),
+            DISPATCH_ENABLED_LOADER     = DISPATCH_DEVICE_EXT_ENABLED_LOADER.format( IND = self.indent, DISPATCH_ENABLED_MEMBER_FUNCS =
+                                            platformExtensionSection( [ 'Load_D_Funcs' ], 5 * self.indent, ' : load dispatch device member function definitions', 'Device' )) if enabled_loaders else '',
             TYPE_DEFINITIONS            = platformExtensionSection( [ 'Type_Definitions', 'Func_Type_Aliases' ], 2 * self.indent, ' : types and function pointer type aliases' ),
             FUNC_DECLARATIONS           = platformExtensionSection( [ 'Func_Declarations' ] , 3 * self.indent, ' : function pointer decelerations' ),
-            INSTANCE_LEVEL_FUNCS        = platformExtensionSection( [ 'Load_I_Funcs'      ] , 3 * self.indent, ' : load instance level function definitions' ),
-            DEVICE_I_LEVEL_FUNCS        = platformExtensionSection( [ 'Load_D_Funcs'      ] , 3 * self.indent, ' : load instance based device level function definitions', 'Instance' ),
-            DEVICE_D_LEVEL_FUNCS        = platformExtensionSection( [ 'Load_D_Funcs'      ] , 3 * self.indent, ' : load device based device level function definitions'  , 'Device' ),
+            INSTANCE_LEVEL_FUNCS        = platformExtensionSection( [ 'Load_I_Funcs'      ] , 3 * self.indent, ' : load instance level function definitions', traced = trace_calls ),
+            DEVICE_I_LEVEL_FUNCS        = platformExtensionSection( [ 'Load_D_Funcs'      ] , 3 * self.indent, ' : load instance based device level function definitions', 'Instance', traced = trace_calls ),
+            DEVICE_D_LEVEL_FUNCS        = platformExtensionSection( [ 'Load_D_Funcs'      ] , 3 * self.indent, ' : load device based device level function definitions'  , 'Device', traced = trace_calls ),
             DISPATCH_MEMBER_FUNCS       = platformExtensionSection( [ 'Load_D_Funcs'      ] , 4 * self.indent, ' : load dispatch device member function definitions'     , 'Device' ),
             DISPATCH_CONVENIENCE_FUNCS  = platformExtensionSection( [ 'Conven_Funcs'      ] , 3 * self.indent, ' : dispatch device convenience member functions' ),
-            DISPATCH_FUNC_DECLARATIONS  = platformExtensionSection( [ 'Func_Declarations' ] , 3 * self.indent, ' : dispatch device member function pointer decelerations'  )
+            DISPATCH_FUNC_DECLARATIONS  = platformExtensionSection( [ 'Func_Declarations' ] , 3 * self.indent, ' : dispatch device member function pointer decelerations' , traced = trace_calls ),
+            INSTANCE_MEMBER_FUNCS       = platformExtensionSection( [ 'Load_I_Funcs'      ] , 4 * self.indent, ' : load dispatch instance member function definitions' ),
+            INSTANCE_CONVENIENCE_FUNCS  = platformExtensionSection( [ 'Inst_Conven_Funcs' ] , 3 * self.indent, ' : dispatch instance convenience member functions' ),
+            INSTANCE_FUNC_DECLARATIONS  = platformExtensionSection( [ 'Inst_Declarations' ] , 3 * self.indent, ' : dispatch instance member function pointer decelerations', traced = trace_calls ),
+            QUEUE_MEMBER_FUNCS          = platformExtensionSection( [ 'Queue_Load_Funcs'  ] , 4 * self.indent, ' : load dispatch queue member function definitions' ),
+            QUEUE_CONVENIENCE_FUNCS     = platformExtensionSection( [ 'Queue_Conven_Funcs' ], 3 * self.indent, ' : dispatch queue convenience member functions' ),
+            QUEUE_FUNC_DECLARATIONS     = platformExtensionSection( [ 'Queue_Declarations' ], 3 * self.indent, ' : dispatch queue member function pointer decelerations', traced = trace_calls ),
             )
 
-        with open( path.join( self.genOpts.directory, 'platform_extensions.d' ), 'w', encoding = 'utf-8' ) as d_module:
-            write( file_content, file = d_module )
+        self.writeModule( 'platform_extensions.d', file_content )
 
 
 
         # ------------------------------ #
         # write vulkan_lib_loader.d file #
         # ------------------------------ #
-        with open( path.join( self.genOpts.directory, 'vulkan_lib_loader.d' ), 'w', encoding = 'utf-8' ) as d_module:
-            write( LIB_LOADER.format( PACKAGE_PREFIX = self.genOpts.packagePrefix, IND = self.indent ), file = d_module )
+        self.writeModule( 'vulkan_lib_loader.d', LIB_LOADER.format( PACKAGE_PREFIX = self.genOpts.packagePrefix, IND = self.indent ))
+
+
+        # remove modules of a previous run with other features, options or without split modules, these would clash with the written ones
+        self.removeStaleModules()
 
 
         # write and close remaining tests data into tests.txt file
@@ -449,6 +1412,9 @@ class DGenerator( OutputGenerator ):
     def beginFeature( self, interface, emit ):
         OutputGenerator.beginFeature( self, interface, emit )
 
+        # features which are only included to resolve dependencies are not emitted, their platform is not required either
+        if not emit: return
+
         platform = interface.get( 'platform' )
         protection = self.platform_name_protection.get( platform, None )
 
@@ -481,8 +1447,24 @@ class DGenerator( OutputGenerator ):
             'Load_D_Funcs' : [],
             'Conven_Funcs' : [],
             'Conven_Aliases' : [],
+            'Inst_Declarations' : [],
+            'Inst_Aliases' : [],
+            'Inst_Conven_Funcs' : [],
+            'Inst_Conven_Aliases' : [],
+            'Queue_Load_Funcs' : [],
+            'Queue_Declarations' : [],
+            'Queue_Aliases' : [],
+            'Queue_Conven_Funcs' : [],
+            'Queue_Conven_Aliases' : [],
             'Disp_Declarations' : [],
-            'Disp_Aliases' : []
+            'Disp_Aliases' : [],
+            'Enum_Groups' : [],
+            'Chain_Structs' : [],
+            'Enum_Funcs' : [],
+            'Enum_Conven_Funcs' : [],
+            'Enum_Inst_Conven_Funcs' : [],
+            'Enum_Queue_Conven_Funcs' : [],
+            'Copy_Structs' : []
         }
         self.sections = dict( [ ( section, [] ) for section in self.ALL_SECTIONS ] )
 
@@ -533,19 +1515,9 @@ class DGenerator( OutputGenerator ):
         #    self.tests_file_content += '2 - {0} = {1}\n'.format( '1' if is_enum else '0', str(len(group_elem_requires)))
         #    printTree( self, type_alias )
 
-        SNAKE_NAME = re.sub( r'([0-9a-z_])([A-Z0-9][^A-Z0-9]?)', r'\1_\2', group_name ).upper()
-        #self.tests_file_content += group_name.ljust( 30 ) + ' : ' + SNAKE_NAME + '\n'
-
-        name_prefix = SNAKE_NAME
-        name_suffix = ''
-        expand_suffix_match = re.search( r'[A-Z][A-Z]+$', group_name )
-        if expand_suffix_match:
-            name_suffix = '_' + expand_suffix_match.group()
-            # Strip off the suffix from the prefix
-            name_prefix = SNAKE_NAME.rsplit( name_suffix, 1 )[ 0 ]
-            #self.tests_file_content += name_suffix + '\n'
-
-        #printTree( self, group_elem )
+        group = self.enum_groups[ group_name ]
+        name_prefix = group.name_prefix
+        name_suffix = group.name_suffix
 
         # scoped enums
         scoped_group = []
@@ -573,24 +1545,18 @@ class DGenerator( OutputGenerator ):
         # add grouped enums to global scope
         global_group = [ '' ]
 
-        # Get a list of nested 'enum' tags.
-        enums = group_elem.findall( 'enum' )
-
-        # Check for and report duplicates, and return a list with them
-        # removed.
-        enums = self.checkDuplicateEnums( enums )
-
         # source: cgenerator.py
-        # Loop over the nested 'enum' tags. Keep track of the min_value and
-        # maximum numeric values, if they can be determined; but only for
-        # core API enumerants, not extension enumerants. This is inferred
-        # by looking for 'extends' attributes.
+        # the enum group holds the required nested 'enum' tags with duplicates removed.
         #
         # vulkan-docs-v1.1.118 introduced an empty enum group (VkPipelineCompilerControlFlagBitsAMD)
-        # in this case required_enum_names will be empty and we simply exit this method, but only for enums.
-        required_enum_names = [ elem.get( 'name' ) for elem in enums if self.isEnumRequired( elem ) ]
-        if is_enum and not required_enum_names: return
-        max_global_len = len( max( required_enum_names, key = lambda name: len( name ))) if required_enum_names else 0
+        # in this case group.enums will be empty and we simply exit this method, but only for enums.
+        if is_enum and not group.enums: return
+
+        # ( name, numeric value or None for aliases ) of the group for the name conversions of enum_strings.d
+        if group.enums:
+            self.feature_content[ self.featureName ][ 'Enum_Groups' ].append(( group_name, [ ( name, enum_val ) for name, enum_val, _ in group.enums ] ))
+
+        max_global_len = max( len( name ) for name, _, _ in group.enums ) if group.enums else 0
         max_global_len = align( 5 + max_global_len, 2 * len( self.indent )) # len( 'enum ' ) = 5, len( '_BEGIN_RANGE' ) = 12
         max_scoped_len = max_global_len # global enums are one char longer than scoped enums, hence + 1
 
@@ -599,61 +1565,28 @@ class DGenerator( OutputGenerator ):
         scoped_alias = []
         global_alias = []
 
-        # we store the value range of enums as min_name and max_name
-        min_name = None
-
-        for elem in enums:
-
-            # Extension enumerates are only included if they are required
-            if self.isEnumRequired( elem ):
-                # Convert the value to an integer and use that to track min/max.
-                # Values of form -( number ) are accepted but nothing more complex.
-                # Should catch exceptions here for more complex constructs. Not yet.
-                ( enum_val, enum_str ) = self.enumToValue( elem, True )
-                name = elem.get( 'name' )
-
-                # as of version 1.2.170 two bitmasks have a bitwidth of 64
-                # (VkPipelineStageFlagBits2KHR and VkAccessFlags2KHR) requiring special treatment
-                # we need to catch all enum bitfield values ending with ULL and remove the final L
-                # unfortunately this is true for the enum VK_SAMPLER_YCBCR_RANGE_ITU_FUL as well
-                # so we also check if the current enum group is an enum or a bitfield
-                #
-                # The ULL postfix of VkFlags64 have been removed from vk.xml in version 1.2.174,
-                # but unnecessarily added back in version 1.3.222.
-                # This time we keep the code handling, but remove the whole ULL instead of only the last L
-                if not is_enum and enum_str.endswith( 'ULL' ):
-                    enum_str = enum_str[ : -3 ]
-
-                scoped_elem = '{0} = {1},'.format( ( self.indent + name ).ljust( max_scoped_len ), enum_str )
-                global_elem = '{0} = {1}.{2};'.format( ( 'enum ' + name ).ljust( max_global_len ), group_name, name )
-                if enum_val != None:
-                    scoped_group.append( scoped_elem )
-                    global_group.append( global_elem )
-                else:
-                    scoped_alias.append( scoped_elem )
-                    global_alias.append( global_elem )
-
-            # Extension enumerates are only included if they are requested
-            # in addExtensions or match defaultExtensions.
-            #if ( elem.get( 'extname' ) is None or
-            #    re.match( self.genOpts.addExtensions, elem.get( 'extname' )) is not None or
-            #    self.genOpts.defaultExtensions == elem.get( 'supported' )):
-            #    scoped_elem = '\n{0}{1} = {2},'.format( self.indent, name.ljust( max_scoped_len ), enum_str )
-            #    if scoped_elem not in scoped_elem_set:
-            #        scoped_elem_set.add( scoped_elem )
-            #        scoped_group += scoped_elem
-            #        global_group += '\nenum {0} = {1}.{2};'.format( name.ljust( max_global_len ), group_name, name )
-
-            if is_enum and enum_val != None and elem.get( 'extends' ) is None:
-                if min_name is None:
-                    min_name  = max_name  = name
-                    min_value = max_value = enum_val
-                elif enum_val < min_value:
-                    min_name  = name
-                    min_value = enum_val
-                elif enum_val > max_value:
-                    max_name  = name
-                    max_value = enum_val
+        for name, enum_val, enum_str in group.enums:
+
+            # as of version 1.2.170 two bitmasks have a bitwidth of 64
+            # (VkPipelineStageFlagBits2KHR and VkAccessFlags2KHR) requiring special treatment
+            # we need to catch all enum bitfield values ending with ULL and remove the final L
+            # unfortunately this is true for the enum VK_SAMPLER_YCBCR_RANGE_ITU_FUL as well
+            # so we also check if the current enum group is an enum or a bitfield
+            #
+            # The ULL postfix of VkFlags64 have been removed from vk.xml in version 1.2.174,
+            # but unnecessarily added back in version 1.3.222.
+            # This time we keep the code handling, but remove the whole ULL instead of only the last L
+            if not is_enum and enum_str.endswith( 'ULL' ):
+                enum_str = enum_str[ : -3 ]
+
+            scoped_elem = '{0} = {1},'.format( ( self.indent + name ).ljust( max_scoped_len ), enum_str )
+            global_elem = '{0} = {1}.{2};'.format( ( 'enum ' + name ).ljust( max_global_len ), group_name, name )
+            if enum_val != None:
+                scoped_group.append( scoped_elem )
+                global_group.append( global_elem )
+            else:
+                scoped_alias.append( scoped_elem )
+                global_alias.append( global_elem )
 
         if global_alias: global_group += global_alias
         if scoped_alias: scoped_group += scoped_alias
@@ -661,7 +1594,7 @@ class DGenerator( OutputGenerator ):
         # as of version 1.2.170 two bitmaks have a bitwidth of 64
         # (VkPipelineStageFlagBits2KHR and VkAccessFlags2KHR) requiring special treatment
         # we need to drop the _MAX_ENUM (final) entry, it is also not present in the c header version
-        if 'bitwidth' not in group_elem.attrib:
+        if group.bitwidth is None:
             scoped_group.append(( self.indent + name_prefix + '_MAX_ENUM' + name_suffix ).ljust( max_scoped_len ) + ' = 0x7FFFFFFF' )
             scoped_group.append( '}' )
             global_group.append( '{0} = {1}.{2}{3}{4};'.format( ( 'enum ' + name_prefix + '_MAX_ENUM' + name_suffix ).ljust( max_global_len ), group_name, name_prefix, '_MAX_ENUM' , name_suffix ))
@@ -873,61 +1806,39 @@ class DGenerator( OutputGenerator ):
     def genStruct( self, typeinfo, name, alias ):
         super().genStruct( typeinfo, name, alias )
 
-        elem = typeinfo.elem
-        category = elem.attrib[ 'category' ]
+        struct = self.structs[ name ]
+
+        # ( name, sType, names of the extended structs ) of structs with a fixed sType for the pNext chain utilities of struct_chain.d
+        s_type = next(( member.values for member in struct.members if member.name == 'sType' and member.values ), None )
+        if s_type:
+            self.feature_content[ self.featureName ][ 'Chain_Structs' ].append(( name, s_type, struct.extends ))
+
+        # ( name, category, [ ( type, name, len ) ] ) of all structs and unions for the deep copy functions of deep_copy.d
+        self.feature_content[ self.featureName ][ 'Copy_Structs' ].append(
+            ( name, struct.category, [ ( member.type, member.name, member.altlen or member.len ) for member in struct.members ] ))
 
         if self.sections[ 'struct' ]:
            self.appendSection( 'struct', '' )
 
-        self.appendSection( 'struct', '{0} {1} {{'.format( category, name ))
+        self.appendSection( 'struct', '{0} {1} {{'.format( struct.category, name ))
 
         member_type_length  = 0
         member_name_length  = 0
         member_type_names   = []
         member_bitfield     = []
 
-        has_member_scope    = False
-        has_member_module   = False
-        has_member_version  = False
-        has_member_function = False
-
-
-        for member in elem.findall( 'member' ):
-            member_name = member.find( 'name' ).text
-
-            # don't use D keyword module
-            if member_name == 'module':
-                member_name = 'Module'
-                has_member_module = True
-
-            # don't use D keyword scope
-            if member_name == 'scope':
-                member_name = 'Scope'
-                has_member_scope = True
-
-            # don't use D keyword version
-            if member_name == 'version':
-                member_name = 'Version'
-                has_member_version = True
-
-            # don't use D keyword function
-            if member_name == 'function':
-                member_name = 'Function'
-                has_member_function = True
+        for member in struct.members:
+            member_name = member.name   # D keywords module, scope, version and function are capitalized
 
             # member default values, not sure if this is supported for bitfields. If not move this into next else clause
-            if member.get( 'values' ):
-                member_name += ' = ' + member.get( 'values' )
+            if member.values:
+                member_name += ' = ' + member.values
 
             # v1.2.135 introduced a struct (VkAccelerationStructureInstanceKHR) with bitfields
             # DLang bitfields are implemented via std.bitmanip.bitfields, we need extra work to parse the xml data
-            member_type = getFullType( member ).strip()
-            member_type_bitcount = member_type.split(':')
-
-            if len( member_type_bitcount ) == 2:    # bitfields
-                # printTree( self, elem )
-                member_bitfield.append( ( member_type_bitcount[ 0 ] + ',', '"{0}",'.format( member_name ), member_type_bitcount[ 1 ] ) )
-                member_type_length = max( member_type_length, len( member_type ) + len( self.indent ))
+            if member.bitfield:                     # bitfields
+                member_bitfield.append( ( member.bitfield[ 0 ] + ',', '"{0}",'.format( member_name ), member.bitfield[ 1 ] ) )
+                member_type_length = max( member_type_length, len( member.type ) + len( self.indent ))
                 member_name_length = max( member_name_length, len( member_name ) + 4 )
             else:                                   # non-bitfield processing
                 if member_bitfield:                     # store code chunk
@@ -935,8 +1846,8 @@ class DGenerator( OutputGenerator ):
                     member_bitfield = []                        # now we can scan for and process another bitfield in this struct
 
                 # get the maximum string length of all member types
-                member_type_names.append( ( member_type, member_name ) )
-                member_type_length = max( member_type_length, len( member_type ) + 2 )
+                member_type_names.append( ( member.type, member_name ) )
+                member_type_length = max( member_type_length, len( member.type ) + 2 )
                 #member_type_length = align( max( member_type_length, len( member_type )), len( self.indent ))
 
 
@@ -959,21 +1870,11 @@ class DGenerator( OutputGenerator ):
                     #if c: self.tests_file_content += '{0}{1}{2}{3}{4},'.format( 2 * self.indent, t.ljust( member_type_length - len( self.indent )), n.ljust( member_name_length ), b, c )
                 self.appendSection( 'struct', '{0}));'.format( self.indent ))
 
-        if has_member_scope:
-            self.appendSection( 'struct', '{0}{1}{2};'.format( self.indent, 'alias'.ljust( member_type_length ), 'scope_ = Scope' ))
-            self.appendSection( 'struct', '{0}{1}{2};'.format( self.indent, 'alias'.ljust( member_type_length ), '_scope = Scope' ))
-
-        if has_member_module:
-            self.appendSection( 'struct', '{0}{1}{2};'.format( self.indent, 'alias'.ljust( member_type_length ), 'module_ = Module' ))
-            self.appendSection( 'struct', '{0}{1}{2};'.format( self.indent, 'alias'.ljust( member_type_length ), '_module = Module' ))
-
-        if has_member_version:
-            self.appendSection( 'struct', '{0}{1}{2};'.format( self.indent, 'alias'.ljust( member_type_length ), 'version_ = Version' ))
-            self.appendSection( 'struct', '{0}{1}{2};'.format( self.indent, 'alias'.ljust( member_type_length ), '_version = Version' ))
-
-        if has_member_function:
-            self.appendSection( 'struct', '{0}{1}{2};'.format( self.indent, 'alias'.ljust( member_type_length ), 'function_ = Function' ))
-            self.appendSection( 'struct', '{0}{1}{2};'.format( self.indent, 'alias'.ljust( member_type_length ), '_function = Function' ))
+        # alias the capitalized keyword members with their common D replacements keyword_ and _keyword
+        for keyword in ( 'scope', 'module', 'version', 'function' ):
+            if D_KEYWORD_NAMES[ keyword ] in struct.keywords:
+                self.appendSection( 'struct', '{0}{1}{2}_ = {3};'.format( self.indent, 'alias'.ljust( member_type_length ), keyword, D_KEYWORD_NAMES[ keyword ] ))
+                self.appendSection( 'struct', '{0}{1}_{2} = {3};'.format( self.indent, 'alias'.ljust( member_type_length ), keyword, D_KEYWORD_NAMES[ keyword ] ))
 
 
         self.appendSection( 'struct', '}' )
@@ -1037,6 +1938,29 @@ class DGenerator( OutputGenerator ):
 
 
     # functions
+    # enumerate helpers of a two call function as ( head, body ) fragments of the buffer and of the allocator variant, the body starts
+    # with the function name, which is qualified as for convenience functions when the fragments are joined in endFile
+    # convenience functions pass the dispatch handle member, the free functions of enumerate.d take all params before the count
+    def enumerateFragments( self, command, handle = None ):
+        if handle:  name, return_type, lead_params = command.name[ 2: ], 'VkResult  ', command.params[ 1:-2 ]
+        else:       name, return_type, lead_params = command.name[ 2 ].lower() + command.name[ 3: ], 'VkResult ', command.params[ :-2 ]
+
+        element_type = command.enumerate_type
+        params = ''.join( '{0} {1}, '.format( param.type, param.name ) for param in lead_params )
+        call = '{0}( {1}{2}itemCount, itemArray )'.format( command.name, handle + ', ' if handle else '', ''.join( param.name + ', ' for param in lead_params ))
+        returns_result = command.return_type == 'VkResult'
+        if returns_result:  lambda_head, lambda_body = '( itemCount, itemArray ) => ', call
+        else:               lambda_head, lambda_body = '( itemCount, itemArray ) { ', call + '; return VK_SUCCESS; }'
+
+        template_args = '!( {0}, {1} )( {2}'.format( element_type, 'true' if returns_result else 'false', lambda_head )
+        return [
+            ( '{0}{1}( {2}{3}[] buffer, out {3}[] items ) {{ return enumerateInto{4}'.format( return_type, name, params, element_type, template_args ),
+                '{0}, buffer, items ); }}'.format( lambda_body )),
+            ( '{0}{1}( Allocator )( {2}ref Allocator allocator, out {3}[] items ) if( isAllocator!Allocator ) {{ return enumerateAlloc{4}'.format(
+                return_type, name, params, element_type, template_args ), '{0}, allocator, items ); }}'.format( lambda_body )),
+        ]
+
+
     def genCmd( self, cmdinfo, name, alias ):
         super().genCmd( cmdinfo, name, alias )
 
@@ -1046,10 +1970,9 @@ class DGenerator( OutputGenerator ):
         #self.tests_file_content += 'max: {0}, len: {1}, name: {2}\n'.format( self.max_func_name_len, name_len, name )
 
 
-        # get params of this function, we require the first param type
-        # before we evaluate aliases, to determine if alias ends up in dispatch device
-        params  = cmdinfo.elem.findall( 'param' )
-        param_0_type = getFullType( params[ 0 ] )
+        # we require the first param type before we evaluate aliases, to determine if alias ends up in dispatch device
+        command = self.commands[ name ]
+        param_0_type = command.dispatch_type
 
 
         # alias global and DispatchDevice functions
@@ -1057,101 +1980,128 @@ class DGenerator( OutputGenerator ):
 
             # alias global scope functions
             self.feature_content[ self.featureName ][ 'Func_Aliases' ].append(
-                ( 'alias {0}{{LJUST_NAME}} = {1};'.format( name, alias ), name_len ) )
+                ( name_len, ( 'alias ' + name, ' = {0};'.format( alias ))))
 
             # alias dispatch device functions and partially device scope vulkan funcs (for VkDevice and VkCommandBuffer)
             if param_0_type in ( 'VkDevice', 'VkCommandBuffer' ):
                 self.feature_content[ self.featureName ][ 'Conven_Aliases' ].append(
-                    ( 'alias {0}{{LJUST_NAME}} = {1};'.format( name[2:], alias[2:] ), name_len ) )
+                    ( name_len, ( 'alias ' + name[2:], ' = {0};'.format( alias[2:] ))))
                 self.feature_content[ self.featureName ][ 'Disp_Aliases' ].append(
-                    ( 'alias {0}{{LJUST_NAME}} = {1};'.format( name, alias ), name_len ) )
+                    ( name_len, ( 'alias ' + name, ' = {0};'.format( alias ))))
                 self.max_d_func_name_len = max( self.max_d_func_name_len, name_len )
 
-            # second part of device scope vulkan funcs (for VkQueue, for which no convenience fucs exist)
+            # second part of device scope vulkan funcs (for VkQueue, for which convenience fucs exist only in DispatchQueue)
             elif param_0_type == 'VkQueue':
                 self.feature_content[ self.featureName ][ 'Disp_Aliases' ].append(
-                    ( 'alias {0}{{LJUST_NAME}} = {1};'.format( name, alias ), name_len ) )
+                    ( name_len, ( 'alias ' + name, ' = {0};'.format( alias ))))
+                self.feature_content[ self.featureName ][ 'Queue_Conven_Aliases' ].append(
+                    ( name_len, ( 'alias ' + name[2:], ' = {0};'.format( alias[2:] ))))
+                self.feature_content[ self.featureName ][ 'Queue_Aliases' ].append(
+                    ( name_len, ( 'alias ' + name, ' = {0};'.format( alias ))))
                 self.max_d_func_name_len = max( self.max_d_func_name_len, name_len )
+                self.max_q_func_name_len = max( self.max_q_func_name_len, name_len )
+
+            # alias dispatch instance functions and their convenience functions (for VkInstance and VkPhysicalDevice)
+            elif param_0_type in ( 'VkInstance', 'VkPhysicalDevice' ):
+                self.feature_content[ self.featureName ][ 'Inst_Conven_Aliases' ].append(
+                    ( name_len, ( 'alias ' + name[2:], ' = {0};'.format( alias[2:] ))))
+                self.feature_content[ self.featureName ][ 'Inst_Aliases' ].append(
+                    ( name_len, ( 'alias ' + name, ' = {0};'.format( alias ))))
+                self.max_di_func_name_len = max( self.max_di_func_name_len, name_len )
+
+            # alias the free enumerate helpers, the enumerate convenience functions are aliased with the convenience functions above
+            if alias in self.commands and self.commands[ alias ].enumerate_type:
+                self.feature_content[ self.featureName ][ 'Enum_Funcs' ].append( 'alias {0}{1} = {2}{3};'.format( name[ 2 ].lower(), name[ 3: ], alias[ 2 ].lower(), alias[ 3: ] ))
 
             return  # its either alias or full functions
 
 
         # get and modify the return type to align functions for better readability
-        proto = cmdinfo.elem.find( 'proto' )
-        return_type = getFullType( proto ).strip()
+        return_type = command.return_type
         do_return = ''
         if return_type == 'void':   return_type = 'void    '
         else:                       do_return = 'return '
 
 
-        # helper to catch and replace parameter names which are DLang keywords (currently only version)
-        def replaceKeyword( name ):
-            if name == 'version': return 'Version'
-            elif name == 'module' : return 'Module'
-            elif name == 'function' : return 'Function'
-            else: return name
-
-
-        # a parameter consist of a type and a name, here we merge all parameters into a list
-        joined_params = ', '.join( getFullType( param ).strip() + ' ' + replaceKeyword( param.find( 'name' ).text ) for param in params )
+        # construct function pointer prototypes, declarations and keep track of each function name length for aligning purpose
+        # function items are stored as tuple of ( func name length, fragments ), when rendering the sections in endFile
+        # the fragments are joined with the padding which aligns the function name to the longest one of the section
+        func_type_name = ( 'alias PFN_' + name, ' = {0}  function( {1} );'.format( return_type, command.joined_params ))
+        self.feature_content[ self.featureName ][ 'Func_Type_Aliases' ].append( ( name_len, func_type_name ))
+        self.feature_content[ self.featureName ][ 'Func_Declarations' ].append( ( name_len, ( 'PFN_' + name, ' {0};'.format( name ))))
 
 
-        # construct function pointer prototypes, declarations and keep track of each function name length for aligning purpose
-        # some of the function items are stored as tuple of ( func item string, func name length ), we use the latter for alignment
-        # the other function items are store as func item string, their alignment parameter is the same as of their tuple predecessors
-        func_type_name = 'alias PFN_{0}{{LJUST_NAME}} = {1}  function( {2} );'.format( name, return_type, joined_params )
-        self.feature_content[ self.featureName ][ 'Func_Type_Aliases' ].append( ( func_type_name, name_len ) )
-        self.feature_content[ self.featureName ][ 'Func_Declarations' ].append( 'PFN_{0}{{LJUST_NAME}} {0};'.format( name ))
+        # loader function fragments: vkFuncName = cast( PFN_vkFuncName ) vkGet...ProcAddr( ..., "vkFuncName" );
+        # the proc address function call is appended in endFile, device level functions are loaded from instance or device
+        loader_func = ( name, ' = cast( PFN_{0}'.format( name ), ' ) ' )
 
 
         # ignore vkGetInstanceProcAddr, it must be loaded from implementation lib
-        if name == 'vkGetInstanceProcAddr': pass
+        if command.level is None: pass
 
 
         # construct global level functions, which are used to parametrize and create a VkInstance
-        elif param_0_type not in ( 'VkInstance', 'VkPhysicalDevice', 'VkDevice', 'VkQueue', 'VkCommandBuffer' ):
-            self.feature_content[ self.featureName ][ 'Load_G_Funcs' ].append(
-                ( '{0}{{LJUST_NAME}} = cast( PFN_{0}{{LJUST_NAME}} ) vkGetInstanceProcAddr( null, "{0}" );'.format( name ), name_len ) )
+        elif command.level == 'global':
+            self.feature_content[ self.featureName ][ 'Load_G_Funcs' ].append( ( name_len, loader_func ))
             self.max_g_func_name_len = max( self.max_g_func_name_len, name_len )
 
 
-        # construct loader for instance level functions
-        # vkGetDeviceProcAddr is an exception as it is an instance level function with para_0_type == 'VkDevice'
-        elif param_0_type in ( 'VkPhysicalDevice', 'VkInstance' ) or name == 'vkGetDeviceProcAddr':
-            self.feature_content[ self.featureName ][ 'Load_I_Funcs' ].append(
-                ( '{0}{{LJUST_NAME}} = cast( PFN_{0}{{LJUST_NAME}} ) vkGetInstanceProcAddr( instance, "{0}" );'.format( name ), name_len ) )
+        # construct loader for instance level functions, including vkGetDeviceProcAddr, as well as dispatch instance convenience functions
+        elif command.level == 'instance':
+            self.feature_content[ self.featureName ][ 'Load_I_Funcs' ].append( ( name_len, loader_func ))
+            self.feature_content[ self.featureName ][ 'Inst_Declarations' ].append( ( name_len, ( 'PFN_' + name, ' {0};'.format( name ))))
             self.max_i_func_name_len = max( self.max_i_func_name_len, name_len )
+            self.max_di_func_name_len = max( self.max_di_func_name_len, name_len )
+
+            # create VkInstance and VkPhysicalDevice convenience functions for DispatchInstance, stored as fragments as well
+            if param_0_type in ( 'VkInstance', 'VkPhysicalDevice' ):
+                convenience_head = '{0}  {1}( {2} ) {{ {3}'.format( return_type, name[2:], command.conven_params, do_return ).replace( '(  )', '()' )
+                convenience_func = ( convenience_head, '{0}( {1}{2} ); }}'.format( name, 'vkInstance' if param_0_type == 'VkInstance' else 'physicalDevice', command.conven_args ))
+                self.feature_content[ self.featureName ][ 'Inst_Conven_Funcs' ].append( convenience_func )
 
 
         # construct loader for device and instance based device level functions as well as dispatch device convenience functions
         else: # param_0_type in ( 'VkDevice', 'VkQueue', 'VkCommandBuffer' ):
-            self.feature_content[ self.featureName ][ 'Load_D_Funcs' ].append(
-                ( '{0}{{LJUST_NAME}} = cast( PFN_{0}{{LJUST_NAME}} ) vkGet{{{{INSTANCE_OR_DEVICE}}}}ProcAddr( {{{{instance_or_device}}}}, "{0}" );'.format( name ), name_len ) )
-            self.feature_content[ self.featureName ][ 'Disp_Declarations'   ].append( 'PFN_{0}{{LJUST_NAME}} {0};'.format( name ))
+            self.feature_content[ self.featureName ][ 'Load_D_Funcs' ].append( ( name_len, loader_func ))
+            self.feature_content[ self.featureName ][ 'Disp_Declarations'   ].append( ( name_len, ( 'PFN_' + name, ' {0};'.format( name ))))
             self.max_d_func_name_len = max( self.max_d_func_name_len, name_len )
 
-            # for convenience functions we remove the first parameter if it is a VkDevice or VkCommandBuffer
-            # additionally we remove the const( VkAllocationCallbacks )* pAllocator parameter
-            # arguments are just the parameter names without their types, they will be used with the vk... member functions
-            # VkDevice and VkAllocationCallbacks are both supplied by the DispatchDevice
-            joined_args = ''
-            if len( params[1:] ):
-                joined_args = ', ' + ', '.join( replaceKeyword( param.find( 'name' ).text ) for param in params[1:] )
-            joined_params = ', '.join( getFullType( param ).strip() + ' ' + replaceKeyword( param.find( 'name' ).text )
-                for param in params[1:] if not getFullType( param ).strip().startswith( 'const( VkAllocationCallbacks )*' ))
+            # convenience functions are stored as fragments, which are joined with the qualifier of the forwarded function pointer
+            # in endFile, empty for function pointer members of the dispatch device and 'table.' for a shared dispatch table
+            convenience_head = '{0}  {1}( {2} ) {{ {3}'.format( return_type, name[2:], command.conven_params, do_return ).replace( '(  )', '()' )
 
             # create VkDevice convenience functions for DispatchDevice
             if param_0_type == 'VkDevice':
-                convenience_func = '{0}  {1}( {2} ) {{ {3}{4}( vkDevice{5} ); }}'.format(
-                    return_type, name[2:], joined_params, do_return, name, joined_args ).replace( '(  )', '()' )
+                convenience_func = ( convenience_head, '{0}( vkDevice{1} ); }}'.format( name, command.conven_args ))
                 self.feature_content[ self.featureName ][ 'Conven_Funcs' ].append( convenience_func )
 
             # create VkCommandBuffer convenience functions for DispatchDevice
             elif param_0_type == 'VkCommandBuffer':
-                convenience_func = '{0}  {1}( {2} ) {{ {3}{4}( commandBuffer{5} ); }}'.format(
-                    return_type, name[2:], joined_params, do_return, name, joined_args ).replace( '(  )', '()' )
+                convenience_func = ( convenience_head, '{0}( commandBuffer{1} ); }}'.format( name, command.conven_args ))
                 self.feature_content[ self.featureName ][ 'Conven_Funcs' ].append( convenience_func )
 
+            # create VkQueue loaders, declarations and convenience functions for DispatchQueue
+            elif param_0_type == 'VkQueue':
+                convenience_func = ( convenience_head, '{0}( vkQueue{1} ); }}'.format( name, command.conven_args ))
+                self.feature_content[ self.featureName ][ 'Queue_Conven_Funcs' ].append( convenience_func )
+                self.feature_content[ self.featureName ][ 'Queue_Load_Funcs' ].append( ( name_len, loader_func ))
+                self.feature_content[ self.featureName ][ 'Queue_Declarations' ].append( ( name_len, ( 'PFN_' + name, ' {0};'.format( name ))))
+                self.max_q_func_name_len = max( self.max_q_func_name_len, name_len )
+
+
+        # enumerate helpers of two call functions as free functions of enumerate.d and convenience functions of the dispatch structs
+        if command.enumerate_type and command.level:
+            self.feature_content[ self.featureName ][ 'Enum_Funcs' ] += [ ''.join( fragments ) for fragments in self.enumerateFragments( command ) ]
+            enum_section, handle = {
+                'VkInstance'        : ( 'Enum_Inst_Conven_Funcs', 'vkInstance' ),
+                'VkPhysicalDevice'  : ( 'Enum_Inst_Conven_Funcs', 'physicalDevice' ),
+                'VkDevice'          : ( 'Enum_Conven_Funcs', 'vkDevice' ),
+                'VkCommandBuffer'   : ( 'Enum_Conven_Funcs', 'commandBuffer' ),
+                'VkQueue'           : ( 'Enum_Queue_Conven_Funcs', 'vkQueue' ),
+            }.get( param_0_type, ( None, None ))
+            if enum_section and command.name != 'vkGetDeviceProcAddr':
+                self.feature_content[ self.featureName ][ enum_section ] += self.enumerateFragments( command, handle )
+
 
 
 # specify options for our generator
@@ -1161,11 +2111,398 @@ class DGeneratorOptions( GeneratorOptions ):
         self.namePrefix         = kwargs.pop( 'namePrefix' )
         self.genFuncPointers    = kwargs.pop( 'genFuncPointers' )
         self.indentString       = kwargs.pop( 'indentString' )
+        self.splitModules       = kwargs.pop( 'splitModules' )
+        self.lazyLoading        = kwargs.pop( 'lazyLoading' )
+        self.tableLoaders       = kwargs.pop( 'tableLoaders' )
+        self.sharedDispatchTable = kwargs.pop( 'sharedDispatchTable' )
+        self.traceCalls         = kwargs.pop( 'traceCalls' )
+        self.enabledLoaders     = kwargs.pop( 'enabledLoaders' )
+        self.mockIcd            = kwargs.pop( 'mockIcd' )
+        self.enumStrings        = kwargs.pop( 'enumStrings' )
+        self.formatTables       = kwargs.pop( 'formatTables' )
+        self.structChains       = kwargs.pop( 'structChains' )
+        self.enumerateHelpers   = kwargs.pop( 'enumerateHelpers' )
+        self.deepCopy           = kwargs.pop( 'deepCopy' )
+        self.callProfile        = kwargs.pop( 'callProfile' )            # function name : call count, empty keeps the feature order
+        self.featureNames       = kwargs.pop( 'featureNames' )           # core features to generate, default all
+        self.extensionNames     = kwargs.pop( 'extensionNames' )         # extensions to generate, default all of defaultExtensions
+        self.removeExtensionNames = kwargs.pop( 'removeExtensionNames' ) # extensions not to generate
+        self.emitExtensionNames = kwargs.pop( 'emitExtensionNames' )     # extensions to emit, default all generated ones
         self.current_xml        = ''
         super().__init__( *args, **kwargs )
 
 
 
+# read a call profile, either a json object or csv lines of function name and call count, into a dict of name : count
+# csv lines without an integer count, e.g. a header, as well as empty and # comment lines are skipped
+def readCallProfile( file_name ):
+    with open( file_name, encoding = 'utf-8' ) as profile_file:
+        content = profile_file.read()
+
+    if content.lstrip().startswith( '{' ):
+        return { name : int( count ) for name, count in json.loads( content ).items() }
+
+    profile = dict()
+    for line in content.splitlines():
+        fields = [ field.strip() for field in line.split( ',' ) ]
+        if len( fields ) >= 2 and not fields[ 0 ].startswith( '#' ) and re.fullmatch( r'\d+', fields[ 1 ] ):
+            profile[ fields[ 0 ]] = profile.get( fields[ 0 ], 0 ) + int( fields[ 1 ] )
+    return profile
+
+
+# 32 bit FNV-1a hash of a name with seed, enum_strings.d computes the same hash to look up names
+def nameHash( name, seed ):
+    hash = 2166136261 ^ seed
+    for byte in name.encode():
+        hash = (( hash ^ byte ) * 16777619 ) & 0xFFFFFFFF
+    return hash
+
+
+# perfect hash of names with hash and displace: the first hash distributes the names into buckets of about three names,
+# starting with the largest bucket a displacement is searched, which maps the second hash of each name in the bucket
+# to a distinct free slot. Returns the displacement of each bucket and the name of each slot, None for free slots
+# if no displacement is found, which can happen for very few slots, the search is repeated with one more slot
+def perfectHash( names ):
+    hashes  = [ ( nameHash( name, 0 ), nameHash( name, 0x9E3779B9 )) for name in names ]
+    buckets = [ [] for _ in range( max( 1, ( len( names ) + 2 ) // 3 )) ]
+    for index, ( h1, _ ) in enumerate( hashes ):
+        buckets[ h1 % len( buckets ) ].append( index )
+
+    def displace( slots ):
+        displacements, slot_names = [ 0 ] * len( buckets ), [ None ] * slots
+        for bucket in sorted( range( len( buckets )), key = lambda bucket : ( -len( buckets[ bucket ] ), bucket )):
+            terms = [ ( hashes[ index ][ 1 ] % slots, 1 + hashes[ index ][ 0 ] % ( slots - 1 ) if slots > 1 else 0 ) for index in buckets[ bucket ]]
+            for displacement in range( slots * slots ):
+                d0, d1 = divmod( displacement, slots )
+                positions = [ ( f1 + d0 * f2 + d1 ) % slots for f1, f2 in terms ]
+                if len( set( positions )) == len( positions ) and all( slot_names[ position ] is None for position in positions ): break
+            else:
+                return None
+            displacements[ bucket ] = displacement
+            for index, position in zip( buckets[ bucket ], positions ):
+                slot_names[ position ] = names[ index ]
+        return displacements, slot_names
+
+    slots = len( names )
+    while True:
+        result = displace( slots )
+        if result: return result
+        slots += 1
+
+
+# regular expression matching exactly the passed names, vulkan-docs matches nothing with _nomatch_^
+def namesPattern( names ):
+    if not names:
+        return '_nomatch_^'
+    return '^({0})$'.format( '|'.join( re.escape( name ) for name in sorted( names )))
+
+
+# parse a depends expression of vk.xml, e.g. (VK_KHR_a+VK_KHR_b),VK_VERSION_1_1, into a list of alternative name sets
+# + requires both operands, "," one of them, parentheses disambiguate mixed operators
+# feature qualified names like VK_KHR_a::feature are reduced to the extension name
+def dependsAlternatives( expression ):
+    tokens = re.findall( r'[\w:]+|[+,()]', expression )
+    position = 0
+
+    def parseOperand():
+        nonlocal position
+        token = tokens[ position ]
+        position += 1
+        if token == '(':
+            alternatives = parseExpression()
+            position += 1   # skip )
+            return alternatives
+        return [ { token.split( '::' )[ 0 ] } ]
+
+    def parseExpression():
+        nonlocal position
+        alternatives = parseOperand()
+        while position < len( tokens ) and tokens[ position ] in '+,':
+            operator = tokens[ position ]
+            position += 1
+            operand = parseOperand()
+            if operator == '+': alternatives = [ a | b for a in alternatives for b in operand ]
+            else:               alternatives = alternatives + operand
+        return alternatives
+
+    return parseExpression() if tokens else [ set() ]
+
+
+# alternative dependency sets of an extension element, from depends or from the older requires and requiresCore attributes
+def extensionDependencies( extension ):
+    if extension.get( 'depends' ):
+        return dependsAlternatives( extension.get( 'depends' ))
+
+    dependencies = set( name for name in ( extension.get( 'requires' ) or '' ).split( ',' ) if name )
+    if extension.get( 'requiresCore' ):
+        dependencies.add( 'VK_VERSION_' + extension.get( 'requiresCore' ).replace( '.', '_' ))
+    return [ dependencies ]
+
+
+# commands and types required by the passed feature and extension elements, types are followed through their
+# requires, bitvalues and alias attributes as well as the types of their members and of the command params
+def requiredNames( registry, features ):
+    commands = set()
+    types = set()
+    pending = []
+    for feature in features:
+        for required in feature.findall( 'require/command' ):
+            commands.add( required.get( 'name' ))
+        for required in feature.findall( 'require/type' ):
+            pending.append( required.get( 'name' ))
+
+    for name in commands:
+        if name in registry.cmddict:
+            pending += [ type_elem.text for type_elem in registry.cmddict[ name ].elem.iter( 'type' ) ]
+
+    while pending:
+        name = pending.pop()
+        if name in types or name not in registry.typedict:
+            continue
+        types.add( name )
+        elem = registry.typedict[ name ].elem
+        pending += [ elem.get( attr ) for attr in ( 'requires', 'bitvalues', 'alias' ) if elem.get( attr ) ]
+        pending += [ type_elem.text for type_elem in elem.iter( 'type' ) if type_elem is not elem ]
+
+    return commands, types
+
+
+# invalid -feature, -extension, -removeExtensions or -emitExtensions names, reported as argument error
+class SelectionError( ValueError ):
+    pass
+
+
+# restrict the features and extensions of the registry to the ones passed with -feature, -extension, -removeExtensions
+# and -emitExtensions, including everything they depend on, so that the generated modules still compile
+# core features include all lower versions, extension dependencies with alternatives prefer extensions over additional core versions
+# with -feature and without -extension the default extensions which depend on other core versions are dropped instead
+# extensions which depend on removed extensions are removed as well
+# the selection is set as exact name patterns into the generator options, returns a report of the selection
+def selectFeatures( registry, options ):
+    def supported( elem, attr ):
+        return options.apiname in ( elem.get( attr ) or options.apiname ).split( ',' )
+
+    all_features = { elem.get( 'name' ) : tuple( int( n ) for n in elem.get( 'number' ).split( '.' ))
+        for elem in registry.tree.findall( 'feature' ) if supported( elem, 'api' ) }
+    all_extensions = { elem.get( 'name' ) : elem for elem in registry.tree.findall( 'extensions/extension' ) if supported( elem, 'supported' ) }
+    default_extensions = [ name for name, elem in all_extensions.items() if options.defaultExtensions in ( elem.get( 'supported' ) or '' ).split( ',' ) ]
+
+    unknown = [ name for name in options.featureNames if name not in all_features ] \
+            + [ name for name in options.extensionNames + options.removeExtensionNames + options.emitExtensionNames if name not in all_extensions ]
+    if unknown:
+        raise SelectionError( 'unknown or unsupported features or extensions: {0}'.format( ', '.join( unknown )))
+
+    # the extensions of candidates whose dependencies can be met with met_features and the other returned extensions
+    def satisfiableExtensions( candidates, met_features ):
+        satisfiable = set( candidates )
+        changed = True
+        while changed:
+            changed = False
+            for name in sorted( satisfiable ):
+                if not any( alternative <= satisfiable | met_features for alternative in extensionDependencies( all_extensions[ name ] )):
+                    satisfiable.remove( name )
+                    changed = True
+        return satisfiable
+
+    # remove extensions and all extensions which cannot be satisfied without them
+    kept = set( all_extensions ) - set( options.removeExtensionNames )
+    available = satisfiableExtensions( kept, set( all_features ))
+    removed_dependents = sorted( kept - available )
+
+    # features up to the highest requested version, all features if none is requested
+    features = set( options.featureNames or all_features )
+    def addFeature( name ):
+        features.update( feature for feature, number in all_features.items() if number <= all_features[ name ] )
+    for name in list( features ):
+        addFeature( name )
+
+    # dependency closure of the requested extensions, missing features are more expensive than missing extensions
+    # dependencies are met with the passed extensions and features, the features are added to the selection
+    def extensionClosure( requested, met_extensions, met_features ):
+        included = set()
+        pending = [ name for name in requested if name in met_extensions ]
+        while pending:
+            name = pending.pop()
+            if name in included:
+                continue
+            included.add( name )
+            satisfiable = [ alternative for alternative in extensionDependencies( all_extensions[ name ] ) if alternative <= met_extensions | met_features ]
+            alternative = min( satisfiable, key = lambda alternative: sum( 0 if dependency in included | features else 100 if dependency in all_features else 1 for dependency in alternative ))
+            for dependency in alternative:
+                if dependency in all_features:
+                    addFeature( dependency )
+                else:
+                    pending.append( dependency )
+        return included
+
+    # requested extensions raise the features to the versions they depend on, default extensions do so only without -feature
+    if options.extensionNames or not options.featureNames:
+        extensions = extensionClosure( options.extensionNames or default_extensions, available, set( all_features ))
+    else:
+        extensions = extensionClosure( default_extensions, satisfiableExtensions( available, set( features )), set( features ))
+    emit_extensions = extensionClosure( options.emitExtensionNames, available, set( all_features )) & extensions if options.emitExtensionNames else extensions
+
+    options.versions            = namesPattern( features )
+    options.emitversions        = namesPattern( features )
+    options.defaultExtensions   = None
+    options.addExtensions       = namesPattern( extensions )
+    options.removeExtensions    = None
+    options.emitExtensions      = namesPattern( emit_extensions )
+
+    # count the commands and types dropped in comparison to generating all features and default extensions
+    emitted = [ elem for elem in registry.tree.findall( 'feature' ) if elem.get( 'name' ) in features ] \
+            + [ all_extensions[ name ] for name in emit_extensions ]
+    full = [ elem for elem in registry.tree.findall( 'feature' ) if elem.get( 'name' ) in all_features ] \
+         + [ all_extensions[ name ] for name in default_extensions ]
+    emitted_commands, emitted_types = requiredNames( registry, emitted )
+    full_commands, full_types = requiredNames( registry, full )
+
+    report = 'Selected {0} of {1} features and {2} of {3} extensions, {4} emitted, dropped {5} of {6} commands and {7} of {8} types'.format(
+        len( features ), len( all_features ), len( extensions ), len( default_extensions ), len( emit_extensions ),
+        len( full_commands - emitted_commands ), len( full_commands ), len( full_types - emitted_types ), len( full_types ))
+    if removed_dependents:
+        report += '\nRemoved extensions depending on removed extensions: {0}'.format( ', '.join( removed_dependents ))
+    return report
+
+
+# run the generator for one xml file and return the ( module file name, content changed ) list of the written modules
+# if a cache directory is passed the registry data collected by the generator
+# is stored there and restored in subsequent runs with the same input, skipping xml parsing and registry traversal
+def generate( options, xml_file, cache_dir = None, timing = False, profile_file = None ):
+    if profile_file:
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall( generate, options, xml_file, cache_dir, timing )
+        finally:
+            profiler.dump_stats( profile_file )
+
+    gen = DGenerator()
+    if timing:
+        gen.timeCallbacks()
+
+    start = time.perf_counter()
+    if cache_dir:
+        cache_file = path.join( cache_dir, '{0}-{1}.pickle'.format( options.current_xml, registryCacheKey( xml_file, options )))
+        restored = gen.loadState( cache_file )
+        start = gen.addTime( 'cache load', start )
+        if restored:
+            gen.genOpts = options
+            gen.beginFile( options )
+            gen.endFile()
+            if gen.selection_report:
+                print( gen.selection_report )
+            return gen.written_modules, generatorTimings( gen )
+        gen.cache_file = cache_file
+
+    reg = Registry( gen, options )
+    tree = etree.parse( xml_file )
+    start = gen.addTime( 'xml parse', start )
+    reg.loadElementTree( tree )
+    start = gen.addTime( 'registry index', start )
+
+    # selection of features and extensions, video.xml is always generated completely
+    if options.current_xml == 'vk' and ( options.featureNames or options.extensionNames or options.removeExtensionNames or options.emitExtensionNames ):
+        gen.selection_report = selectFeatures( reg, options )
+        start = gen.addTime( 'feature selection', start )
+    reg.apiGen()
+    gen.addTime( 'apiGen', start )
+    if gen.selection_report:
+        print( gen.selection_report )
+    return gen.written_modules, generatorTimings( gen )
+
+
+# collect the timings of a generator run into a picklable dict, the phases are listed in the order of the run
+# the apiGen time is split into the timed callbacks and the remaining registry traversal and dependency resolution
+def generatorTimings( gen ):
+    phases = dict( gen.timings )
+    if 'apiGen' in phases:
+        api_gen = phases.pop( 'apiGen' )
+        phases[ 'registry traversal' ] = api_gen - sum( seconds for phase, seconds in phases.items() if phase not in ( 'cache load', 'xml parse', 'registry index', 'feature selection', 'cache save' ))
+
+    peak_rss = None
+    if resource:
+        # ru_maxrss is reported in kilobytes on linux and in bytes on macos
+        peak_rss = resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss * ( 1 if sys.platform == 'darwin' else 1024 )
+
+    return { 'phases' : list( phases.items()), 'modules' : gen.module_timings, 'peak_rss' : peak_rss }
+
+
+# generate bindings for several xml files, passed in as list of ( current_xml, xml_file ) tuples
+# each xml file is processed by its own registry and generator, these share nothing and write distinct modules,
+# with jobs > 1 they run concurrently in a process pool, the output is the same as with sequential processing
+# each job profiles into its own file, these are merged into profile_file afterwards
+# returns the ( module file name, content changed ) list of all written modules and the ( current_xml, timings ) list of the jobs
+def generateAll( options, xml_files, cache_dir = None, jobs = 1, timing = False, profile_file = None ):
+    job_options = []
+    job_profile_files = []
+    for current_xml, _ in xml_files:
+        job_options.append( copy( options ))
+        job_options[ -1 ].current_xml = current_xml
+        job_profile_files.append( '{0}.{1}'.format( profile_file, current_xml ) if profile_file else None )
+
+    job_args = [ ( job_option, xml_file, cache_dir, timing, job_profile_file )
+        for job_option, ( _, xml_file ), job_profile_file in zip( job_options, xml_files, job_profile_files ) ]
+
+    written_modules = []
+    timings = []
+    if jobs <= 1 or len( xml_files ) < 2:
+        for ( current_xml, _ ), args in zip( xml_files, job_args ):
+            job_written_modules, job_timings = generate( *args )
+            written_modules += job_written_modules
+            timings.append( ( current_xml, job_timings ))
+
+    else:
+        with ProcessPoolExecutor( max_workers = min( jobs, len( xml_files ))) as executor:
+            futures = [ executor.submit( generate, *args ) for args in job_args ]
+
+            # wait for all jobs before reporting, so that a failing job does not leave others half written
+            errors = []
+            for ( current_xml, xml_file ), future in zip( xml_files, futures ):
+                try:
+                    job_written_modules, job_timings = future.result()
+                    written_modules += job_written_modules
+                    timings.append( ( current_xml, job_timings ))
+                except Exception as error:
+                    if not isinstance( error, SelectionError ):
+                        print( 'Generating {0} bindings from {1} failed: {2!r}'.format( current_xml, xml_file, error ), file = sys.stderr )
+                    errors.append( error )
+
+            if errors:
+                raise errors[ 0 ]
+
+    # merge the profiles of all jobs into one pstats file
+    if profile_file:
+        stats = pstats.Stats( *job_profile_files )
+        stats.dump_stats( profile_file )
+        for job_profile_file in job_profile_files:
+            os.remove( job_profile_file )
+
+    return written_modules, timings
+
+
+# print the phase and module timings of generateAll and the peak memory of the run, used with --time
+def printTimings( timings, wall_time ):
+    name_len = max( [ len( phase ) for _, job_timings in timings for phase, _ in job_timings[ 'phases' ]]
+                  + [ len( module[ 0 ] ) for _, job_timings in timings for module in job_timings[ 'modules' ]] + [ 20 ] ) + 2
+
+    for current_xml, job_timings in timings:
+        print( '\n{0}{1:>10}'.format( ( current_xml + '.xml phases' ).ljust( name_len ), 'seconds' ))
+        for phase, seconds in job_timings[ 'phases' ]:
+            print( '  {0}{1:10.3f}'.format( phase.ljust( name_len - 2 ), seconds ))
+
+        print( '\n{0}{1:>10}{2:>10}{3:>12}'.format( ( current_xml + '.xml modules' ).ljust( name_len ), 'render', 'write', 'bytes' ))
+        for file_name, render, write, size in job_timings[ 'modules' ]:
+            print( '  {0}{1:10.3f}{2:10.3f}{3:12}'.format( file_name.ljust( name_len - 2 ), render, write, size ))
+
+    print( '\n{0}{1:10.3f}'.format( 'wall time'.ljust( name_len ), wall_time ))
+
+    # the peak memory of a job is its process peak, sequential jobs share the main process
+    peak_rss = [ job_timings[ 'peak_rss' ] for _, job_timings in timings if job_timings[ 'peak_rss' ] ]
+    if peak_rss:
+        print( '{0}{1:10.1f} MiB'.format( 'peak RSS'.ljust( name_len ), max( peak_rss ) / ( 1024 * 1024 )))
+
+
+
 if __name__ == '__main__':
     import argparse
 
@@ -1187,22 +2524,40 @@ if __name__ == '__main__':
     parser.add_argument( '--packagePrefix', default = 'erupted' )
     parser.add_argument( '--namePrefix',    default = 'Erupted' )
     parser.add_argument( '--indentString',  default = '    ' )
+    parser.add_argument( '--cacheDir',      default = path.join( os.environ.get( 'XDG_CACHE_HOME', path.expanduser( path.join( '~', '.cache' ))), 'erupt_dlang' ),
+                                            help = 'Directory of the registry cache, entries are keyed by xml content, generator, vulkan-docs scripts and selection options, only the newest entry of each xml file is kept' )
+    parser.add_argument( '--noCache',       action = 'store_true', help = 'Always parse and traverse the registry, neither read nor write the registry cache' )
+    parser.add_argument( '--jobs',          type = int, default = 1, help = 'Number of processes generating the vk.xml and video.xml bindings concurrently' )
+    parser.add_argument( '--splitModules',  action = 'store_true', help = 'Write the types and functions of each core version and non platform extension into their own modules' )
+    loading = parser.add_mutually_exclusive_group()
+    loading.add_argument( '--lazyLoading',  action = 'store_true', help = 'Load functions install stubs which resolve their function pointer on first call, the pointers are never null and can not be checked for availability, an unresolvable function aborts on its first call' )
+    loading.add_argument( '--tableLoaders', action = 'store_true', help = 'Load functions loop over tables of function names and pointers instead of one statement per function' )
+    parser.add_argument( '--sharedDispatchTable', action = 'store_true', help = 'DispatchDevice references one read only function pointer table per device instead of embedding the function pointers' )
+    parser.add_argument( '--enabledLoaders', action = 'store_true', help = 'Generate DispatchDevice loaders of only the functions of the api version and extensions enabled for the device' )
+    parser.add_argument( '--traceCalls',    action = 'store_true', help = 'Generate call count and timing instrumentation of the functions, compiled in with version( EruptedTrace )' )
+    parser.add_argument( '--mockIcd',       action = 'store_true', help = 'Generate mock_icd.d, a stand-in implementation of counting no-op functions to be built as shared library' )
+    parser.add_argument( '--enumStrings',   action = 'store_true', help = 'Generate enum_strings.d, nothrow @nogc conversions of enum and bitmask values to names and of names to values' )
+    parser.add_argument( '--formatTables',  action = 'store_true', help = 'Generate formats.d, constant time lookup tables of the format properties of the registry formats section' )
+    parser.add_argument( '--structChains',  action = 'store_true', help = 'Generate struct_chain.d, compile time sType mappings and allocation free pNext chain utilities' )
+    parser.add_argument( '--enumerateHelpers', action = 'store_true', help = 'Generate enumerate.d and convenience functions, which enumerate two call functions into buffers or allocator memory' )
+    parser.add_argument( '--deepCopy',      action = 'store_true', help = 'Generate deep_copy.d, deep copies of structs and the memory they reference into one contiguous arena allocation' )
+    parser.add_argument( '--callProfile',   metavar = 'FILE', help = 'Order function pointer declarations and loader tables hot-first by the call counts of a json object or csv file of function name and count' )
+    parser.add_argument( '--time',          action = 'store_true', help = 'Print the time of each generator phase and output module and the peak memory' )
+    parser.add_argument( '--profile',       metavar = 'FILE', help = 'Profile the vk.xml and video.xml passes with cProfile and write the merged pstats to FILE' )
 
     # vulkan-docs options, not fully supported yet, maybe never
     parser.add_argument('-defaultExtensions',   action='store',         default='vulkan',   help='Specify a single class of extensions to add to targets')
 #   parser.add_argument( '-registry',           action='store',         default='vk.xml',   help='Use specified registry file instead of vk.xml' )
-#   parser.add_argument('-extension',           action='append',        default=[],         help='Specify an extension or extensions to add to targets')
-#   parser.add_argument('-removeExtensions',    action='append',        default=[],         help='Specify an extension or extensions to remove from targets')
-#   parser.add_argument('-emitExtensions',      action='append',        default=[],         help='Specify an extension or extensions to emit in targets')
-#   parser.add_argument('-feature',             action='append',        default=[],         help='Specify a core API feature name or names to add to targets')
+    parser.add_argument('-extension',           action='append',        default=[],         help='Specify an extension or extensions to add to targets, instead of all defaultExtensions')
+    parser.add_argument('-removeExtensions',    action='append',        default=[],         help='Specify an extension or extensions to remove from targets')
+    parser.add_argument('-emitExtensions',      action='append',        default=[],         help='Specify an extension or extensions to emit in targets')
+    parser.add_argument('-feature',             action='append',        default=[],         help='Specify a core API feature name or names to add to targets, lower versions are included, default extensions depending on other versions are dropped')
 #   parser.add_argument('-debug',               action='store_true',                        help='Enable debugging')
 #   parser.add_argument('-dump',                action='store_true',                        help='Enable dump to stderr')
 #   parser.add_argument('-diagfile',            action='store',         default=None,       help='Write diagnostics to specified file')
 #   parser.add_argument('-errfile',             action='store',         default=None,       help='Write errors and warnings to specified file instead of stderr')
 #   parser.add_argument('-noprotect',           action='store_false',   dest='protect',     help='Disable inclusion protection in output headers')
-#   parser.add_argument('-profile',             action='store_true',                        help='Enable profiling')
 #   parser.add_argument('-registry',            action='store',         default='vk.xml',   help='Use specified registry file instead of vk.xml')
-#   parser.add_argument('-time',                action='store_true',                        help='Enable timing')
 #   parser.add_argument('-validate',            action='store_true',                        help='Enable group validation')
 #   parser.add_argument('-o', dest='directory', action='store',         default='.',        help='Create target and related files in specified directory')
 #   parser.add_argument('-quiet',               action='store_true',    default=True,       help='Suppress script output during normal execution.')
@@ -1210,6 +2565,10 @@ if __name__ == '__main__':
 #   parser.add_argument('target',               metavar='target', nargs='?',                help='Specify target')
 
     args = parser.parse_args()
+    if args.traceCalls and args.lazyLoading:
+        parser.error( '--traceCalls cannot be combined with --lazyLoading, the lazy stubs replace the trace stubs on first call' )
+    if args.splitModules and args.callProfile:
+        parser.error( '--callProfile cannot be combined with --splitModules, the feature modules keep the registry order' )
 
     options = DGeneratorOptions(
         conventions         = VulkanConventions(),
@@ -1228,9 +2587,27 @@ if __name__ == '__main__':
         #protectFeature     = False,
 
         indentString        = args.indentString,
+        splitModules        = args.splitModules,
+        lazyLoading         = args.lazyLoading,
+        tableLoaders        = args.tableLoaders,
+        sharedDispatchTable = args.sharedDispatchTable,
+        traceCalls          = args.traceCalls,
+        enabledLoaders      = args.enabledLoaders,
+        mockIcd             = args.mockIcd,
+        enumStrings         = args.enumStrings,
+        formatTables        = args.formatTables,
+        structChains        = args.structChains,
+        enumerateHelpers    = args.enumerateHelpers,
+        deepCopy            = args.deepCopy,
+        callProfile         = readCallProfile( args.callProfile ) if args.callProfile else dict(),
         packagePrefix       = args.packagePrefix,
         namePrefix          = args.namePrefix,
 
+        featureNames        = args.feature,
+        extensionNames      = args.extension,
+        removeExtensionNames= args.removeExtensions,
+        emitExtensionNames  = args.emitExtensions,
+
         #protectProto      = '#ifndef',
         #protectProtoStr   = 'VK_NO_PROTOTYPES',
         #apicall           = 'VKAPI_ATTR ',
@@ -1243,15 +2620,22 @@ if __name__ == '__main__':
         tests_file = open( os.path.join( os.path.dirname( os.path.realpath( __file__ )), 'test.txt' ), 'w', encoding = 'utf-8' )
         #tests_file = open( 'test.txt', 'w', encoding = 'utf-8' )
 
-    options.current_xml = 'vk'
-    reg = Registry( DGenerator(), options )
-    reg.loadElementTree( etree.parse( vk_xml ))
-    reg.apiGen()
+    cache_dir = None if args.noCache else args.cacheDir
 
-    options.current_xml = 'video'
-    reg = Registry( DGenerator(), options )
-    reg.loadElementTree( etree.parse( video_xml ))
-    reg.apiGen()
+    # vulkan-docs-v1.3.238 introduced a second xml file (video.xml), both are processed independently
+    start = time.perf_counter()
+    try:
+        written_modules, timings = generateAll( options, [ ( 'vk', vk_xml ), ( 'video', video_xml ) ], cache_dir, args.jobs, args.time, args.profile )
+    except SelectionError as error:
+        parser.error( str( error ))
+    wall_time = time.perf_counter() - start
+
+    # summary of modules which were actually rewritten, unchanged modules were left untouched
+    changed_modules = [ file_name for file_name, changed in written_modules if changed ]
+    print( '{0} of {1} modules changed{2}'.format( len( changed_modules ), len( written_modules ), ': ' + ', '.join( changed_modules ) if changed_modules else '' ))
+
+    if args.time:
+        printTimings( timings, wall_time )
 
     if print_debug:
         tests_file.close()
\ No newline at end of file
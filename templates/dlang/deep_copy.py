@@ -0,0 +1,189 @@
+DEEP_COPY = """\
+/**
+ * Dlang vulkan deep copy of structs into one contiguous arena allocation
+ *
+ * Copyright: Copyright 2015-2016 The Khronos Group Inc.; Copyright 2016 Alex Parrill, Peter Particle.
+ * License:   $(https://opensource.org/licenses/MIT, MIT License).
+ * Authors: Copyright 2016 Alex Parrill, Peter Particle
+ */
+module {PACKAGE_PREFIX}.deep_copy;
+
+/// deepCopy( arena, source ) copies source with the arrays, strings, pointed to structs and pNext chain it references,
+/// as described by the member len attributes of the registry, into the memory of arena. The memory is sized with
+/// deepCopySize( source ), which computes the exact bytes of the copy with the same allocations as deepCopy, e.g.:
+///      auto memory = malloc( deepCopySize( createInfo ));
+///      auto arena = Arena( memory[ 0 .. deepCopySize( createInfo ) ] );
+///      auto copy = deepCopy( arena, createInfo );     // or deepCopyMalloc( createInfo ), released with free( copy )
+/// structs of the pNext chain which are unknown to this module, e.g. of platform extensions, are left out of the copy,
+/// void pointers without len, e.g. pUserData, and the members of unions are copied shallow
+/// pointers which Vulkan ignores, e.g. pImageInfo of a VkWriteDescriptorSet of uniform buffers, must be null or valid
+/// the arena memory must be aligned to 16 bytes, as malloc memory is, the copy must not outlive the arena memory
+public import {PACKAGE_PREFIX}.types;
+import core.stdc.stdlib : malloc;
+
+nothrow @nogc:
+
+
+/// bump allocator over caller owned memory
+struct Arena {{
+{IND}void[] memory;
+{IND}size_t used;
+
+{IND}/// uninitialized memory for count elements of T
+{IND}T* allocate( T )( size_t count ) pure nothrow @nogc {{
+{IND}{IND}used = alignUp( used, T.alignof );
+{IND}{IND}auto result = cast( T* )( memory.ptr + used );
+{IND}{IND}used += count * T.sizeof;
+{IND}{IND}assert( used <= memory.length, "Arena memory is too small for the deep copy" );
+{IND}{IND}return result;
+{IND}}}
+}}
+
+
+/// bytes of arena memory for the deep copy of source
+size_t deepCopySize( T )( ref const( T ) source ) pure {{
+{IND}return sizeArray( &source, 1, 0 );
+}}
+
+
+/// deep copy of source into arena
+T* deepCopy( T )( ref Arena arena, ref const( T ) source ) pure {{
+{IND}return copyArray( arena, &source, 1 );
+}}
+
+
+/// deep copy of source into one malloc allocation, which is released with free( copy ), null if malloc failed
+T* deepCopyMalloc( T )( ref const( T ) source ) {{
+{IND}auto size = deepCopySize( source );
+{IND}auto memory = malloc( size );
+{IND}if( memory is null ) return null;
+{IND}auto arena = Arena( memory[ 0 .. size ] );
+{IND}return deepCopy( arena, source );
+}}
+
+
+private size_t alignUp( size_t offset, size_t alignment ) pure {{
+{IND}return ( offset + alignment - 1 ) & ~( alignment - 1 );
+}}
+
+/// true if T has generated deepCopySize and deepCopyInto functions, which are required for structs referencing other memory
+private enum bool hasDeepCopy( T ) = is( typeof( deepCopySize( *cast( const( T )* )null, size_t.init )));
+
+
+// the size functions mirror the copy functions, they compute the arena offset after each allocation of the copy
+
+private size_t sizeArray( T )( const( T )* source, size_t count, size_t used ) pure {{
+{IND}if( source is null || count == 0 ) return used;
+{IND}used = alignUp( used, T.alignof ) + count * T.sizeof;
+{IND}static if( hasDeepCopy!T )
+{IND}{IND}foreach( i; 0 .. count ) used = deepCopySize( source[ i ], used );
+{IND}return used;
+}}
+
+private T* copyArray( T )( ref Arena arena, const( T )* source, size_t count ) pure {{
+{IND}if( source is null || count == 0 ) return null;
+{IND}auto target = arena.allocate!T( count );
+{IND}target[ 0 .. count ] = ( cast( T* )source )[ 0 .. count ];
+{IND}static if( hasDeepCopy!T )
+{IND}{IND}foreach( i; 0 .. count ) deepCopyInto( arena, target[ i ], source[ i ] );
+{IND}return target;
+}}
+
+
+// host data of void pointers is aligned to 8 bytes, as it may be read as any type
+
+private size_t sizeBytes( const( void )* source, size_t size, size_t used ) pure {{
+{IND}return source is null || size == 0 ? used : sizeArray( cast( const( ubyte )* )source, size, alignUp( used, 8 ));
+}}
+
+private void* copyBytes( ref Arena arena, const( void )* source, size_t size ) pure {{
+{IND}if( source is null || size == 0 ) return null;
+{IND}arena.used = alignUp( arena.used, 8 );
+{IND}return copyArray( arena, cast( const( ubyte )* )source, size );
+}}
+
+
+private size_t stringLength( const( char )* source ) pure {{
+{IND}size_t length = 0;
+{IND}while( source[ length ] != 0 ) ++length;
+{IND}return length;
+}}
+
+private size_t sizeString( const( char )* source, size_t used ) pure {{
+{IND}return source is null ? used : sizeArray( source, stringLength( source ) + 1, used );
+}}
+
+private char* copyString( ref Arena arena, const( char )* source ) pure {{
+{IND}return source is null ? null : copyArray( arena, source, stringLength( source ) + 1 );
+}}
+
+
+private size_t sizeStrings( const( char* )* source, size_t count, size_t used ) pure {{
+{IND}used = sizeArray!( char* )( source, count, used );
+{IND}if( source !is null )
+{IND}{IND}foreach( i; 0 .. count ) used = sizeString( source[ i ], used );
+{IND}return used;
+}}
+
+private char** copyStrings( ref Arena arena, const( char* )* source, size_t count ) pure {{
+{IND}auto target = copyArray!( char* )( arena, source, count );
+{IND}if( target !is null )
+{IND}{IND}foreach( i; 0 .. count ) target[ i ] = copyString( arena, source[ i ] );
+{IND}return target;
+}}
+
+
+// arrays of pointers to one element each
+
+private size_t sizePointers( T )( const( T* )* source, size_t count, size_t used ) pure {{
+{IND}used = sizeArray!( T* )( source, count, used );
+{IND}if( source !is null )
+{IND}{IND}foreach( i; 0 .. count ) used = sizeArray( source[ i ], 1, used );
+{IND}return used;
+}}
+
+private T** copyPointers( T )( ref Arena arena, const( T* )* source, size_t count ) pure {{
+{IND}auto target = copyArray!( T* )( arena, source, count );
+{IND}if( target !is null )
+{IND}{IND}foreach( i; 0 .. count ) target[ i ] = copyArray( arena, source[ i ], 1 );
+{IND}return target;
+}}
+
+
+// the first struct of a pNext chain known to this module is copied, which copies the rest of the chain
+
+private size_t sizeNext( const( void )* next, size_t used ) pure {{
+{IND}for( ; next !is null; next = ( cast( const( VkBaseInStructure )* )next ).pNext ) {{
+{IND}{IND}switch(( cast( const( VkBaseInStructure )* )next ).sType ) {{
+{SIZE_NEXT_CASES}
+{IND}{IND}{IND}default: break;
+{IND}{IND}}}
+{IND}}}
+{IND}return used;
+}}
+
+private void* copyNext( ref Arena arena, const( void )* next ) pure {{
+{IND}for( ; next !is null; next = ( cast( const( VkBaseInStructure )* )next ).pNext ) {{
+{IND}{IND}switch(( cast( const( VkBaseInStructure )* )next ).sType ) {{
+{COPY_NEXT_CASES}
+{IND}{IND}{IND}default: break;
+{IND}{IND}}}
+{IND}}}
+{IND}return null;
+}}
+
+{DEEP_COPY_FUNCS}
+"""
+
+
+# deep copy functions of a struct, which references other memory
+DEEP_COPY_STRUCT = """
+
+size_t deepCopySize( ref const( {STRUCT} ) source, size_t used ) pure {{
+{SIZE_MEMBERS}
+{IND}return used;
+}}
+
+void deepCopyInto( ref Arena arena, ref {STRUCT} target, ref const( {STRUCT} ) source ) pure {{
+{COPY_MEMBERS}
+}}"""
@@ -9,9 +9,9 @@ DISPATCH_DEVICE = """\
 module {PACKAGE_PREFIX}.dispatch_device;
 
 public import {PACKAGE_PREFIX}.types;
-import {PACKAGE_PREFIX}.functions;
+import {PACKAGE_PREFIX}.functions;{TRACE_IMPORT}{ENUMERATE_IMPORT}
 
-nothrow @nogc:
+nothrow @nogc:{IS_EXTENSION_ENABLED}
 
 
 /// struct to group per device device level functions into a custom namespace
@@ -60,7 +60,7 @@ struct DispatchDevice {{
 {IND}{IND}this.allocator = allocator;
 {IND}{IND}this.device = device;
 {DISPATCH_MEMBER_FUNCS}
-{IND}}}
+{IND}}}{DISPATCH_ENABLED_LOADER}
 
 
 {IND}/// convenience member functions, forwarded to corresponding vulkan functions
@@ -83,6 +83,317 @@ struct DispatchDevice {{
 
 {IND}/// member function pointer decelerations
 {DISPATCH_FUNC_DECLARATIONS}
-}}
+}}{DISPATCH_LOADER_TABLE}{DISPATCH_QUEUE}
+"""
+
+
+
+# with table loaders DispatchDevice loads its member function pointers with the device level loader table of functions.d
+DISPATCH_LOADER_TABLE = """
+
+
+/// offsets of the dispatch device function pointer members, in the order of the device level loader table
+private immutable size_t[ {COUNT} ] dispatchDeviceOffsets = [
+{OFFSETS}
+];\
+"""
+
+
+DISPATCH_LOADER_LOOP = """\
+{IND}{IND}foreach( i, offset; dispatchDeviceOffsets )
+{IND}{IND}{IND}*cast( void** )( cast( ubyte* )&this + offset ) = cast( void* ) vkGetDeviceProcAddr( device, deviceLevelNames.ptr + deviceLevelNameOffsets[ i ] );\
 """
 
+
+# with a shared dispatch table the device level function pointers of a VkDevice are loaded once into a DispatchDeviceTable
+# and DispatchDevice is a small handle referencing the table, copies of the handle share the table
+DISPATCH_DEVICE_TABLE = """\
+/**
+ * Dlang vulkan device related func loader as shared table and dispatch device handle
+ *
+ * Copyright: Copyright 2015-2016 The Khronos Group Inc.; Copyright 2016 Alex Parrill, Peter Particle.
+ * License:   $(https://opensource.org/licenses/MIT, MIT License).
+ * Authors: Copyright 2016 Alex Parrill, Peter Particle
+ */
+module {PACKAGE_PREFIX}.dispatch_device;
+
+public import {PACKAGE_PREFIX}.types;
+import {PACKAGE_PREFIX}.functions;{TRACE_IMPORT}{ENUMERATE_IMPORT}
+import core.stdc.stdlib : malloc, free;
+
+nothrow @nogc:{IS_EXTENSION_ENABLED}
+
+
+/// device level function pointers of one VkDevice, loaded once and shared read only by all DispatchDevice handles of the device
+/// a table is allocated and loaded with DispatchDeviceTable.create and freed with DispatchDeviceTable.destroy,
+/// or loaded into custom storage with load
+struct DispatchDeviceTable {{
+
+{IND}/// allocate a table with malloc and load the device level functions of the device, free it with DispatchDeviceTable.destroy
+{IND}static const( DispatchDeviceTable )* create( VkDevice device ) {{
+{IND}{IND}auto table = cast( DispatchDeviceTable* )malloc( DispatchDeviceTable.sizeof );
+{IND}{IND}assert( table !is null, "Allocation of DispatchDeviceTable failed!" );
+{IND}{IND}table.load( device );
+{IND}{IND}return table;
+{IND}}}{TABLE_ENABLED_CREATE}
+
+
+{IND}/// free a table allocated with DispatchDeviceTable.create, no DispatchDevice handle of it may be used afterwards
+{IND}static void destroy( const( DispatchDeviceTable )* table ) {{
+{IND}{IND}free( cast( void* )table );
+{IND}}}
+
+
+{IND}/// load the device level functions of the device
+{IND}void load( VkDevice device ) {{
+{IND}{IND}assert( vkGetInstanceProcAddr !is null, "Function pointer vkGetInstanceProcAddr is null!\\nCall loadGlobalLevelFunctions -> loadInstanceLevelFunctions -> DispatchDeviceTable.load" );
+{DISPATCH_MEMBER_FUNCS}
+{IND}}}{TABLE_ENABLED_LOADER}
+
+
+{IND}/// member function pointer decelerations
+{DISPATCH_FUNC_DECLARATIONS}
+}}{DISPATCH_LOADER_TABLE}
+
+
+/// handle to group per device device level functions into a custom namespace
+/// keeps track of the device to which the functions are bound and references the shared DispatchDeviceTable of the device
+/// copies of the handle are cheap, the function pointers are not copied
+/// the handle owning the table is created with DispatchDevice.create and releases the table with destroy, e.g.:
+///      auto dd = DispatchDevice.create( device );
+///      auto other = dd;                                                // shares the table of dd
+///      auto third = DispatchDevice( device, dd.dispatchTable );        // references the table of dd as well
+///      dd.DestroyDevice();
+///      dd.destroy();                                                   // frees the table, other and third must not be used anymore
+/// additionally to the device related vulkan functions, convenience functions exist
+/// with same name but omitting the vk prefix as well as the first (VkDevice) parameter
+/// these functions forward to their vk counterparts using the VkDevice member of the DispatchDevice
+/// Moreover the same convenience functions exist for vkCmd... functions. In this case the
+/// first parameter is substituted with the public member VkCommandBuffer commandBuffer,
+/// which must have been set to a valid command buffer before usage.
+struct DispatchDevice {{
+
+{IND}private VkDevice                               device          = VK_NULL_HANDLE;
+{IND}private const( VkAllocationCallbacks )*        allocator       = null;
+{IND}VkCommandBuffer                                commandBuffer   = VK_NULL_HANDLE;
+{IND}private const( DispatchDeviceTable )*          table           = null;
+
+{IND}/// the function pointers of the table are accessible as members, e.g.: dd.vkDestroyDevice( dd.vkDevice, dd.pAllocator );
+{IND}alias dispatchTable this;
+
+
+{IND}/// return copy of the internal VkDevice
+{IND}VkDevice vkDevice() {{
+{IND}{IND}return device;
+{IND}}}
+
+
+{IND}/// return const allocator address
+{IND}const( VkAllocationCallbacks )* pAllocator() {{
+{IND}{IND}return allocator;
+{IND}}}
+
+
+{IND}/// return the shared function pointer table
+{IND}const( DispatchDeviceTable )* dispatchTable() {{
+{IND}{IND}return table;
+{IND}}}
+
+
+{IND}/// the table is allocated by create, constructing a handle of the device only would allocate a table per construction
+{IND}@disable this( VkDevice device, const( VkAllocationCallbacks )* allocator = null );
+
+
+{IND}/// constructor referencing an already loaded table of the device, the handle does not own the table
+{IND}this( VkDevice device, const( DispatchDeviceTable )* table, const( VkAllocationCallbacks )* allocator = null ) {{
+{IND}{IND}this.device = device;
+{IND}{IND}this.table = table;
+{IND}{IND}this.allocator = allocator;
+{IND}}}
+
+
+{IND}/// create a handle owning a table of the device level functions allocated with DispatchDeviceTable.create
+{IND}/// the table must be released with destroy after the device was destroyed
+{IND}/// copies of this handle share the table, create further handles of the device by copying this one
+{IND}static DispatchDevice create( VkDevice device, const( VkAllocationCallbacks )* allocator = null ) {{
+{IND}{IND}DispatchDevice result;
+{IND}{IND}result.loadDeviceLevelFunctions( device, allocator );
+{IND}{IND}return result;
+{IND}}}{HANDLE_ENABLED_CREATE}
+
+
+{IND}/// free the table allocated by create, copies of this handle and handles referencing the table must not be used afterwards
+{IND}void destroy() {{
+{IND}{IND}DispatchDeviceTable.destroy( table );
+{IND}{IND}table = null;
+{IND}}}
+
+
+{IND}/// allocate and load the table of this handle as create does, a table allocated before must have been released with destroy
+{IND}void loadDeviceLevelFunctions( VkDevice device, const( VkAllocationCallbacks )* allocator = null ) {{
+{IND}{IND}assert( table is null, "The table of this DispatchDevice must be released with destroy before loading another one!" );
+{IND}{IND}this.allocator = allocator;
+{IND}{IND}this.device = device;
+{IND}{IND}this.table = DispatchDeviceTable.create( device );
+{IND}}}{HANDLE_ENABLED_LOADER}
+
+
+{IND}/// convenience member functions, forwarded to corresponding vulkan functions of the table
+{IND}/// parameters of type VkDevice, const( VkAllocationCallbacks )* and VkCommandBuffer are omitted
+{IND}/// they will be supplied by the member properties vkDevice, pAllocator and the public member commandBuffer
+{IND}/// e.g.:
+{IND}///      auto dd = DispatchDevice.create( device );
+{IND}///      dd.DestroyDevice();       // instead of: dd.vkDestroyDevice( dd.vkDevice, pAllocator );
+{IND}///
+{IND}/// Same mechanism works with functions which require a VkCommandBuffer as first arg
+{IND}/// In this case the public member 'commandBuffer' must be set beforehand
+{IND}/// e.g.:
+{IND}///      dd.commandBuffer = some_command_buffer;
+{IND}///      dd.BeginCommandBuffer( &beginInfo );
+{IND}///      dd.CmdBindPipeline( VK_PIPELINE_BIND_POINT_GRAPHICS, some_pipeline );
+{IND}///
+{IND}/// Does not work with queues, there are just too few queue related functions
+{DISPATCH_CONVENIENCE_FUNCS}
+}}{DISPATCH_QUEUE}
+"""
+
+
+# queue level functions of one VkQueue, appended to the dispatch device module
+DISPATCH_QUEUE = """
+
+
+/// struct to group the queue level functions of one VkQueue into a custom namespace
+/// keeps track of the queue to which the functions are bound, convenience functions exist
+/// with same name but omitting the vk prefix as well as the first (VkQueue) parameter
+/// the struct is aligned to and its size padded to a multiple of a cache line, hence the queues
+/// owned by different submission threads do not share cache lines with each other or other data
+align( 64 ) struct DispatchQueue {{
+
+{IND}private VkQueue                            queue           = VK_NULL_HANDLE;
+
+
+{IND}/// return copy of the internal VkQueue
+{IND}VkQueue vkQueue() {{
+{IND}{IND}return queue;
+{IND}}}
+
+
+{IND}/// constructor forwards parameters 'device' and 'queue' to 'this.loadQueueLevelFunctions'
+{IND}this( VkDevice device, VkQueue queue ) {{
+{IND}{IND}this.loadQueueLevelFunctions( device, queue );
+{IND}}}
+
+
+{IND}/// load the queue level member functions from the device the queue was retrieved from
+{IND}/// this also sets the private member 'queue' to the passed in VkQueue
+{IND}/// now the DispatchQueue can be used e.g.:
+{IND}///      auto dq = DispatchQueue( device, queue );
+{IND}///      dq.QueueSubmit2( 1, &submitInfo, fence );   // instead of: vkQueueSubmit2( queue, 1, &submitInfo, fence );
+{IND}void loadQueueLevelFunctions( VkDevice device, VkQueue queue ) {{
+{IND}{IND}assert( vkGetDeviceProcAddr !is null, "Function pointer vkGetDeviceProcAddr is null!\\nCall loadGlobalLevelFunctions -> loadInstanceLevelFunctions -> DispatchQueue.loadQueueLevelFunctions" );
+{IND}{IND}this.queue = queue;
+{QUEUE_MEMBER_FUNCS}
+{IND}}}
+
+
+{IND}/// convenience member functions, forwarded to corresponding vulkan functions
+{IND}/// parameters of type VkQueue are omitted, they will be supplied by the member property vkQueue
+{QUEUE_CONVENIENCE_FUNCS}
+
+
+{IND}/// member function pointer decelerations
+{QUEUE_FUNC_DECLARATIONS}
+}}"""
+
+
+# with enabled loaders, membership test of an extension in the enabled extension lists
+IS_EXTENSION_ENABLED = """
+
+
+/// true if the extension name is in the list of enabled extensions, e.g. VkDeviceCreateInfo.ppEnabledExtensionNames
+bool isExtensionEnabled( const( char )* extension, const( char* )[] enabledExtensions ) {{
+{IND}import core.stdc.string : strcmp;
+{IND}foreach( enabledExtension; enabledExtensions )
+{IND}{IND}if( strcmp( extension, enabledExtension ) == 0 )
+{IND}{IND}{IND}return true;
+{IND}return false;
+}}"""
+
+
+# with enabled loaders, DispatchDevice loads only the functions of the features enabled for its device
+DISPATCH_ENABLED_LOADER = """
+
+
+{IND}/// load only the device level member functions of the features enabled for the device, instead of all of them
+{IND}/// core versions are enabled up to apiVersion, device extensions if their name is in enabledExtensions and instance extensions
+{IND}/// with device level functions, e.g. VK_EXT_debug_utils, if their name is in enabledInstanceExtensions, e.g.
+{IND}/// with the VkDeviceCreateInfo used to create the device and the VkInstanceCreateInfo used to create the instance:
+{IND}///      dd.loadDeviceLevelFunctions( device, VK_API_VERSION_1_1, createInfo.ppEnabledExtensionNames[ 0 .. createInfo.enabledExtensionCount ],
+{IND}///          instanceCreateInfo.ppEnabledExtensionNames[ 0 .. instanceCreateInfo.enabledExtensionCount ] );
+{IND}/// functions promoted to a core version, which is not enabled, are loaded with the name of an enabled extension providing them
+{IND}/// function pointers of features which are not enabled are null
+{IND}void loadDeviceLevelFunctions( VkDevice device, uint32_t apiVersion, const( char* )[] enabledExtensions, const( char* )[] enabledInstanceExtensions, const( VkAllocationCallbacks )* allocator = null ) {{
+{IND}{IND}assert( vkGetInstanceProcAddr !is null, "Function pointer vkGetInstanceProcAddr is null!\\nCall loadGlobalLevelFunctions -> loadInstanceLevelFunctions -> DispatchDevice.loadDeviceLevelFunctions" );
+{IND}{IND}auto commandBuffer = this.commandBuffer;
+{IND}{IND}this = DispatchDevice.init;
+{IND}{IND}this.commandBuffer = commandBuffer;
+{IND}{IND}this.allocator = allocator;
+{IND}{IND}this.device = device;
+{DISPATCH_ENABLED_FUNCS}
+{IND}}}"""
+
+
+# with enabled loaders and a shared dispatch table, DispatchDeviceTable and the DispatchDevice handle create and load tables
+# of only the functions of the features enabled for the device
+TABLE_ENABLED_CREATE = """
+
+
+{IND}/// allocate a table with malloc and load only the device level functions of the features enabled for the device
+{IND}static const( DispatchDeviceTable )* create( VkDevice device, uint32_t apiVersion, const( char* )[] enabledExtensions, const( char* )[] enabledInstanceExtensions ) {{
+{IND}{IND}auto table = cast( DispatchDeviceTable* )malloc( DispatchDeviceTable.sizeof );
+{IND}{IND}assert( table !is null, "Allocation of DispatchDeviceTable failed!" );
+{IND}{IND}table.load( device, apiVersion, enabledExtensions, enabledInstanceExtensions );
+{IND}{IND}return table;
+{IND}}}"""
+
+
+TABLE_ENABLED_LOADER = """
+
+
+{IND}/// load only the device level functions of the features enabled for the device, instead of all of them
+{IND}/// core versions are enabled up to apiVersion, device extensions if their name is in enabledExtensions and instance extensions
+{IND}/// with device level functions, e.g. VK_EXT_debug_utils, if their name is in enabledInstanceExtensions
+{IND}/// functions promoted to a core version, which is not enabled, are loaded with the name of an enabled extension providing them
+{IND}/// function pointers of features which are not enabled are null
+{IND}void load( VkDevice device, uint32_t apiVersion, const( char* )[] enabledExtensions, const( char* )[] enabledInstanceExtensions ) {{
+{IND}{IND}assert( vkGetInstanceProcAddr !is null, "Function pointer vkGetInstanceProcAddr is null!\\nCall loadGlobalLevelFunctions -> loadInstanceLevelFunctions -> DispatchDeviceTable.load" );
+{IND}{IND}this = DispatchDeviceTable.init;
+{DISPATCH_ENABLED_FUNCS}
+{IND}}}"""
+
+
+HANDLE_ENABLED_CREATE = """
+
+
+{IND}/// create a handle owning a table of only the device level functions of the features enabled for the device
+{IND}/// the features are enabled as of DispatchDeviceTable.load, e.g. with the VkDeviceCreateInfo used to create the device
+{IND}/// and the VkInstanceCreateInfo used to create the instance:
+{IND}///      auto dd = DispatchDevice.create( device, VK_API_VERSION_1_1, createInfo.ppEnabledExtensionNames[ 0 .. createInfo.enabledExtensionCount ],
+{IND}///          instanceCreateInfo.ppEnabledExtensionNames[ 0 .. instanceCreateInfo.enabledExtensionCount ] );
+{IND}static DispatchDevice create( VkDevice device, uint32_t apiVersion, const( char* )[] enabledExtensions, const( char* )[] enabledInstanceExtensions, const( VkAllocationCallbacks )* allocator = null ) {{
+{IND}{IND}DispatchDevice result;
+{IND}{IND}result.loadDeviceLevelFunctions( device, apiVersion, enabledExtensions, enabledInstanceExtensions, allocator );
+{IND}{IND}return result;
+{IND}}}"""
+
+
+HANDLE_ENABLED_LOADER = """
+
+
+{IND}/// allocate and load the table of only the enabled device level functions of this handle as create does
+{IND}void loadDeviceLevelFunctions( VkDevice device, uint32_t apiVersion, const( char* )[] enabledExtensions, const( char* )[] enabledInstanceExtensions, const( VkAllocationCallbacks )* allocator = null ) {{
+{IND}{IND}assert( table is null, "The table of this DispatchDevice must be released with destroy before loading another one!" );
+{IND}{IND}this.allocator = allocator;
+{IND}{IND}this.device = device;
+{IND}{IND}this.table = DispatchDeviceTable.create( device, apiVersion, enabledExtensions, enabledInstanceExtensions );
+{IND}}}"""
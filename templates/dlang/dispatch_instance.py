@@ -0,0 +1,85 @@
+DISPATCH_INSTANCE = """\
+/**
+ * Dlang vulkan instance related func loader as struct members
+ *
+ * Copyright: Copyright 2015-2016 The Khronos Group Inc.; Copyright 2016 Alex Parrill, Peter Particle.
+ * License:   $(https://opensource.org/licenses/MIT, MIT License).
+ * Authors: Copyright 2016 Alex Parrill, Peter Particle
+ */
+module {PACKAGE_PREFIX}.dispatch_instance;
+
+public import {PACKAGE_PREFIX}.types;
+import {PACKAGE_PREFIX}.functions;{TRACE_IMPORT}{ENUMERATE_IMPORT}
+
+nothrow @nogc:
+
+
+/// struct to group per instance instance level functions into a custom namespace
+/// keeps track of the instance to which the functions are bound, several instances can be used side by side
+/// without overwriting the __gshared instance level functions of module {PACKAGE_PREFIX}.functions
+/// additionally to the instance related vulkan functions, convenience functions exist
+/// with same name but omitting the vk prefix as well as the first (VkInstance) parameter
+/// these functions forward to their vk counterparts using the VkInstance member of the DispatchInstance
+/// Moreover the same convenience functions exist for VkPhysicalDevice functions. In this case the
+/// first parameter is substituted with the public member VkPhysicalDevice physicalDevice,
+/// which must have been set to a valid physical device before usage.
+struct DispatchInstance {{
+
+{IND}private VkInstance                         instance        = VK_NULL_HANDLE;
+{IND}private const( VkAllocationCallbacks )*    allocator       = null;
+{IND}VkPhysicalDevice                           physicalDevice  = VK_NULL_HANDLE;
+
+
+{IND}/// return copy of the internal VkInstance
+{IND}VkInstance vkInstance() {{
+{IND}{IND}return instance;
+{IND}}}
+
+
+{IND}/// return const allocator address
+{IND}const( VkAllocationCallbacks )* pAllocator() {{
+{IND}{IND}return allocator;
+{IND}}}
+
+
+{IND}/// constructor forwards parameter 'instance' to 'this.loadInstanceLevelFunctions'
+{IND}this( VkInstance instance, const( VkAllocationCallbacks )* allocator = null ) {{
+{IND}{IND}this.loadInstanceLevelFunctions( instance, allocator );
+{IND}}}
+
+
+{IND}/// load the instance level member functions
+{IND}/// this also sets the private member 'instance' to the passed in VkInstance
+{IND}/// as well as the otional host allocator, which should be the one the instance was created with
+{IND}/// now the DispatchInstance can be used e.g.:
+{IND}///      auto di = DispatchInstance( instance );
+{IND}///      di.vkEnumeratePhysicalDevices( di.vkInstance, &count, null );
+{IND}/// convenience functions to omit the first arg and the allocator do exist, see bellow
+{IND}void loadInstanceLevelFunctions( VkInstance instance, const( VkAllocationCallbacks )* allocator = null ) {{
+{IND}{IND}assert( vkGetInstanceProcAddr !is null, "Function pointer vkGetInstanceProcAddr is null!\\nCall loadGlobalLevelFunctions -> DispatchInstance.loadInstanceLevelFunctions" );
+{IND}{IND}this.allocator = allocator;
+{IND}{IND}this.instance = instance;
+{INSTANCE_MEMBER_FUNCS}
+{IND}}}
+
+
+{IND}/// convenience member functions, forwarded to corresponding vulkan functions
+{IND}/// parameters of type VkInstance, const( VkAllocationCallbacks )* and VkPhysicalDevice are omitted
+{IND}/// they will be supplied by the member properties vkInstance, pAllocator and the public member physicalDevice
+{IND}/// e.g.:
+{IND}///      auto di = DispatchInstance( instance );
+{IND}///      di.EnumeratePhysicalDevices( &count, null );   // instead of: di.vkEnumeratePhysicalDevices( di.vkInstance, &count, null );
+{IND}///
+{IND}/// Same mechanism works with functions which require a VkPhysicalDevice as first arg
+{IND}/// In this case the public member 'physicalDevice' must be set beforehand
+{IND}/// e.g.:
+{IND}///      di.physicalDevice = some_physical_device;
+{IND}///      di.GetPhysicalDeviceProperties( &properties );
+{IND}///      di.CreateDevice( &deviceCreateInfo, &device );
+{INSTANCE_CONVENIENCE_FUNCS}
+
+
+{IND}/// member function pointer decelerations
+{INSTANCE_FUNC_DECLARATIONS}
+}}
+"""
@@ -0,0 +1,115 @@
+ENUM_STRINGS = """\
+/**
+ * Dlang vulkan enum and bitmask value names, conversion from values to names and from names to values
+ *
+ * Copyright: Copyright 2015-2016 The Khronos Group Inc.; Copyright 2016 Alex Parrill, Peter Particle.
+ * License:   $(https://opensource.org/licenses/MIT, MIT License).
+ * Authors: Copyright 2016 Alex Parrill, Peter Particle
+ */
+module {PACKAGE_PREFIX}.enum_strings;
+
+/// toString( value ) returns the name of a value of an enum or bitmask group, null if the value has no name
+/// parse( name, value ) looks up a value by its name or alias name with a perfect hash, false if the name is unknown
+/// flagsToString!FlagBits( flags, buffer ) writes the names of the set bits of a bitmask into a caller buffer
+/// all functions are nothrow and @nogc, e.g.:
+///      auto name = toString( VK_ERROR_DEVICE_LOST );   // "VK_ERROR_DEVICE_LOST"
+///      VkFormat format;
+///      bool known = parse( "VK_FORMAT_R8G8B8A8_UNORM", format );
+///      char[ 256 ] buffer;
+///      auto names = flagsToString!VkQueueFlagBits( queueFlags, buffer );   // e.g. "VK_QUEUE_GRAPHICS_BIT | VK_QUEUE_COMPUTE_BIT"
+import {PACKAGE_PREFIX}.types;
+import core.stdc.stdio : snprintf;
+
+nothrow @nogc:
+
+
+/// write the names of the bits set in flags, separated by " | ", into buffer and return the written slice of buffer
+/// zero flags are written as the name of the zero value if the group has one, bits without name as hexadecimal value, the result is truncated if the buffer is too small
+char[] flagsToString( FlagBits )( ulong flags, char[] buffer ) if( is( FlagBits == enum )) {{
+{IND}size_t length = 0;
+{IND}void append( const( char )[] text ) {{
+{IND}{IND}auto count = text.length < buffer.length - length ? text.length : buffer.length - length;
+{IND}{IND}buffer[ length .. length + count ] = text[ 0 .. count ];
+{IND}{IND}length += count;
+{IND}}}
+
+{IND}if( flags == 0 ) {{
+{IND}{IND}auto name = toString( cast( FlagBits )0 );
+{IND}{IND}if( name !is null ) append( name );
+{IND}}}
+
+{IND}foreach( bit; 0 .. 8 * FlagBits.sizeof ) {{
+{IND}{IND}ulong flag = 1UL << bit;
+{IND}{IND}if(( flags & flag ) == 0 ) continue;
+{IND}{IND}if( length > 0 ) append( " | " );
+{IND}{IND}auto name = toString( cast( FlagBits )flag );
+{IND}{IND}if( name is null ) {{
+{IND}{IND}{IND}char[ 24 ] hex;
+{IND}{IND}{IND}auto count = snprintf( hex.ptr, hex.length, "0x%llx", flag );
+{IND}{IND}{IND}append( hex[ 0 .. count ] );
+{IND}{IND}}} else {{
+{IND}{IND}{IND}append( name );
+{IND}{IND}}}
+{IND}}}
+{IND}return buffer[ 0 .. length ];
+}}
+
+
+/// FNV-1a hash of a name with seed, the generator computes the perfect hash tables with the same function
+private uint nameHash( const( char )[] name, uint seed ) pure {{
+{IND}uint hash = 2166136261u ^ seed;
+{IND}foreach( c; name ) {{
+{IND}{IND}hash ^= c;
+{IND}{IND}hash *= 16777619u;
+{IND}}}
+{IND}return hash;
+}}
+
+
+/// perfect hash lookup, the first hash selects a bucket, whose displacement maps the second hash of each name in the bucket
+/// to a distinct slot. Unused slots have a null name, the name in the slot is compared to reject unknown names
+private bool parseName( E )( const( char )[] name, out E value, const( uint )[] displacements, const( string )[] names, const( E )[] values ) pure {{
+{IND}if( name.length == 0 ) return false;
+{IND}ulong slots = names.length;
+{IND}uint h1 = nameHash( name, 0 );
+{IND}uint h2 = nameHash( name, 0x9E3779B9 );
+{IND}uint displacement = displacements[ h1 % displacements.length ];
+{IND}ulong step = slots > 1 ? 1 + h1 % ( slots - 1 ) : 0;
+{IND}auto slot = cast( size_t )(( h2 % slots + displacement / slots * step + displacement % slots ) % slots );
+{IND}if( names[ slot ] != name ) return false;
+{IND}value = values[ slot ];
+{IND}return true;
+}}
+
+{ENUM_FUNCTIONS}
+"""
+
+
+# name of each value of an enum group, values without name and duplicate values of other names are not switched
+ENUM_TO_STRING = """
+
+/// name of a {GROUP} value, null if the value has no name
+string toString( {GROUP} value ) pure {{
+{IND}switch( value ) {{
+{CASES}
+{IND}{IND}default: return null;
+{IND}}}
+}}"""
+
+
+# perfect hash tables of the names and alias names of an enum group
+ENUM_PARSE = """
+
+/// {GROUP} value of a name or alias name, false if the name is unknown
+bool parse( const( char )[] name, out {GROUP} value ) pure {{
+{IND}static immutable uint[ {BUCKETS} ] displacements = [
+{DISPLACEMENTS}
+{IND}];
+{IND}static immutable string[ {SLOTS} ] names = [
+{NAMES}
+{IND}];
+{IND}static immutable {GROUP}[ {SLOTS} ] values = [
+{VALUES}
+{IND}];
+{IND}return parseName( name, value, displacements, names, values );
+}}"""
@@ -0,0 +1,82 @@
+ENUMERATE = """\
+/**
+ * Dlang vulkan two call enumeration into caller buffers or allocator memory
+ *
+ * Copyright: Copyright 2015-2016 The Khronos Group Inc.; Copyright 2016 Alex Parrill, Peter Particle.
+ * License:   $(https://opensource.org/licenses/MIT, MIT License).
+ * Authors: Copyright 2016 Alex Parrill, Peter Particle
+ */
+module {PACKAGE_PREFIX}.enumerate;
+
+/// each function with a uint32_t* count and an array of that count as last parameters has two helpers, named as the function
+/// without vk prefix and with lower case first letter, e.g. enumeratePhysicalDevices. The helpers take the parameters before
+/// the count and either a buffer, e.g. of the stack, or an allocator, the items are returned in the out parameter items, e.g.:
+///      VkPhysicalDevice[ 16 ] buffer;
+///      VkPhysicalDevice[] physicalDevices;
+///      enumeratePhysicalDevices( instance, buffer, physicalDevices );     // VK_INCOMPLETE if buffer is too small
+///      VkExtensionProperties[] extensions;
+///      enumerateDeviceExtensionProperties( physicalDevice, null, Mallocator.instance, extensions );
+///      Mallocator.instance.deallocate( extensions );
+/// an allocator has the allocate and deallocate functions of std.experimental.allocator, the allocated items are initialized
+/// with their init value, the sType of output structs is set, their pNext is null
+/// DispatchInstance, DispatchDevice and DispatchQueue have the same helpers as convenience functions, without the dispatch handle
+public import {PACKAGE_PREFIX}.types;
+import {PACKAGE_PREFIX}.functions;
+
+nothrow @nogc:
+
+
+/// call of a two call function with the count and the array, the array is null to query the count
+alias EnumerateCall( T ) = VkResult delegate( uint32_t* count, T* array ) nothrow @nogc;
+
+
+/// true if A can allocate and deallocate memory as the allocators of std.experimental.allocator
+enum bool isAllocator( A ) = is( typeof(( ref A allocator ) => allocator.deallocate( allocator.allocate( size_t.init ))));
+
+
+/// enumerate into buffer, items is the filled part of buffer, VK_INCOMPLETE is returned if buffer is too small for all items
+/// functions which return a result are called once with the buffer, functions without result, which cannot report that the
+/// buffer was too small, are called a second time after querying the count, as are all functions with an empty buffer
+VkResult enumerateInto( T, bool returnsResult )( scope EnumerateCall!T call, T[] buffer, out T[] items ) {{
+{IND}uint32_t available = 0;
+{IND}if( !returnsResult || buffer.length == 0 ) {{
+{IND}{IND}auto result = call( &available, null );
+{IND}{IND}if( result < VK_SUCCESS || available == 0 ) return result;
+{IND}{IND}if( buffer.length == 0 ) return VK_INCOMPLETE;
+{IND}}}
+
+{IND}uint32_t count = cast( uint32_t )( !returnsResult && available < buffer.length ? available : buffer.length );
+{IND}auto result = call( &count, buffer.ptr );
+{IND}if( result < VK_SUCCESS ) return result;
+{IND}items = buffer[ 0 .. count ];
+{IND}return !returnsResult && available > buffer.length ? VK_INCOMPLETE : result;
+}}
+
+
+/// enumerate into memory of allocator, which must be released with allocator.deallocate( items ), items is null for no items
+/// the count is queried and the items are retrieved in a second call, which is retried if the count grew in between
+VkResult enumerateAlloc( T, bool returnsResult, Allocator )( scope EnumerateCall!T call, ref Allocator allocator, out T[] items ) if( isAllocator!Allocator ) {{
+{IND}VkResult result;
+{IND}do {{
+{IND}{IND}uint32_t count = 0;
+{IND}{IND}result = call( &count, null );
+{IND}{IND}if( result < VK_SUCCESS || count == 0 ) return result;
+
+{IND}{IND}auto memory = allocator.allocate( count * T.sizeof );
+{IND}{IND}if( memory is null ) return VK_ERROR_OUT_OF_HOST_MEMORY;
+{IND}{IND}items = cast( T[] )memory;
+{IND}{IND}items[] = T.init;
+
+{IND}{IND}result = call( &count, items.ptr );
+{IND}{IND}if( result < VK_SUCCESS || result == VK_INCOMPLETE ) {{
+{IND}{IND}{IND}allocator.deallocate( memory );
+{IND}{IND}{IND}items = null;
+{IND}{IND}}} else {{
+{IND}{IND}{IND}items = items[ 0 .. count ];
+{IND}{IND}}}
+{IND}}} while( result == VK_INCOMPLETE );
+{IND}return result;
+}}
+
+{ENUMERATE_FUNCS}
+"""
@@ -0,0 +1,132 @@
+FORMATS = """\
+/**
+ * Dlang vulkan format properties of the formats section of the registry
+ *
+ * Copyright: Copyright 2015-2016 The Khronos Group Inc.; Copyright 2016 Alex Parrill, Peter Particle.
+ * License:   $(https://opensource.org/licenses/MIT, MIT License).
+ * Authors: Copyright 2016 Alex Parrill, Peter Particle
+ */
+module {PACKAGE_PREFIX}.formats;
+
+/// formatInfo( format ) returns the properties of a format in constant time, e.g.:
+///      auto info = formatInfo( VK_FORMAT_BC1_RGB_UNORM_BLOCK );
+///      auto blocksWide = ( width + info.blockExtent[ 0 ] - 1 ) / info.blockExtent[ 0 ];
+///      auto rowPitch = blocksWide * info.blockSize;
+/// core formats are looked up by value in a dense table, extension formats with a binary search of a sorted table
+import {PACKAGE_PREFIX}.types;
+
+nothrow @nogc:
+
+
+/// block compression scheme of a format
+enum FormatCompression : ubyte {{
+{COMPRESSIONS}
+}}
+
+/// chroma subsampling of a YCbCr format
+enum FormatChroma : ubyte {{
+{CHROMAS}
+}}
+
+/// numeric format of a format component
+enum NumericFormat : ubyte {{
+{NUMERIC_FORMATS}
+}}
+
+
+/// component of a format, the components of a format are stored in memory order
+struct FormatComponent {{
+{IND}char            name;           /// R, G, B, A, D or S
+{IND}ubyte           bits;           /// bits of the component, 0 for compressed formats
+{IND}NumericFormat   numericFormat;
+{IND}ubyte           planeIndex;     /// plane of the component of multi-planar formats, 0 otherwise
+}}
+
+
+/// plane of a multi-planar format
+struct FormatPlane {{
+{IND}ubyte           widthDivisor;   /// texel width of the plane is the texel width of the image divided by widthDivisor
+{IND}ubyte           heightDivisor;  /// texel height of the plane is the texel height of the image divided by heightDivisor
+{IND}VkFormat        compatible;     /// single plane format compatible with the plane
+}}
+
+
+/// properties of a format, 16 bytes to keep four formats in a cache line
+struct FormatInfo {{
+{IND}ubyte               blockSize;          /// bytes per texel block
+{IND}ubyte               texelsPerBlock;     /// texels per texel block
+{IND}ubyte[ 3 ]          blockExtent;        /// width, height and depth of a texel block in texels
+{IND}ubyte               packed;             /// bits of the packed texel block, 0 if the format is not packed
+{IND}FormatCompression   compression;
+{IND}FormatChroma        chroma;
+{IND}ubyte               componentCount;
+{IND}ubyte               planeCount;         /// 0 for single plane formats
+{IND}ushort              classIndex;
+{IND}ushort              componentIndex;
+{IND}ushort              planeIndex;
+
+{IND}/// format compatibility class, e.g. "32-bit" or "BC1_RGB"
+{IND}string formatClass() const pure nothrow @nogc {{
+{IND}{IND}return formatClasses[ classIndex ];
+{IND}}}
+
+{IND}/// components in memory order
+{IND}const( FormatComponent )[] components() const pure nothrow @nogc {{
+{IND}{IND}return formatComponents[ componentIndex .. componentIndex + componentCount ];
+{IND}}}
+
+{IND}/// planes of a multi-planar format, empty for single plane formats
+{IND}const( FormatPlane )[] planes() const pure nothrow @nogc {{
+{IND}{IND}return formatPlanes[ planeIndex .. planeIndex + planeCount ];
+{IND}}}
+
+{IND}bool isCompressed() const pure nothrow @nogc {{
+{IND}{IND}return compression != FormatCompression.NONE;
+{IND}}}
+}}
+
+
+/// properties of a format, null for VK_FORMAT_UNDEFINED and formats without properties in the registry
+const( FormatInfo )* formatInfo( VkFormat format ) pure {{
+{IND}if( cast( uint )format < denseFormatInfos.length ) {{
+{IND}{IND}auto info = &denseFormatInfos[ format ];
+{IND}{IND}return info.blockSize > 0 ? info : null;
+{IND}}}
+
+{IND}size_t lower = 0, upper = sparseFormats.length;
+{IND}while( lower < upper ) {{
+{IND}{IND}size_t middle = ( lower + upper ) / 2;
+{IND}{IND}if( sparseFormats[ middle ] == format ) return &sparseFormatInfos[ middle ];
+{IND}{IND}if( sparseFormats[ middle ] < format ) lower = middle + 1;
+{IND}{IND}else upper = middle;
+{IND}}}
+{IND}return null;
+}}
+
+
+/// properties of the core formats indexed by format value, unused values have a block size of 0
+private immutable FormatInfo[ {DENSE_COUNT} ] denseFormatInfos = [
+{DENSE_FORMAT_INFOS}
+];
+
+/// extension formats sorted by value and their properties
+private immutable VkFormat[ {SPARSE_COUNT} ] sparseFormats = [
+{SPARSE_FORMATS}
+];
+
+private immutable FormatInfo[ {SPARSE_COUNT} ] sparseFormatInfos = [
+{SPARSE_FORMAT_INFOS}
+];
+
+private immutable string[ {CLASS_COUNT} ] formatClasses = [
+{FORMAT_CLASSES}
+];
+
+private immutable FormatComponent[ {COMPONENT_COUNT} ] formatComponents = [
+{FORMAT_COMPONENTS}
+];
+
+private immutable FormatPlane[ {PLANE_COUNT} ] formatPlanes = [
+{FORMAT_PLANES}
+];
+"""
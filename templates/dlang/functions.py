@@ -8,7 +8,7 @@ FUNCS = """\
  */
 module {PACKAGE_PREFIX}.functions;
 
-public import {PACKAGE_PREFIX}.types;
+public import {PACKAGE_PREFIX}.types;{FEATURE_IMPORTS}{TRACE_IMPORT}
 
 nothrow @nogc:
 
@@ -22,21 +22,21 @@ extern( System ) {{
 /// function declarations
 __gshared {{
 {FUNC_DECLARATIONS}
-}}
+}}{LAZY_RESOLVERS}{LOADER_TABLES}
 
 
 /// sets vkCreateInstance function pointer and acquires basic functions to retrieve information about the implementation
 /// and create an instance: vkEnumerateInstanceExtensionProperties, vkEnumerateInstanceLayerProperties, vkCreateInstance
 void loadGlobalLevelFunctions( PFN_vkGetInstanceProcAddr getInstanceProcAddr ) {{
 {IND}vkGetInstanceProcAddr = getInstanceProcAddr;
-{GLOBAL_LEVEL_FUNCS}
+{GLOBAL_LEVEL_FUNCS}{TRACE_GLOBAL}
 }}
 
 
 /// with a valid VkInstance call this function to retrieve additional VkInstance, VkPhysicalDevice, ... related functions
 void loadInstanceLevelFunctions( VkInstance instance ) {{
 {IND}assert( vkGetInstanceProcAddr !is null, "Function pointer vkGetInstanceProcAddr is null!\\nCall loadGlobalLevelFunctions -> loadInstanceLevelFunctions" );
-{INSTANCE_LEVEL_FUNCS}
+{INSTANCE_LEVEL_FUNCS}{TRACE_INSTANCE}
 }}
 
 
@@ -45,7 +45,7 @@ void loadInstanceLevelFunctions( VkInstance instance ) {{
 /// use loadDeviceLevelFunctions( VkDevice device ) bellow to avoid this indirection and get the pointers directly form a VkDevice
 void loadDeviceLevelFunctions( VkInstance instance ) {{
 {IND}assert( vkGetInstanceProcAddr !is null, "Function pointer vkGetInstanceProcAddr is null!\\nCall loadGlobalLevelFunctions -> loadDeviceLevelFunctions( instance )" );
-{DEVICE_I_LEVEL_FUNCS}
+{DEVICE_I_LEVEL_FUNCS}{TRACE_DEVICE}
 }}
 
 
@@ -55,7 +55,75 @@ void loadDeviceLevelFunctions( VkInstance instance ) {{
 /// see module {PACKAGE_PREFIX}.dispatch_device if multiple VkDevices will be used
 void loadDeviceLevelFunctions( VkDevice device ) {{
 {IND}assert( vkGetDeviceProcAddr !is null, "Function pointer vkGetDeviceProcAddr is null!\\nCall loadGlobalLevelFunctions -> loadInstanceLevelFunctions -> loadDeviceLevelFunctions( device )" );
-{DEVICE_D_LEVEL_FUNCS}
+{DEVICE_D_LEVEL_FUNCS}{TRACE_DEVICE}
+}}
+"""
+
+
+
+# with lazy loading the load functions install these stubs instead of querying each function pointer
+FUNCS_LAZY_RESOLVERS = """
+
+
+/// lazy loading, the load functions install a stub into each function pointer, which resolves its function with
+/// vkGet( Instance or Device )ProcAddr from the instance or device passed to the load function which installed it
+/// and patches the function pointer on its first call. Unresolved function pointers are hence never null and can not
+/// be checked for availability, a function which can not be resolved aborts the program on its first call, also in
+/// release builds. Concurrent first calls of the same function resolve the same pointer and store it redundantly
+import std.traits : Parameters, ReturnType;
+
+/// instance or device handle of each function pointer, stored when its stub is installed
+private template lazyHandle( alias func ) {{
+{IND}__gshared void* lazyHandle;
+}}
+
+private PFN_vkVoidFunction lazyGlobalProcAddr(   void* handle, const( char )* name ) {{ return vkGetInstanceProcAddr( null, name ); }}
+private PFN_vkVoidFunction lazyInstanceProcAddr( void* handle, const( char )* name ) {{ return vkGetInstanceProcAddr( cast( VkInstance )handle, name ); }}
+private PFN_vkVoidFunction lazyDeviceProcAddr(   void* handle, const( char )* name ) {{ return vkGetDeviceProcAddr( cast( VkDevice )handle, name ); }}
+
+private void lazyInstall( alias func, alias getProcAddr )( void* handle ) {{
+{IND}lazyHandle!func = handle;
+{IND}func = &lazyResolve!( func, getProcAddr );
 }}
+
+private extern( System ) ReturnType!( typeof( func )) lazyResolve( alias func, alias getProcAddr )( Parameters!( typeof( func )) args ) {{
+{IND}enum name = __traits( identifier, func );
+{IND}auto resolved = cast( typeof( func )) getProcAddr( lazyHandle!func, name );
+{IND}if( resolved is null ) lazyUnresolved( name );
+{IND}func = resolved;
+{IND}return resolved( args );
+}}
+
+private void lazyUnresolved( const( char )* name ) {{
+{IND}import core.stdc.stdio : fprintf, stderr;
+{IND}import core.stdc.stdlib : abort;
+{IND}fprintf( stderr, "Function pointer %s could not be resolved!\\n", name );
+{IND}abort();
+}}\
+"""
+
+
+# with table loaders the load functions loop over these tables instead of loading each function pointer in its own statement
+FUNCS_LOADER_TABLE = """
+
+
+/// {LEVEL} level loader table, the function names are stored in one string and separated by zero terminators
+/// the function pointer of each target is loaded with the name starting at the corresponding name offset
+package( {PACKAGE_PREFIX} ) immutable char[] {LEVEL}LevelNames =
+{NAMES};
+
+package( {PACKAGE_PREFIX} ) immutable uint[ {COUNT} ] {LEVEL}LevelNameOffsets = [
+{OFFSETS}
+];
+
+private __gshared void**[ {COUNT} ] {LEVEL}LevelTargets = [
+{TARGETS}
+];\
 """
 
+
+# loop of a table loader function over the targets of a loader table
+FUNCS_LOADER_LOOP = """\
+{IND}foreach( i, target; {LEVEL}LevelTargets )
+{IND}{IND}*target = cast( void* ) vkGet{INSTANCE_OR_DEVICE}ProcAddr( {HANDLE}, {LEVEL}LevelNames.ptr + {LEVEL}LevelNameOffsets[ i ] );\
+"""
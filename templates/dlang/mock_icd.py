@@ -0,0 +1,82 @@
+MOCK_ICD = """\
+/**
+ * Dlang vulkan mock icd, a stand-in vulkan implementation of counting no-op functions
+ *
+ * Copyright: Copyright 2015-2016 The Khronos Group Inc.; Copyright 2016 Alex Parrill, Peter Particle.
+ * License:   $(https://opensource.org/licenses/MIT, MIT License).
+ * Authors: Copyright 2016 Alex Parrill, Peter Particle
+ */
+module {PACKAGE_PREFIX}.mock_icd;
+
+/// build this module as shared library, e.g. ldc2 -betterC -shared -O -I<parent of {PACKAGE_PREFIX}> mock_icd.d -of=libmock_icd.so
+/// and load it with {PACKAGE_PREFIX}.vulkan_lib_loader.loadVulkanLib( "./libmock_icd.so" ), it exports vkGetInstanceProcAddr,
+/// which resolves each function of the bindings to a no-op implementation. The no-op functions count their calls,
+/// write no output parameters and return the init value of their return type, e.g. VK_SUCCESS
+/// the proc address functions count their calls as well, both counters are retrieved with the function returned by
+/// vkGetInstanceProcAddr( null, "mockIcdCounters" ), as the counters of a shared library cannot be accessed directly
+import {PACKAGE_PREFIX}.functions;
+import core.stdc.string : strcmp;
+import std.traits : Parameters, ReturnType;
+
+nothrow @nogc:
+
+
+/// signature of the mock icd counter function
+alias PFN_mockIcdCounters = extern( System ) void function( ulong* procAddrCalls, ulong* functionCalls ) nothrow @nogc;
+
+private __gshared ulong mockProcAddrCalls = 0;
+private __gshared ulong mockFunctionCalls = 0;
+
+
+/// no-op implementation of all functions of type F, counts the call and returns the init value of the return type
+private extern( System ) ReturnType!F mockFunction( F )( Parameters!F ) nothrow @nogc {{
+{IND}++mockFunctionCalls;
+{IND}static if( !is( ReturnType!F == void ))
+{IND}{IND}return ReturnType!F.init;
+}}
+
+
+/// exported entry point of the mock icd, the instance is ignored
+pragma( mangle, "vkGetInstanceProcAddr" )
+export extern( System ) PFN_vkVoidFunction mockGetInstanceProcAddr( VkInstance instance, const( char )* pName ) nothrow @nogc {{
+{IND}++mockProcAddrCalls;
+{IND}return findFunction( pName );
+}}
+
+
+/// device level proc address function of the mock icd, the device is ignored
+private extern( System ) PFN_vkVoidFunction mockGetDeviceProcAddr( VkDevice device, const( char )* pName ) nothrow @nogc {{
+{IND}++mockProcAddrCalls;
+{IND}return findFunction( pName );
+}}
+
+
+/// copy the proc address and function call counters, they count from loading the mock icd
+private extern( System ) void mockIcdCounters( ulong* procAddrCalls, ulong* functionCalls ) nothrow @nogc {{
+{IND}*procAddrCalls = mockProcAddrCalls;
+{IND}*functionCalls = mockFunctionCalls;
+}}
+
+
+/// function name and implementation, sorted by name for a binary search
+private struct MockEntry {{
+{IND}const( char )*      name;
+{IND}PFN_vkVoidFunction  func;
+}}
+
+private immutable MockEntry[ {COUNT} ] mockEntries = [
+{MOCK_ENTRIES}
+];
+
+private PFN_vkVoidFunction findFunction( const( char )* name ) {{
+{IND}size_t lower = 0, upper = mockEntries.length;
+{IND}while( lower < upper ) {{
+{IND}{IND}size_t middle = ( lower + upper ) / 2;
+{IND}{IND}int order = strcmp( name, mockEntries[ middle ].name );
+{IND}{IND}if( order == 0 ) return mockEntries[ middle ].func;
+{IND}{IND}if( order < 0 ) upper = middle;
+{IND}{IND}else lower = middle + 1;
+{IND}}}
+{IND}return null;
+}}
+"""
@@ -1,11 +1,60 @@
 STATIC_IF_EXTENSION = """
 {IND}// VK_{EXTENSION}{COMMENT}
-{IND}{ELSE_PREFIX}static if( __traits( isSame, extension, {EXTENSION} )) {OPEN_FORMAT}{{
+{IND}{ELSE_PREFIX}static if( __traits( isSame, extension, {EXTENSION} )) {{
 {SECTIONS}
-{IND}}}{CLOSE_FORMAT}
+{IND}}}
 """
 
 
+# constructor of DispatchDeviceExt, with a shared dispatch table the handles owning the table are created with create instead
+DISPATCH_DEVICE_EXT_CONSTRUCTOR = """\
+{IND}{IND}// Constructor forwards parameter 'device' to 'loadDeviceLevelFunctionsExt'
+{IND}{IND}this( VkDevice device ) {{
+{IND}{IND}{IND}loadDeviceLevelFunctionsExt( device );
+{IND}{IND}}}"""
+
+
+DISPATCH_DEVICE_EXT_CREATE = """\
+{IND}{IND}// the shared table of commonDispatchDevice is allocated by create and released with destroy, as of DispatchDevice
+{IND}{IND}@disable this( VkDevice device );
+
+{IND}{IND}// create a handle owning the table of commonDispatchDevice and load the member function pointers of the extensions
+{IND}{IND}static DispatchDeviceExt create( VkDevice device ) {{
+{IND}{IND}{IND}DispatchDeviceExt result;
+{IND}{IND}{IND}result.loadDeviceLevelFunctionsExt( device );
+{IND}{IND}{IND}return result;
+{IND}{IND}}}{ENABLED_CREATE}"""
+
+
+# with enabled loaders, DispatchDeviceExt loads only the member function pointers of the features enabled for the device
+DISPATCH_DEVICE_EXT_ENABLED_CREATE = """
+
+{IND}{IND}// create a handle owning the table of commonDispatchDevice and load the member function pointers of the enabled extensions
+{IND}{IND}static DispatchDeviceExt create( VkDevice device, uint32_t apiVersion, const( char* )[] enabledExtensions, const( char* )[] enabledInstanceExtensions ) {{
+{IND}{IND}{IND}DispatchDeviceExt result;
+{IND}{IND}{IND}result.loadDeviceLevelFunctionsExt( device, apiVersion, enabledExtensions, enabledInstanceExtensions );
+{IND}{IND}{IND}return result;
+{IND}{IND}}}"""
+
+
+DISPATCH_DEVICE_EXT_ENABLED_LOADER = """
+
+{IND}{IND}// compose loadDeviceLevelFunctionsExt member function loading only the functions of the features enabled for the device
+{IND}{IND}// out of the unextended variant and the member function pointers of the enabled platform extensions
+{IND}{IND}void loadDeviceLevelFunctionsExt( VkDevice device, uint32_t apiVersion, const( char* )[] enabledExtensions, const( char* )[] enabledInstanceExtensions ) {{
+
+{IND}{IND}{IND}// first load the enabled non platform related member function pointers of wrapped commonDispatchDevice
+{IND}{IND}{IND}commonDispatchDevice.loadDeviceLevelFunctions( device, apiVersion, enabledExtensions, enabledInstanceExtensions );
+
+{IND}{IND}{IND}// 5b. loop through alias sequence and mixin the device level member function pointer definitions of enabled extensions
+{IND}{IND}{IND}static foreach( extension; noDuplicateExtensions ) {{
+{IND}{IND}{IND}{IND}if( isExtensionEnabled( "VK_" ~ __traits( identifier, extension ), enabledExtensions ) || isExtensionEnabled( "VK_" ~ __traits( identifier, extension ), enabledInstanceExtensions )) {{
+{DISPATCH_ENABLED_MEMBER_FUNCS}
+{IND}{IND}{IND}{IND}}}
+{IND}{IND}{IND}}}
+{IND}{IND}}}"""
+
+
 PLATFORM_EXTENSIONS = """\
 /**
  * Dlang vulkan platform specific types and functions as mixin template
@@ -35,6 +84,7 @@ mixin template Platform_Extensions( extensions... ) {{
 {IND}public import {PACKAGE_PREFIX}.types;
 {IND}public import {PACKAGE_PREFIX}.functions;
 {IND}import {PACKAGE_PREFIX}.dispatch_device;
+{IND}import {PACKAGE_PREFIX}.dispatch_instance;{TRACE_IMPORT}
 
 {IND}// mixin function linkage, nothrow and @nogc attributes for subsecuent functions
 {IND}extern(System) nothrow @nogc:
@@ -63,6 +113,8 @@ mixin template Platform_Extensions( extensions... ) {{
 {IND}alias loadInstanceLevelFunctions = loadInstanceLevelFunctionsExt;
 {IND}alias loadDeviceLevelFunctions = loadDeviceLevelFunctionsExt;
 {IND}alias DispatchDevice = DispatchDeviceExt;
+{IND}alias DispatchInstance = DispatchInstanceExt;
+{IND}alias DispatchQueue = DispatchQueueExt;
 
 {IND}// compose loadInstanceLevelFunctionsExt function out of unextended
 {IND}// loadInstanceLevelFunctions and additional function pointers from extensions
@@ -117,10 +169,7 @@ mixin template Platform_Extensions( extensions... ) {{
 {IND}{IND}{PACKAGE_PREFIX}.dispatch_device.DispatchDevice commonDispatchDevice;
 {IND}{IND}alias commonDispatchDevice this;
 
-{IND}{IND}// Constructor forwards parameter 'device' to 'loadDeviceLevelFunctionsExt'
-{IND}{IND}this( VkDevice device ) {{
-{IND}{IND}{IND}loadDeviceLevelFunctionsExt( device );
-{IND}{IND}}}
+{DISPATCH_DEVICE_CONSTRUCTOR}
 
 {IND}{IND}// backwards compatibility alias
 {IND}{IND}alias loadDeviceLevelFunctions = loadDeviceLevelFunctionsExt;
@@ -137,7 +186,7 @@ mixin template Platform_Extensions( extensions... ) {{
 {IND}{IND}{IND}static foreach( extension; noDuplicateExtensions ) {{
 {DISPATCH_MEMBER_FUNCS}
 {IND}{IND}{IND}}}
-{IND}{IND}}}
+{IND}{IND}}}{DISPATCH_ENABLED_LOADER}
 
 {IND}{IND}// 6. loop through alias sequence and mixin corresponding convenience member functions
 {IND}{IND}// omitting device parameter of this wrapping DispatchDevice. Member vkDevice of commonDispatchDevice is used instead
@@ -150,6 +199,91 @@ mixin template Platform_Extensions( extensions... ) {{
 {DISPATCH_FUNC_DECLARATIONS}
 {IND}{IND}}}
 {IND}}}
+
+{IND}// compose extended dispatch instance out of unextended original dispatch instance with
+{IND}// extended loadInstanceLevelFunctionsExt member function,
+{IND}// instance and physical device based function pointer decelerations
+{IND}struct DispatchInstanceExt {{
+
+{IND}{IND}// use unextended dispatch instance from module {PACKAGE_PREFIX}.dispatch_instance as member and alias this
+{IND}{IND}{PACKAGE_PREFIX}.dispatch_instance.DispatchInstance commonDispatchInstance;
+{IND}{IND}alias commonDispatchInstance this;
+
+{IND}{IND}// Constructor forwards parameter 'instance' to 'loadInstanceLevelFunctionsExt'
+{IND}{IND}this( VkInstance instance, const( VkAllocationCallbacks )* allocator = null ) {{
+{IND}{IND}{IND}loadInstanceLevelFunctionsExt( instance, allocator );
+{IND}{IND}}}
+
+{IND}{IND}// backwards compatibility alias
+{IND}{IND}alias loadInstanceLevelFunctions = loadInstanceLevelFunctionsExt;
+
+{IND}{IND}// compose loadInstanceLevelFunctionsExt member function out of unextended
+{IND}{IND}// loadInstanceLevelFunctions and additional member function pointers from extensions
+{IND}{IND}void loadInstanceLevelFunctionsExt( VkInstance instance, const( VkAllocationCallbacks )* allocator = null ) {{
+
+{IND}{IND}{IND}// first load all non platform related member function pointers of wrapped commonDispatchInstance
+{IND}{IND}{IND}commonDispatchInstance.loadInstanceLevelFunctions( instance, allocator );
+
+{IND}{IND}{IND}// 8. loop through alias sequence and mixin corresponding
+{IND}{IND}{IND}// instance level member function pointer definitions of this wrapping DispatchInstance
+{IND}{IND}{IND}static foreach( extension; noDuplicateExtensions ) {{
+{INSTANCE_MEMBER_FUNCS}
+{IND}{IND}{IND}}}
+{IND}{IND}}}
+
+{IND}{IND}// 9. loop through alias sequence and mixin corresponding convenience member functions omitting the
+{IND}{IND}// instance or physical device parameter. Members vkInstance and physicalDevice of commonDispatchInstance are used instead
+{IND}{IND}static foreach( extension; noDuplicateExtensions ) {{
+{INSTANCE_CONVENIENCE_FUNCS}
+{IND}{IND}}}
+
+{IND}{IND}// 10. loop last time through alias sequence and mixin corresponding function pointer declarations
+{IND}{IND}static foreach( extension; noDuplicateExtensions ) {{
+{INSTANCE_FUNC_DECLARATIONS}
+{IND}{IND}}}
+{IND}}}
+
+{IND}// compose extended dispatch queue out of unextended original dispatch queue with
+{IND}// extended loadQueueLevelFunctionsExt member function and queue based function pointer decelerations
+{IND}align( 64 ) struct DispatchQueueExt {{
+
+{IND}{IND}// use unextended dispatch queue from module {PACKAGE_PREFIX}.dispatch_device as member and alias this
+{IND}{IND}{PACKAGE_PREFIX}.dispatch_device.DispatchQueue commonDispatchQueue;
+{IND}{IND}alias commonDispatchQueue this;
+
+{IND}{IND}// Constructor forwards parameters 'device' and 'queue' to 'loadQueueLevelFunctionsExt'
+{IND}{IND}this( VkDevice device, VkQueue queue ) {{
+{IND}{IND}{IND}loadQueueLevelFunctionsExt( device, queue );
+{IND}{IND}}}
+
+{IND}{IND}// backwards compatibility alias
+{IND}{IND}alias loadQueueLevelFunctions = loadQueueLevelFunctionsExt;
+
+{IND}{IND}// compose loadQueueLevelFunctionsExt member function out of unextended
+{IND}{IND}// loadQueueLevelFunctions and additional member function pointers from extensions
+{IND}{IND}void loadQueueLevelFunctionsExt( VkDevice device, VkQueue queue ) {{
+
+{IND}{IND}{IND}// first load all non platform related member function pointers of wrapped commonDispatchQueue
+{IND}{IND}{IND}commonDispatchQueue.loadQueueLevelFunctions( device, queue );
+
+{IND}{IND}{IND}// 11. loop through alias sequence and mixin corresponding
+{IND}{IND}{IND}// queue level member function pointer definitions of this wrapping DispatchQueue
+{IND}{IND}{IND}static foreach( extension; noDuplicateExtensions ) {{
+{QUEUE_MEMBER_FUNCS}
+{IND}{IND}{IND}}}
+{IND}{IND}}}
+
+{IND}{IND}// 12. loop through alias sequence and mixin corresponding convenience member functions
+{IND}{IND}// omitting queue parameter of this wrapping DispatchQueue. Member vkQueue of commonDispatchQueue is used instead
+{IND}{IND}static foreach( extension; noDuplicateExtensions ) {{
+{QUEUE_CONVENIENCE_FUNCS}
+{IND}{IND}}}
+
+{IND}{IND}// 13. loop last time through alias sequence and mixin corresponding function pointer declarations
+{IND}{IND}static foreach( extension; noDuplicateExtensions ) {{
+{QUEUE_FUNC_DECLARATIONS}
+{IND}{IND}}}
+{IND}}}
 }}"""
 
 
@@ -0,0 +1,64 @@
+TYPES_PACKAGE = """\
+/**
+ * Dlang vulkan type definitions, public imports of the types modules of each feature
+ *
+ * Copyright: Copyright 2015-2016 The Khronos Group Inc.; Copyright 2016 Alex Parrill, Peter Particle.
+ * License:   $(https://opensource.org/licenses/MIT, MIT License).
+ * Authors: Copyright 2016 Alex Parrill, Peter Particle
+ */
+module {PACKAGE_PREFIX}.types;
+
+public import {PACKAGE_PREFIX}.types.base;
+{FEATURE_IMPORTS}\
+"""
+
+
+TYPES_FEATURE = """\
+/**
+ * Dlang vulkan type definitions of {FEATURE}
+ *
+ * Copyright: Copyright 2015-2016 The Khronos Group Inc.; Copyright 2016 Alex Parrill, Peter Particle.
+ * License:   $(https://opensource.org/licenses/MIT, MIT License).
+ * Authors: Copyright 2016 Alex Parrill, Peter Particle
+ */
+module {PACKAGE_PREFIX}.types.{MODULE};
+
+{IMPORTS}
+
+nothrow @nogc:
+
+
+// Linkage of debug and allocation callbacks
+extern( System ):
+
+
+{TYPE_DEFINITIONS}\
+"""
+
+
+FUNCS_FEATURE = """\
+/**
+ * Dlang vulkan function pointer prototypes and declarations of {FEATURE}
+ *
+ * Copyright: Copyright 2015-2016 The Khronos Group Inc.; Copyright 2016 Alex Parrill, Peter Particle.
+ * License:   $(https://opensource.org/licenses/MIT, MIT License).
+ * Authors: Copyright 2016 Alex Parrill, Peter Particle
+ */
+module {PACKAGE_PREFIX}.functions.{MODULE};
+
+{IMPORTS}
+
+nothrow @nogc:
+
+
+/// function type aliases
+extern( System ) {{
+{FUNC_TYPE_ALIASES}
+}}
+
+
+/// function declarations
+__gshared {{
+{FUNC_DECLARATIONS}
+}}
+"""
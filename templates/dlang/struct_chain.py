@@ -0,0 +1,108 @@
+STRUCT_CHAIN = """\
+/**
+ * Dlang vulkan sType and pNext chain utilities
+ *
+ * Copyright: Copyright 2015-2016 The Khronos Group Inc.; Copyright 2016 Alex Parrill, Peter Particle.
+ * License:   $(https://opensource.org/licenses/MIT, MIT License).
+ * Authors: Copyright 2016 Alex Parrill, Peter Particle
+ */
+module {PACKAGE_PREFIX}.struct_chain;
+
+/// sTypeOf!T and StructOf!sType map the structs with a fixed sType to their sType and back at compile time
+/// canExtend!( Next, Base ) is true if Next may be linked into the pNext chain of Base, as of the structextends of the registry
+/// findInChain!T( chain ) walks a pNext chain and returns the first struct of type T, e.g.:
+///      auto features = StructChain!( VkPhysicalDeviceFeatures2, VkPhysicalDeviceVulkan12Features )();
+///      vkGetPhysicalDeviceFeatures2( physicalDevice, features.ptr );
+///      if( features.get!VkPhysicalDeviceVulkan12Features.timelineSemaphore ) ...
+///      auto robustness = findInChain!VkPhysicalDeviceRobustness2FeaturesEXT( deviceCreateInfo.pNext );
+/// only structs of non platform features are mapped, none of the utilities allocate
+import {PACKAGE_PREFIX}.types;
+import std.meta : allSatisfy, ApplyRight, staticIndexOf;
+import std.traits : Unqual;
+
+nothrow @nogc:
+
+
+/// sType of struct T, which must have a fixed sType
+template sTypeOf( T ) {{
+{IND}static if( is( typeof( T.init.sType ) == VkStructureType ))
+{IND}{IND}static assert( structName( T.init.sType ) == Unqual!T.stringof, T.stringof ~ " has no fixed sType" );
+{IND}else
+{IND}{IND}static assert( false, T.stringof ~ " has no sType member" );
+{IND}enum VkStructureType sTypeOf = T.init.sType;
+}}
+
+
+/// struct type of sType
+template StructOf( VkStructureType sType ) {{
+{IND}static assert( structName( sType ) !is null, "No struct has the sType " ~ sType.stringof );
+{IND}alias StructOf = mixin( structName( sType ));
+}}
+
+
+/// true if Next may be linked into the pNext chain of Base
+enum bool canExtend( Next, Base ) = structExtends( sTypeOf!Next, sTypeOf!Base );
+
+
+/// first struct of type T in the pNext chain starting with the struct chain points to, null if the chain has none
+inout( T )* findInChain( T )( inout( void )* chain ) pure {{
+{IND}for( auto next = cast( inout( VkBaseInStructure )* )chain; next !is null; next = cast( inout( VkBaseInStructure )* )next.pNext )
+{IND}{IND}if( next.sType == sTypeOf!T )
+{IND}{IND}{IND}return cast( inout( T )* )next;
+{IND}return null;
+}}
+
+
+/// insert next directly after base into the pNext chain of base, next must extend base
+void appendToChain( Base, Next )( ref Base base, ref Next next ) pure if( canExtend!( Next, Base )) {{
+{IND}next.pNext = cast( typeof( next.pNext ))base.pNext;
+{IND}base.pNext = &next;
+}}
+
+
+/// fixed chain of a Base struct and the structs extending it, stored by value without allocation
+/// the pNext pointers are linked by ptr, which must be called again after the chain was copied or moved
+struct StructChain( Base, Extensions... ) if( allSatisfy!( ApplyRight!( canExtend, Base ), Extensions )) {{
+{IND}Base        base;
+{IND}Extensions  extensions;
+
+{IND}/// link base and extensions in declaration order and return base
+{IND}Base* ptr() return pure {{
+{IND}{IND}static foreach( i; 0 .. Extensions.length ) {{
+{IND}{IND}{IND}static if( i == 0 )  base.pNext = &extensions[ 0 ];
+{IND}{IND}{IND}else                 extensions[ i - 1 ].pNext = &extensions[ i ];
+{IND}{IND}}}
+{IND}{IND}static if( Extensions.length > 0 )    extensions[ Extensions.length - 1 ].pNext = null;
+{IND}{IND}else                              base.pNext = null;
+{IND}{IND}return &base;
+{IND}}}
+
+{IND}/// the base or extension struct of type T
+{IND}ref T get( T )() return pure {{
+{IND}{IND}static if( is( T == Base )) return base;
+{IND}{IND}else {{
+{IND}{IND}{IND}enum index = staticIndexOf!( T, Extensions );
+{IND}{IND}{IND}static assert( index >= 0, T.stringof ~ " is not in the chain" );
+{IND}{IND}{IND}return extensions[ index ];
+{IND}{IND}}}
+{IND}}}
+}}
+
+
+/// name of the struct with sType, null if no struct has the sType
+string structName( VkStructureType sType ) pure {{
+{IND}switch( sType ) {{
+{STRUCT_NAMES}
+{IND}{IND}default: return null;
+{IND}}}
+}}
+
+
+/// true if the struct with sType next may be linked into the pNext chain of the struct with sType base
+bool structExtends( VkStructureType next, VkStructureType base ) pure {{
+{IND}switch( next ) {{
+{STRUCT_EXTENDS}
+{IND}{IND}default: return false;
+{IND}}}
+}}
+"""
@@ -0,0 +1,159 @@
+TRACE = """\
+/**
+ * Dlang vulkan call tracing, counts the calls of each function and accumulates the time spent in them
+ *
+ * Copyright: Copyright 2015-2016 The Khronos Group Inc.; Copyright 2016 Alex Parrill, Peter Particle.
+ * License:   $(https://opensource.org/licenses/MIT, MIT License).
+ * Authors: Copyright 2016 Alex Parrill, Peter Particle
+ */
+module {PACKAGE_PREFIX}.trace;
+
+/// type of the function pointer members of the dispatch structs, e.g. Traced!( PFN_vkCmdDraw, "vkCmdDraw" ) vkCmdDraw;
+/// with version identifier EruptedTrace a TracedFunction recording each call of the member, otherwise the function pointer type
+version( EruptedTrace ) alias Traced( PFN, string name ) = TracedFunction!( PFN, __traits( getMember, TraceFunction, name ));
+else                    alias Traced( PFN, string name ) = PFN;
+
+/// tracing is compiled in only with version identifier EruptedTrace, otherwise the functions as well as
+/// the function pointer members of the dispatch structs are called directly
+version( EruptedTrace ):
+
+import {PACKAGE_PREFIX}.functions;
+import core.time : MonoTime, ticksToNSecs;
+import core.stdc.stdio : FILE, fprintf, stderr;
+import std.traits : Parameters, ReturnType;
+
+nothrow @nogc:
+
+
+/// index of each traced function into the trace table
+enum TraceFunction : uint {{
+{TRACE_FUNCTIONS}
+}}
+
+/// names of the traced functions, indexed by TraceFunction
+immutable string[] traceFunctionNames = [ __traits( allMembers, TraceFunction ) ];
+
+
+/// call count and accumulated MonoTime ticks of one function
+struct TraceEntry {{
+{IND}ulong   calls;
+{IND}long    ticks;
+}}
+
+/// trace table of the calling thread, each thread records into its own thread local table without synchronization
+/// a thread can report or reset only its own table, e.g. report it before the thread ends
+TraceEntry[ TraceFunction.max + 1 ] traceTable;
+
+
+/// record one call of a function and the ticks spent in it into the trace table of the calling thread
+void traceRecord( TraceFunction index, long ticks ) {{
+{IND}traceTable[ index ].calls += 1;
+{IND}traceTable[ index ].ticks += ticks;
+}}
+
+
+/// records one call of a function and the time until leaving the scope of the guard
+/// the trace stubs and the traced dispatch members guard their forwarding call with it
+struct TraceScope {{
+{IND}private TraceFunction index;
+{IND}private long          start;
+
+{IND}this( TraceFunction index ) {{
+{IND}{IND}this.index = index;
+{IND}{IND}this.start = MonoTime.currTime.ticks;
+{IND}}}
+
+{IND}~this() {{
+{IND}{IND}traceRecord( index, MonoTime.currTime.ticks - start );
+{IND}}}
+
+{IND}@disable this( this );
+}}
+
+
+/// stub of one function pointer, forwards to the loaded function pointer and records the call
+private template TraceStub( alias func ) {{
+{IND}__gshared typeof( func ) loaded;
+{IND}extern( System ) ReturnType!( typeof( func )) stub( Parameters!( typeof( func )) args ) nothrow @nogc {{
+{IND}{IND}auto traceCall = TraceScope( __traits( getMember, TraceFunction, __traits( identifier, func )));
+{IND}{IND}return loaded( args );
+{IND}}}
+}}
+
+
+/// function pointer member of a dispatch struct, which forwards calls to its function pointer and records them
+/// each dispatch struct holds the function pointers of its own instance or device, hence members are not traced with stubs
+/// the member is assigned and converts to the function pointer as before, compare it with null through func
+struct TracedFunction( PFN, TraceFunction index ) {{
+{IND}PFN func;
+{IND}alias func this;
+
+{IND}void opAssign( PFN func ) {{
+{IND}{IND}this.func = func;
+{IND}}}
+
+{IND}auto opCall( Parameters!PFN args ) const {{
+{IND}{IND}auto traceCall = TraceScope( index );
+{IND}{IND}return func( args );
+{IND}}}
+}}
+
+
+/// replace a loaded function pointer with its trace stub, null and already traced function pointers are left untouched
+void traceFunction( alias func )() {{
+{IND}if( func is null || func is &TraceStub!func.stub ) return;
+{IND}TraceStub!func.loaded = func;
+{IND}func = &TraceStub!func.stub;
+}}
+
+
+/// install the trace stubs into the global level functions, called by loadGlobalLevelFunctions
+void traceGlobalLevelFunctions() {{
+{GLOBAL_LEVEL_FUNCS}
+}}
+
+
+/// install the trace stubs into the instance level functions, called by loadInstanceLevelFunctions
+void traceInstanceLevelFunctions() {{
+{INSTANCE_LEVEL_FUNCS}
+}}
+
+
+/// install the trace stubs into the device level functions, called by both loadDeviceLevelFunctions
+void traceDeviceLevelFunctions() {{
+{DEVICE_LEVEL_FUNCS}
+}}
+
+
+/// reset the trace table of the calling thread
+void resetTraceTable() {{
+{IND}traceTable[] = TraceEntry.init;
+}}
+
+
+/// print call count, total and average time of each function called by the calling thread, most time consuming first
+/// the report is written to stream, default stderr
+void dumpTraceReport( FILE* stream = null ) {{
+{IND}if( stream is null ) stream = stderr;
+
+{IND}// insertion sort the indices of the called functions by descending ticks
+{IND}uint[ traceTable.length ] order;
+{IND}size_t count = 0;
+{IND}foreach( i, ref entry; traceTable ) {{
+{IND}{IND}if( entry.calls == 0 ) continue;
+{IND}{IND}size_t j = count++;
+{IND}{IND}for( ; j > 0 && traceTable[ order[ j - 1 ]].ticks < entry.ticks; --j )
+{IND}{IND}{IND}order[ j ] = order[ j - 1 ];
+{IND}{IND}order[ j ] = cast( uint )i;
+{IND}}}
+
+{IND}fprintf( stream, "%-64s %12s %16s %12s\\n", "function".ptr, "calls".ptr, "total us".ptr, "average ns".ptr );
+{IND}foreach( index; order[ 0 .. count ] ) {{
+{IND}{IND}auto name = traceFunctionNames[ index ];
+{IND}{IND}auto nsecs = ticksToNSecs( traceTable[ index ].ticks );
+{IND}{IND}fprintf( stream, "%-64.*s %12llu %16.3f %12lld\\n", cast( int )name.length, name.ptr,
+{IND}{IND}{IND}traceTable[ index ].calls, nsecs / 1000.0, nsecs / cast( long )traceTable[ index ].calls );
+{IND}}}
+}}
+"""
+
@@ -6,7 +6,7 @@ TYPES = """\
  * License:   $(https://opensource.org/licenses/MIT, MIT License).
  * Authors: Copyright 2016 Alex Parrill, Peter Particle
  */
-module {PACKAGE_PREFIX}.types;
+module {PACKAGE_PREFIX}.{TYPES_MODULE};
 
 import {PACKAGE_PREFIX}.vk_video;
 import std.bitmanip : bitfields;
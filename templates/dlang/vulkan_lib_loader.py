@@ -19,11 +19,12 @@ version( Windows ) {{
 private:
 {IND}import core.sys.windows.windows;
 {IND}HMODULE         vulkan_lib  = null;
-{IND}auto loadLib()  {{ return LoadLibrary( "vulkan-1.dll" ); }}
+{IND}enum            default_lib = "vulkan-1.dll";
+{IND}auto loadLib( const( char )* lib_path )  {{ return LoadLibraryA( lib_path ); }}
 {IND}bool freeLib()  {{ return FreeLibrary( vulkan_lib ) != 0; }}
 {IND}auto loadSym()  {{ return cast( PFN_vkGetInstanceProcAddr )GetProcAddress( vulkan_lib, "vkGetInstanceProcAddr" ); }}
 {IND}void logLibError( FILE* log_stream, const( char )* message ) {{
-{IND}{IND}fprintf( log_stream, "%svulkan-1.dll! Error code: 0x%x\\n", message, GetLastError());
+{IND}{IND}fprintf( log_stream, "%s%s! Error code: 0x%x\\n", message, vulkan_lib_path, GetLastError());
 {IND}}}
 }}
 
@@ -33,11 +34,12 @@ else version( Android ) {{
 private:
 {IND}import core.sys.posix.dlfcn : dlerror, dlopen, dlclose, dlsym, RTLD_NOW, RTLD_LOCAL;
 {IND}void*           vulkan_lib  = null;
-{IND}auto loadLib()  {{ return dlopen( "libvulkan.so", RTLD_NOW | RTLD_LOCAL ); }}
+{IND}enum            default_lib = "libvulkan.so";
+{IND}auto loadLib( const( char )* lib_path )  {{ return dlopen( lib_path, RTLD_NOW | RTLD_LOCAL ); }}
 {IND}bool freeLib()  {{ return dlclose( vulkan_lib ) == 0; }}
 {IND}auto loadSym()  {{ return cast( PFN_vkGetInstanceProcAddr )dlsym( vulkan_lib, "vkGetInstanceProcAddr" ); }}
 {IND}void logLibError( FILE* log_stream, const( char )* message ) {{
-{IND}{IND}fprintf( log_stream, "%slibvulkan.so.1! Error: %s\\n", message, dlerror );
+{IND}{IND}fprintf( log_stream, "%s%s! Error: %s\\n", message, vulkan_lib_path, dlerror );
 {IND}}}
 }}
 
@@ -47,11 +49,12 @@ else version( OSX ) {{
 private:
 {IND}import core.sys.posix.dlfcn : dlerror, dlopen, dlclose, dlsym, RTLD_LAZY, RTLD_LOCAL;
 {IND}void*           vulkan_lib  = null;
-{IND}auto loadLib()  {{ return dlopen( "libvulkan.1.dylib", RTLD_LAZY | RTLD_LOCAL ); }}
+{IND}enum            default_lib = "libvulkan.1.dylib";
+{IND}auto loadLib( const( char )* lib_path )  {{ return dlopen( lib_path, RTLD_LAZY | RTLD_LOCAL ); }}
 {IND}bool freeLib()  {{ return dlclose( vulkan_lib ) == 0; }}
 {IND}auto loadSym()  {{ return cast( PFN_vkGetInstanceProcAddr )dlsym( vulkan_lib, "vkGetInstanceProcAddr" ); }}
 {IND}void logLibError( FILE* log_stream, const( char )* message ) {{
-{IND}{IND}fprintf( log_stream, "%slibvulkan.1.dylib! Error: %s\\n", message, dlerror );
+{IND}{IND}fprintf( log_stream, "%s%s! Error: %s\\n", message, vulkan_lib_path, dlerror );
 {IND}}}
 }}
 
@@ -61,15 +64,20 @@ else version( Posix ) {{
 private:
 {IND}import core.sys.posix.dlfcn : dlerror, dlopen, dlclose, dlsym, RTLD_LAZY, RTLD_LOCAL;
 {IND}void*           vulkan_lib  = null;
-{IND}auto loadLib()  {{ return dlopen( "libvulkan.so.1", RTLD_LAZY | RTLD_LOCAL ); }}
+{IND}enum            default_lib = "libvulkan.so.1";
+{IND}auto loadLib( const( char )* lib_path )  {{ return dlopen( lib_path, RTLD_LAZY | RTLD_LOCAL ); }}
 {IND}bool freeLib()  {{ return dlclose( vulkan_lib ) == 0; }}
 {IND}auto loadSym()  {{ return cast( PFN_vkGetInstanceProcAddr )dlsym( vulkan_lib, "vkGetInstanceProcAddr" ); }}
 {IND}void logLibError( FILE* log_stream, const( char )* message ) {{
-{IND}{IND}fprintf( log_stream, "%slibvulkan.so.1! Error: %s\\n", message, dlerror );
+{IND}{IND}fprintf( log_stream, "%s%s! Error: %s\\n", message, vulkan_lib_path, dlerror );
 {IND}}}
 }}
 
 
+/// path of the loaded or to be loaded vulkan lib, reported in error messages
+private const( char )* vulkan_lib_path = default_lib;
+
+
 /// tries to load the platform vulkan dynamic link library
 /// the library handle / pointer is stored privately in this module
 /// errors are reported to a specifiable stream which is standard error by default
@@ -77,7 +85,20 @@ private:
 ///     log_stream = file stream to receive error messages, default stderr
 /// Returns: true if the vulkan lib could be loaded, false otherwise
 bool loadVulkanLib( FILE* log_stream = stderr ) {{
-{IND}vulkan_lib = loadLib;
+{IND}return loadVulkanLib( default_lib, log_stream );
+}}
+
+
+/// tries to load a vulkan dynamic link library from a custom path instead of the platform vulkan lib,
+/// e.g. a specific driver or a stand-in implementation like the generated mock icd
+/// subsequent calls of loadGetInstanceProcAddr and loadGlobalLevelFunctions retrieve vkGetInstanceProcAddr from it
+/// Params:
+///     lib_path   = zero terminated path or file name of the library
+///     log_stream = file stream to receive error messages, default stderr
+/// Returns: true if the vulkan lib could be loaded, false otherwise
+bool loadVulkanLib( const( char )* lib_path, FILE* log_stream = stderr ) {{
+{IND}vulkan_lib_path = lib_path;
+{IND}vulkan_lib = loadLib( lib_path );
 {IND}if( !vulkan_lib ) {{
 {IND}{IND}logLibError( log_stream, "Could not load " );
 {IND}{IND}return false;